@@ -0,0 +1,140 @@
+"""
+ApplyPipeline - Runs the save/apply steps of FileManager off the UI thread
+"""
+from typing import Any, Dict, Optional
+
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+
+from file_manager import FileManager
+
+
+class ApplyCancelled(Exception):
+    """Raised inside a job when it was cancelled before committing."""
+
+
+class ApplyPipeline(QObject):
+    """
+    Applies flag data to the target file in a worker thread.
+    
+    Jobs run one at a time in submission order. Each stage is reported as it
+    starts; a job cancelled or failing before the replace leaves the previous
+    file untouched.
+    """
+    
+    STAGE_COMPARE = "Comparing with current file"
+    STAGE_BACKUP = "Backing up current file"
+    STAGE_WRITE = "Writing new settings"
+    STAGE_READONLY = "Setting read-only"
+    
+    # Emitted on the UI thread with (job_id, stage description)
+    stage = pyqtSignal(int, str)
+    
+    # Emitted on the UI thread with (job_id, success, error_message, changes).
+    # changes is a FlagChanges, or None when the file was already up to date.
+    finished = pyqtSignal(int, bool, str, object)
+    
+    # Internal hand-off from the worker thread: (job_id, success, message, changes)
+    _done = pyqtSignal(int, bool, str, object)
+    
+    def __init__(self, file_manager: FileManager, parent: Optional[QObject] = None):
+        """
+        Initialize ApplyPipeline.
+        
+        Args:
+            file_manager: File manager for the target file
+            parent: Owning QObject
+        """
+        super().__init__(parent)
+        self.file_manager = file_manager
+        
+        # Job ids below this were cancelled
+        self._next_id = 1
+        self._cancel_below = 0
+        self._pending = 0
+        
+        # A single worker serializes jobs
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        
+        self._done.connect(self._on_done)
+    
+    def submit(self, data: Dict[str, Any]) -> int:
+        """
+        Queue an apply of data to the target file.
+        
+        Args:
+            data: Validated flag dictionary
+        
+        Returns:
+            Job id reported by the stage and finished signals
+        """
+        job_id = self._next_id
+        self._next_id += 1
+        self._pending += 1
+        self._pool.start(lambda: self._run(job_id, data))
+        return job_id
+    
+    def cancel(self) -> None:
+        """Cancel every submitted job that has not yet replaced the file."""
+        self._cancel_below = self._next_id
+    
+    def is_busy(self) -> bool:
+        """Whether any job is queued or running."""
+        return self._pending > 0
+    
+    def wait(self, msecs: int = -1) -> bool:
+        """
+        Block until all jobs have finished.
+        
+        Args:
+            msecs: Maximum time to wait (-1: no limit)
+        
+        Returns:
+            True if all jobs finished in time
+        """
+        return self._pool.waitForDone(msecs)
+    
+    def _check(self, job_id: int) -> None:
+        """Raise ApplyCancelled if the job was cancelled."""
+        if job_id < self._cancel_below:
+            raise ApplyCancelled()
+    
+    def _run(self, job_id: int, data: Dict[str, Any]) -> None:
+        """Worker thread body."""
+        fm = self.file_manager
+        try:
+            self._check(job_id)
+            self.stage.emit(job_id, self.STAGE_COMPARE)
+            changes = fm.pending_changes(data)
+            if changes is None:
+                # Nothing to write, but the file may have been made writable
+                # since the last save; saving always leaves it read-only
+                self.stage.emit(job_id, self.STAGE_READONLY)
+                fm.set_readonly()
+                self._done.emit(job_id, True, "", None)
+                return
+            
+            self._check(job_id)
+            self.stage.emit(job_id, self.STAGE_BACKUP)
+            fm.backup_file()
+            
+            self._check(job_id)
+            self.stage.emit(job_id, self.STAGE_WRITE)
+            fm.atomic_write_json(data, before_replace=lambda: self._check(job_id))
+            
+            # The new file is in place; the rest is not cancellable
+            self.stage.emit(job_id, self.STAGE_READONLY)
+            fm.set_readonly()
+            self._done.emit(job_id, True, "", changes)
+        except ApplyCancelled:
+            self._done.emit(job_id, False, "Cancelled", None)
+        except Exception as e:
+            if isinstance(e.__cause__, ApplyCancelled):
+                self._done.emit(job_id, False, "Cancelled", None)
+            else:
+                self._done.emit(job_id, False, str(e), None)
+    
+    def _on_done(self, job_id: int, success: bool, message: str, changes: Any) -> None:
+        """Track completion on the UI thread and publish the result."""
+        self._pending -= 1
+        self.finished.emit(job_id, success, message, changes)
@@ -0,0 +1,75 @@
+"""
+BackupListModel - Pages backups from a BackupStore into a list view
+"""
+from typing import Any, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+from backup_store import BackupEntry, BackupStore
+
+
+class BackupListModel(QAbstractListModel):
+    """List model that reads backups from the store a page at a time."""
+    
+    PAGE_SIZE = 200
+    
+    def __init__(self, store: BackupStore, parent: Optional[QObject] = None):
+        """
+        Initialize BackupListModel.
+        
+        Args:
+            store: Backup store to list, newest first
+            parent: Owning QObject
+        """
+        super().__init__(parent)
+        self.store = store
+        self._total = store.count()
+        self._entries = []
+    
+    def total(self) -> int:
+        """Number of backups in the store when the model was created."""
+        return self._total
+    
+    def entry(self, row: int) -> BackupEntry:
+        """
+        Get the backup shown in a row.
+        
+        Args:
+            row: Row of a loaded backup
+        
+        Returns:
+            The backup
+        """
+        return self._entries[row]
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of backups loaded so far."""
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Display name of the backup in a row."""
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._entries[index.row()].name
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Whether backups remain to be loaded."""
+        if parent.isValid():
+            return False
+        return len(self._entries) < self._total
+    
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Load the next page of backups."""
+        if parent.isValid():
+            return
+        start = len(self._entries)
+        page = self.store.page(start, min(self.PAGE_SIZE, self._total - start))
+        if not page:
+            # Store shrank since the model was created
+            self._total = start
+            return
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self._entries.extend(page)
+        self.endInsertRows()
@@ -0,0 +1,368 @@
+"""
+BackupStore - Content-addressed, deduplicated storage for settings backups
+"""
+import gzip
+import hashlib
+import os
+import time
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import List, NamedTuple, Optional
+
+
+class BackupEntry(NamedTuple):
+    """One backup in the index."""
+    
+    created: float
+    blob: str
+    size: int
+    stored_size: int
+    
+    @property
+    def name(self) -> str:
+        """Display name for the backup."""
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.created))
+        return f"{stamp}  ({self.size / 1024:.1f} KB)"
+
+
+class BackupStore:
+    """
+    Stores backups as compressed blobs named by the hash of their content.
+    
+    Identical content is stored once however often it is backed up. An
+    append-only index of fixed-width records, oldest first, maps backup times
+    to blobs, so the backup count is a stat() and any page of backups is a
+    single seek and read.
+    """
+    
+    INDEX_NAME = "index.dat"
+    BLOB_DIR = "blobs"
+    BLOB_SUFFIX = ".json.gz"
+    
+    # created (seconds, 6 decimals), blob hash, size, stored size
+    RECORD_FORMAT = "{:017.6f} {:64s} {:012d} {:012d}\n"
+    RECORD_SIZE = 17 + 1 + 64 + 1 + 12 + 1 + 12 + 1
+    
+    def __init__(
+        self,
+        directory: Path,
+        keep_last: Optional[int] = 100,
+        max_age_days: Optional[float] = 180,
+        max_total_bytes: Optional[int] = 50_000_000
+    ):
+        """
+        Initialize BackupStore.
+        
+        Args:
+            directory: Folder holding the index and blobs
+            keep_last: Keep at most this many backups (None: unlimited)
+            max_age_days: Drop backups older than this (None: unlimited)
+            max_total_bytes: Cap on compressed blob bytes (None: unlimited)
+        """
+        self.directory = directory
+        self.keep_last = keep_last
+        self.max_age_days = max_age_days
+        self.max_total_bytes = max_total_bytes
+    
+    @property
+    def index_path(self) -> Path:
+        """Path of the index file."""
+        return self.directory / self.INDEX_NAME
+    
+    @property
+    def blob_dir(self) -> Path:
+        """Folder holding the blobs."""
+        return self.directory / self.BLOB_DIR
+    
+    def blob_path(self, blob: str) -> Path:
+        """Path of the blob with the given hash."""
+        return self.blob_dir / f"{blob}{self.BLOB_SUFFIX}"
+    
+    def count(self) -> int:
+        """
+        Get the number of backups without reading the index.
+        
+        Returns:
+            Number of backups
+        """
+        self._ensure_index()
+        try:
+            return self.index_path.stat().st_size // self.RECORD_SIZE
+        except FileNotFoundError:
+            return 0
+    
+    def page(self, start: int, count: int) -> List[BackupEntry]:
+        """
+        Read a range of backups, counting from the newest.
+        
+        Args:
+            start: Position of the first backup to return (0 is the newest)
+            count: Maximum number of backups to return
+        
+        Returns:
+            List of backups, newest first
+        """
+        total = self.count()
+        stop = min(total, start + count)
+        if start >= stop:
+            return []
+        
+        # Records are stored oldest first; newest-first row r is record total-1-r
+        with open(self.index_path, "rb") as f:
+            f.seek((total - stop) * self.RECORD_SIZE)
+            data = f.read((stop - start) * self.RECORD_SIZE)
+        
+        entries = [
+            self._unpack(data[i:i + self.RECORD_SIZE])
+            for i in range(0, len(data), self.RECORD_SIZE)
+        ]
+        entries.reverse()
+        return entries
+    
+    def entries(self) -> List[BackupEntry]:
+        """
+        Get all backups.
+        
+        Returns:
+            List of backups, newest first
+        """
+        return self.page(0, self.count())
+    
+    def add(self, content: bytes, created: Optional[float] = None) -> BackupEntry:
+        """
+        Back up content, writing its blob only if not already stored.
+        
+        If the newest backup already holds the same content it is returned
+        instead of adding a duplicate entry.
+        
+        Args:
+            content: File content to back up
+            created: Backup time as a Unix timestamp (default: now)
+        
+        Returns:
+            The backup entry holding the content
+        """
+        blob = hashlib.sha256(content).hexdigest()
+        newest = self.page(0, 1)
+        if newest and newest[0].blob == blob and created is None:
+            return newest[0]
+        
+        path = self.blob_path(blob)
+        new_blob = not path.exists()
+        if new_blob:
+            compressed = gzip.compress(content, compresslevel=6, mtime=0)
+            self._atomic_write(path, compressed)
+            stored_size = len(compressed)
+        else:
+            stored_size = path.stat().st_size
+        
+        entry = BackupEntry(
+            created=time.time() if created is None else created,
+            blob=blob,
+            size=len(content),
+            stored_size=stored_size
+        )
+        
+        if newest and entry.created < newest[0].created:
+            # Older than the newest backup (imported); keep the index sorted
+            entries = self.entries()
+            entries.append(entry)
+            entries.sort(key=lambda e: e.created)
+            self._write_index(entries)
+        else:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, "ab") as f:
+                f.write(self._pack(entry))
+                f.flush()
+                os.fsync(f.fileno())
+        
+        if self._retention_due(new_blob):
+            self.prune()
+        return entry
+    
+    def read(self, entry: BackupEntry) -> bytes:
+        """
+        Read the content of a backup.
+        
+        Args:
+            entry: Backup to read
+        
+        Returns:
+            Original file content
+        
+        Raises:
+            Exception: If the blob is missing or corrupt
+        """
+        try:
+            content = gzip.decompress(self.blob_path(entry.blob).read_bytes())
+        except FileNotFoundError:
+            raise Exception("Backup data not found")
+        if hashlib.sha256(content).hexdigest() != entry.blob:
+            raise Exception("Backup data is corrupt")
+        return content
+    
+    def prune(self) -> None:
+        """Apply the retention policies and delete unreferenced blobs."""
+        entries = self.entries()
+        kept = self._apply_retention(entries)
+        if len(kept) != len(entries):
+            self._write_index(kept[::-1])
+    
+    def rebuild(self) -> None:
+        """
+        Rebuild the index from its readable records and the stored blobs.
+        
+        Torn records are dropped, records whose blob is gone are removed,
+        and blobs missing from the index are added with their file time.
+        """
+        records = {}
+        try:
+            data = self.index_path.read_bytes()
+        except FileNotFoundError:
+            data = b""
+        for i in range(0, len(data) - self.RECORD_SIZE + 1, self.RECORD_SIZE):
+            try:
+                entry = self._unpack(data[i:i + self.RECORD_SIZE])
+            except ValueError:
+                continue
+            records[(entry.created, entry.blob)] = entry
+        
+        blobs = {}
+        if self.blob_dir.exists():
+            for path in self.blob_dir.glob(f"*{self.BLOB_SUFFIX}"):
+                blobs[path.name[:-len(self.BLOB_SUFFIX)]] = path
+        
+        entries = [entry for entry in records.values() if entry.blob in blobs]
+        indexed = {entry.blob for entry in entries}
+        for blob, path in blobs.items():
+            if blob in indexed:
+                continue
+            try:
+                stored = path.read_bytes()
+                size = len(gzip.decompress(stored))
+            except Exception:
+                continue
+            entries.append(BackupEntry(path.stat().st_mtime, blob, size, len(stored)))
+        
+        entries.sort(key=lambda entry: entry.created)
+        self._write_index(entries)
+    
+    def _ensure_index(self) -> None:
+        """Rebuild the index if it is torn, missing or older than the blobs."""
+        try:
+            index_stat = self.index_path.stat()
+        except FileNotFoundError:
+            index_stat = None
+        
+        try:
+            blob_mtime = self.blob_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            blob_mtime = None
+        
+        if index_stat is None:
+            stale = blob_mtime is not None
+        else:
+            # A blob written after the last index update was never indexed
+            stale = (
+                index_stat.st_size % self.RECORD_SIZE != 0
+                or (blob_mtime is not None and blob_mtime > index_stat.st_mtime_ns)
+            )
+        
+        if stale:
+            self.rebuild()
+    
+    def _retention_due(self, new_blob: bool) -> bool:
+        """Cheaply check whether a retention policy may drop a backup."""
+        count = self.count()
+        if self.keep_last is not None and count > max(1, self.keep_last):
+            return True
+        if self.max_age_days is not None and count > 1:
+            oldest = self.page(count - 1, 1)[0]
+            if oldest.created < time.time() - self.max_age_days * 86400:
+                return True
+        if self.max_total_bytes is not None and new_blob:
+            total = sum(entry.stat().st_size for entry in os.scandir(self.blob_dir))
+            return total > self.max_total_bytes
+        return False
+    
+    def _apply_retention(self, entries: List[BackupEntry]) -> List[BackupEntry]:
+        """Drop backups outside the retention policies. The newest is always kept."""
+        if not entries:
+            return entries
+        
+        kept = entries
+        if self.keep_last is not None:
+            kept = kept[:max(1, self.keep_last)]
+        
+        if self.max_age_days is not None:
+            cutoff = time.time() - self.max_age_days * 86400
+            kept = kept[:1] + [e for e in kept[1:] if e.created >= cutoff]
+        
+        if self.max_total_bytes is not None:
+            # Count each blob once, keeping the newest backups that fit
+            seen = set()
+            total = 0
+            within = []
+            for entry in kept:
+                if entry.blob not in seen:
+                    seen.add(entry.blob)
+                    total += entry.stored_size
+                if within and total > self.max_total_bytes:
+                    break
+                within.append(entry)
+            kept = within
+        
+        return kept
+    
+    def _write_index(self, entries: List[BackupEntry]) -> None:
+        """
+        Replace the index and delete blobs it no longer references.
+        
+        Args:
+            entries: Backups to keep, oldest first
+        """
+        data = b"".join(self._pack(entry) for entry in entries)
+        self._atomic_write(self.index_path, data)
+        
+        referenced = {entry.blob for entry in entries}
+        if self.blob_dir.exists():
+            removed = False
+            for path in self.blob_dir.glob(f"*{self.BLOB_SUFFIX}"):
+                if path.name[:-len(self.BLOB_SUFFIX)] not in referenced:
+                    try:
+                        path.unlink()
+                        removed = True
+                    except OSError:
+                        pass
+            if removed:
+                # Deleting blobs touches the folder; keep the index newer
+                os.utime(self.index_path)
+    
+    def _pack(self, entry: BackupEntry) -> bytes:
+        """Encode a backup as a fixed-width index record."""
+        return self.RECORD_FORMAT.format(
+            entry.created, entry.blob, entry.size, entry.stored_size
+        ).encode("ascii")
+    
+    def _unpack(self, record: bytes) -> BackupEntry:
+        """
+        Decode a fixed-width index record.
+        
+        Raises:
+            ValueError: If the record is malformed
+        """
+        created, blob, size, stored_size = record.decode("ascii").split()
+        if len(blob) != 64:
+            raise ValueError(f"Malformed backup record: {record!r}")
+        return BackupEntry(float(created), blob, int(size), int(stored_size))
+    
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """Write bytes to path via a temporary file and replace."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=str(path.parent), delete=False, suffix=".tmp") as tf:
+            tf.write(data)
+            tf.flush()
+            os.fsync(tf.fileno())
+            tmpname = Path(tf.name)
+        tmpname.replace(path)
@@ -0,0 +1,94 @@
+"""
+Codec Benchmark
+Compares the installed JSON backends on parse and canonical serialization
+of flag documents, and checks that every backend's output is byte-identical
+to the stdlib's.
+
+Run with: python benchmarks/bench_codec.py
+"""
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from json_codec import JsonCodec, available_backends
+
+
+PREFIXES = ["FFlag", "DFFlag", "FInt", "DFInt", "FString", "DFString", "FLog", "DFLog"]
+REPEATS = 7
+
+
+def build_flags(count: int) -> dict:
+    """Build a flag set mixing string, integer and boolean values."""
+    rng = random.Random(count)
+    flags = {}
+    for i in range(count):
+        prefix = rng.choice(PREFIXES)
+        if prefix.endswith("Flag"):
+            value = rng.choice(["True", "False", True, False])
+        elif prefix.endswith("String"):
+            value = rng.choice(["value", "wert-ä", "path/to \"x\"", "日本語"])
+        else:
+            value = rng.choice([str(rng.randint(-5, 100000)), rng.randint(0, 100000)])
+        flags[f"{prefix}Bench{i}Setting"] = value
+    return flags
+
+
+def best_of(func) -> float:
+    """Best wall time in ms over REPEATS runs."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def same_wide_integers(codec: JsonCodec) -> bool:
+    """Whether integers beyond 64 bits survive a round trip unchanged."""
+    text = '{"DFIntBig": 123456789012345678901234567890, "DFIntLow": -9223372036854775809}'
+    parsed = codec.loads(text)
+    return (
+        parsed == json.loads(text)
+        and all(type(value) is int for value in parsed.values())
+        and codec.dumps_canonical(parsed) == json.dumps(parsed, indent=2)
+    )
+
+
+def main():
+    """Run the benchmark for every installed backend."""
+    backends = available_backends()
+    reference = JsonCodec("json")
+    
+    print("=" * 60)
+    print(f"JSON codec backends: {', '.join(backends)}")
+    print("=" * 60)
+    print(f"{'backend':>8} {'flags':>8} {'loads ms':>10} {'dumps ms':>10} {'identical':>10}")
+    
+    all_identical = True
+    for count in (1_000, 10_000, 100_000):
+        data = build_flags(count)
+        canonical = reference.dumps_canonical(data).encode("utf-8")
+        
+        for name in backends:
+            codec = JsonCodec(name)
+            text = codec.dumps_canonical(data)
+            identical = (
+                text.encode("utf-8") == canonical
+                and codec.loads(text) == data
+                and same_wide_integers(codec)
+            )
+            all_identical = all_identical and identical
+            
+            loads = best_of(lambda: codec.loads(text))
+            dumps = best_of(lambda: codec.dumps_canonical(data))
+            print(f"{name:>8} {count:>8} {loads:>10.2f} {dumps:>10.2f} {'yes' if identical else 'NO':>10}")
+    
+    return 0 if all_identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Conflict Detection Benchmark
+Compares plain json.loads against the duplicate-key and case-variant
+checks ParseCache runs on every new document:
+
+- hooked: the stdlib parse with the duplicate-detecting object_pairs_hook,
+  used when a document cannot be proven free of duplicates
+- proven: the fastest backend's parse plus the colon count that proves a
+  flat document has no duplicates, the usual path
+- +case: the proven path plus the case-variant check
+
+Run with: python benchmarks/bench_conflicts.py
+"""
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from json_codec import default_codec
+from json_validator import _make_pairs_hook, _surely_unique_keys, find_case_collisions
+
+
+PREFIXES = ["FFlag", "DFFlag", "FInt", "DFInt", "FString", "DFString", "FLog", "DFLog"]
+REPEATS = 7
+
+
+def build_text(count: int) -> str:
+    """Build canonical JSON text holding count flags with string values."""
+    rng = random.Random(count)
+    flags = {}
+    for i in range(count):
+        prefix = rng.choice(PREFIXES)
+        if prefix.endswith("Flag"):
+            value = rng.choice(["True", "False"])
+        elif prefix.endswith("String"):
+            value = rng.choice([f"value-{i}", f"https://example.com/{i}"])
+        else:
+            value = str(rng.randint(0, 100000))
+        flags[f"{prefix}Bench{i}Setting"] = value
+    return json.dumps(flags, indent=2)
+
+
+def best_of(func) -> float:
+    """Best wall time in ms over REPEATS runs."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def hooked(text: str) -> dict:
+    """Parse with the duplicate-detecting hook."""
+    return json.loads(text, object_pairs_hook=_make_pairs_hook([]))
+
+
+def proven(text: str) -> dict:
+    """Parse with the fastest backend and prove the keys unique."""
+    data = default_codec.loads(text)
+    assert _surely_unique_keys(text, data)
+    return data
+
+
+def main():
+    """Run the benchmark across flag counts."""
+    print("=" * 72)
+    print(f"Duplicate and case-variant detection vs json.loads ({default_codec.name} backend)")
+    print("=" * 72)
+    print(f"{'keys':>8} {'loads ms':>9} {'hooked':>14} {'proven':>14} {'+case':>14}")
+    
+    for count in (1_000, 10_000, 100_000):
+        text = build_text(count)
+        base = best_of(lambda: json.loads(text))
+        timings = [
+            best_of(lambda: hooked(text)),
+            best_of(lambda: proven(text)),
+            best_of(lambda: find_case_collisions(proven(text))),
+        ]
+        cells = " ".join(f"{ms:>6.2f} {(ms / base - 1) * 100:>+6.0f}%" for ms in timings)
+        print(f"{count:>8} {base:>9.2f} {cells}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
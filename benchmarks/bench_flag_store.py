@@ -0,0 +1,134 @@
+"""
+FlagStore Benchmark
+Compares the memory a parsed flag set holds as a plain dict against the
+same flags in a FlagStore, and times building, lookup, prefix iteration
+and canonical serialization for both.
+
+Two value mixes are measured: native JSON types, and the all-string
+values ("True", "100") most real ClientAppSettings files use.
+
+Run with: python benchmarks/bench_flag_store.py
+"""
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flag_store import FlagPrefix, FlagStore
+from json_codec import default_codec
+
+
+PREFIXES = ["FFlag", "DFFlag", "FInt", "DFInt", "FString", "DFString", "FLog", "DFLog"]
+
+
+def build_document(count: int, native: bool) -> str:
+    """Build canonical JSON text holding count flags."""
+    rng = random.Random(count)
+    flags = {}
+    for i in range(count):
+        prefix = PREFIXES[i % len(PREFIXES)]
+        key = f"{prefix}Bench{i}Setting{rng.randint(0, 999)}"
+        kind = i % len(PREFIXES) // 2
+        values = [
+            rng.random() < 0.5,
+            rng.randint(0, 100000),
+            f"value{rng.randint(0, 50)}",
+            rng.randint(0, 6)
+        ]
+        value = values[kind]
+        if not native:
+            value = ("True" if value else "False") if kind == 0 else str(value)
+        flags[key] = value
+    return json.dumps(flags, indent=2, ensure_ascii=False)
+
+
+def traced_bytes(text: str, as_store: bool) -> int:
+    """Bytes still allocated once text is parsed (and stored, if as_store)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        data = json.loads(text)
+        if as_store:
+            data = FlagStore(data)
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def best_ms(action, rounds: int = 5) -> float:
+    """Fastest of several runs, in ms."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    """Run the benchmark across flag counts and value mixes."""
+    print("=" * 72)
+    print("FlagStore memory footprint")
+    print("=" * 72)
+    print(f"{'flags':>8} {'values':>8} {'dict MB':>10} {'store MB':>10} {'ratio':>7}")
+    
+    for count in (10_000, 100_000):
+        for native in (True, False):
+            text = build_document(count, native)
+            dict_bytes = traced_bytes(text, as_store=False)
+            store_bytes = traced_bytes(text, as_store=True)
+            label = "native" if native else "strings"
+            print(f"{count:>8} {label:>8} {dict_bytes / 1e6:>10.2f} {store_bytes / 1e6:>10.2f} "
+                  f"{store_bytes / dict_bytes:>7.2f}")
+    
+    print()
+    print("=" * 72)
+    print("FlagStore timings at 100k flags, native values (ms)")
+    print("=" * 72)
+    flags = json.loads(build_document(100_000, native=True))
+    store = FlagStore(flags)
+    keys = list(flags)
+    
+    canonical = default_codec.dumps_canonical(flags)
+    assert store.dumps_canonical() == canonical
+    assert json.dumps(flags, indent=2, ensure_ascii=False) == canonical
+    
+    print(f"{'operation':<28} {'dict':>10} {'store':>10}")
+    rows = [
+        ("build from parsed dict", lambda: dict(flags), lambda: FlagStore(flags)),
+        ("look up every key", lambda: [flags[key] for key in keys], lambda: [store[key] for key in keys]),
+        (
+            "iterate DFInt flags",
+            lambda: [(k, v) for k, v in flags.items() if k.startswith("DFInt")],
+            lambda: list(store.prefix_items(FlagPrefix.DFINT))
+        ),
+        (
+            "names containing 'int'",
+            lambda: [row for row, key in enumerate(keys) if "int" in key.lower()],
+            lambda: store.find_rows("int")
+        ),
+        (
+            f"canonical JSON ({default_codec.name})",
+            lambda: default_codec.dumps_canonical(flags),
+            lambda: store.dumps_canonical()
+        ),
+        (
+            "canonical JSON (json)",
+            lambda: json.dumps(flags, indent=2, ensure_ascii=False),
+            lambda: store.dumps_canonical()
+        ),
+    ]
+    for label, dict_action, store_action in rows:
+        print(f"{label:<28} {best_ms(dict_action):>10.2f} {best_ms(store_action):>10.2f}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Flag Table Benchmark
+Times the table model and filter proxy on large flag sets: loading, a
+single-value refresh, filtering, sorting, and writing an edit back into the
+editor document.
+
+Run with: python benchmarks/bench_flag_table.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QTextDocument
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from flag_table_model import FlagFilterProxy, FlagTableModel, write_value
+from json_codec import default_codec
+
+
+PREFIXES = ["FFlag", "FInt", "FString", "DFInt"]
+
+
+def build_flags(count: int) -> dict:
+    """Build count flags cycling through bool, int and string values."""
+    flags = {}
+    for i in range(count):
+        kind = i % len(PREFIXES)
+        flags[f"{PREFIXES[kind]}Bench{i}"] = [i % 2 == 0, i, f"value{i}", str(i)][kind]
+    return flags
+
+
+def timed(app: QApplication, action) -> float:
+    """Ms to run action and process the resulting events."""
+    start = time.perf_counter()
+    action()
+    app.processEvents()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    """Run the benchmark across flag counts."""
+    app = QApplication(sys.argv)
+    
+    print("=" * 72)
+    print("Flag table model/proxy timings (ms)")
+    print("=" * 72)
+    print(f"{'flags':>8} {'load':>8} {'refresh':>8} {'filter':>8} {'sort':>8} "
+          f"{'write':>8} {'no hint':>8}")
+    
+    for count in (1_000, 10_000, 100_000):
+        flags = build_flags(count)
+        model = FlagTableModel()
+        proxy = FlagFilterProxy()
+        proxy.setSourceModel(model)
+        view = QTableView()
+        view.setModel(proxy)
+        view.resize(800, 600)
+        view.show()
+        app.processEvents()
+        
+        load_ms = timed(app, lambda: model.set_flags(flags))
+        
+        changed = dict(flags)
+        target = f"FIntBench{count - 3}"
+        changed[target] = -1
+        refresh_ms = timed(app, lambda: model.set_flags(changed))
+        
+        filter_ms = timed(app, lambda: proxy.set_filter_text("int"))
+        sort_ms = timed(app, lambda: proxy.sort(0, Qt.SortOrder.DescendingOrder))
+        proxy.set_filter_text("")
+        proxy.sort(-1)
+        
+        document = QTextDocument()
+        document.setPlainText(default_codec.dumps_canonical(changed))
+        row = model.row_of(target)
+        write_ms = timed(app, lambda: write_value(document, target, -1, 7, row + 1))
+        no_hint_ms = timed(app, lambda: write_value(document, target, 7, 8))
+        
+        print(f"{count:>8} {load_ms:>8.2f} {refresh_ms:>8.2f} {filter_ms:>8.2f} "
+              f"{sort_ms:>8.2f} {write_ms:>8.2f} {no_hint_ms:>8.2f}")
+        view.close()
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
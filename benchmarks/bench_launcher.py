@@ -0,0 +1,82 @@
+"""
+Launcher Benchmark
+Builds a fake LOCALAPPDATA/Roblox/Versions tree whose player is the dummy
+client, launches several instances with different flag profiles through
+LaunchScheduler, and checks that each instance saw its own profile.
+
+Run with: python benchmarks/bench_launcher.py
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from file_manager import FileManager
+from launch_scheduler import InstanceSpec, LaunchScheduler
+
+
+DUMMY = Path(__file__).resolve().parent / "dummy_client.py"
+
+
+def build_fake_install(root: Path) -> Path:
+    """Create Roblox/Versions/version-fake with the Python interpreter as the player."""
+    version = root / "Roblox" / "Versions" / "version-fake"
+    version.mkdir(parents=True)
+    player = version / "RobloxPlayerBeta.exe"
+    if os.name == "nt":
+        # The interpreter needs its DLLs next to it
+        python_dir = Path(sys.executable).parent
+        shutil.copy2(sys.executable, player)
+        for dll in python_dir.glob("*.dll"):
+            shutil.copy2(dll, version)
+    else:
+        player.symlink_to(sys.executable)
+    (root / "Roblox" / "ClientSettings").mkdir(parents=True)
+    return root / "Roblox" / "ClientSettings" / "IxpSettings.json"
+
+
+def main():
+    """Run the benchmark."""
+    root = Path(tempfile.mkdtemp())
+    os.environ["LOCALAPPDATA"] = str(root)
+    target = build_fake_install(root)
+    target.write_text('{"FFlagOriginal": true}', encoding="utf-8")
+    
+    specs = [
+        InstanceSpec(f"inst{i}", place_id=1000 + i, flags={"DFIntTaskSchedulerTargetFps": fps})
+        for i, fps in enumerate([60, 60, 144, 240, 60])
+    ]
+    scheduler = LaunchScheduler(
+        FileManager(target),
+        max_concurrent=3,
+        stagger=0.1,
+        ready_rss_bytes=40 * 1024 * 1024,
+        player_args=[str(DUMMY), "--seconds", "1", "--children", "0", "--mb", "60",
+                     "--startup", "0.3", "--record-settings"]
+    )
+    
+    start = time.perf_counter()
+    results = scheduler.run(specs)
+    total = time.perf_counter() - start
+    
+    ok = target.read_text(encoding="utf-8") == '{"FFlagOriginal": true}'
+    print(f"{'name':<7} {'status':<8} {'spawn ms':>9} {'ready ms':>9} {'exit':>5}  profile seen")
+    for spec, result in zip(specs, results):
+        seen_file = Path(f"{target}.{result.pid}")
+        seen = json.loads(seen_file.read_text()) if seen_file.exists() else None
+        ok = ok and seen == spec.flags and result.exit_code == 0
+        print(
+            f"{result.name:<7} {result.status:<8} {result.spawn_ms or 0:>9.1f} "
+            f"{result.ready_ms or 0:>9.1f} {result.exit_code!s:>5}  {seen}"
+        )
+    print(f"Total {total:.2f} s; settings restored and profiles matched: {ok}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Schema Benchmark
+Compares plain json.loads against json.loads plus the FlagSchema type check,
+and shows the cost of re-checking an already checked document.
+
+Run with: python benchmarks/bench_schema.py
+"""
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flag_schema import FlagSchema
+
+
+PREFIXES = ["FFlag", "DFFlag", "FInt", "DFInt", "FString", "DFString", "FLog", "DFLog"]
+REPEATS = 7
+
+
+def build_flags(count: int) -> dict:
+    """Build a flag set with correctly typed values for every prefix."""
+    rng = random.Random(count)
+    flags = {}
+    for i in range(count):
+        prefix = rng.choice(PREFIXES)
+        if prefix.endswith("Flag"):
+            value = rng.choice(["True", "False"])
+        elif prefix.endswith("String"):
+            value = f"value-{rng.randint(0, 1000)}"
+        else:
+            value = str(rng.randint(0, 100000))
+        flags[f"{prefix}Bench{i}Setting"] = value
+    return flags
+
+
+def best_of(func) -> float:
+    """Best wall time in ms over REPEATS runs."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """Run the benchmark across flag counts."""
+    print("=" * 60)
+    print("FlagSchema overhead vs json.loads")
+    print("=" * 60)
+    print(f"{'flags':>8} {'loads ms':>10} {'checked ms':>11} {'overhead':>9} {'repeat ms':>10}")
+    
+    for count in (1_000, 10_000, 100_000):
+        text = json.dumps(build_flags(count), indent=2)
+        base = best_of(lambda: json.loads(text))
+        
+        # One parse plus one schema pass over a new document
+        schema = FlagSchema()
+        checked = best_of(lambda: schema.check(json.loads(text)))
+        
+        # Re-validating the same parsed document, as validate/save/launch do
+        data = json.loads(text)
+        schema.check(data)
+        repeat = best_of(lambda: schema.check(data))
+        
+        print(
+            f"{count:>8} {base:>10.2f} {checked:>11.2f} "
+            f"{(checked / base - 1) * 100:>8.1f}% {repeat:>10.4f}"
+        )
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Search Benchmark
+Measures keystroke-to-matches latency of SearchEngine against the old
+lower()-per-match scan as the FFlag document grows, and the cost of the
+viewport highlight that follows each keystroke in the editor.
+
+The highlight column needs PyQt6 (an offscreen QPlainTextEdit); it reads
+"n/a" without it.
+
+Run with: python benchmarks/bench_search.py
+"""
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtCore import QPoint
+    from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor
+    from PyQt6.QtWidgets import QApplication, QPlainTextEdit, QTextEdit
+except ImportError:
+    QApplication = None
+
+from search_engine import SearchEngine
+
+
+PREFIXES = ["FFlag", "DFFlag", "FInt", "DFInt", "FString", "DFString", "FLog", "DFLog"]
+NEEDLE = "Int"
+KEYSTROKES = 50
+LEGACY_LIMIT = 1_000_000  # Old scan is quadratic; skip it beyond this size
+HIGHLIGHT_MARGIN_LINES = 40  # As MainWindow.HIGHLIGHT_MARGIN_LINES
+
+
+def build_document(target_size: int) -> str:
+    """Build a formatted flag document of roughly target_size characters."""
+    rng = random.Random(target_size)
+    lines = []
+    size = 2
+    i = 0
+    while size < target_size:
+        line = f'  "{rng.choice(PREFIXES)}Bench{i}Setting": "{rng.randint(0, 100000)}"'
+        lines.append(line)
+        size += len(line) + 2
+        i += 1
+    return "{\n" + ",\n".join(lines) + "\n}"
+
+
+def legacy_find(content: str, search_text: str) -> list:
+    """The original highlight_all_matches scan."""
+    matches = []
+    search_lower = search_text.lower()
+    start = 0
+    while True:
+        index = content.lower().find(search_lower, start)
+        if index == -1:
+            break
+        matches.append(index)
+        start = index + 1
+    return matches
+
+
+def median_ms(timings: list) -> float:
+    """Median of timings in seconds, as ms."""
+    timings.sort()
+    return timings[len(timings) // 2] * 1000
+
+
+def bench_engine(text: str) -> float:
+    """Median ms for one editor keystroke followed by a match count."""
+    engine = SearchEngine(text)
+    engine.find(NEEDLE)
+    rng = random.Random(len(text))
+    timings = []
+    length = len(text)
+    for _ in range(KEYSTROKES):
+        pos = rng.randint(0, length)
+        start = time.perf_counter()
+        engine.apply_change(pos, 0, "x")
+        engine.find(NEEDLE)
+        timings.append(time.perf_counter() - start)
+        length += 1
+    return median_ms(timings)
+
+
+def highlight_visible(editor, engine: SearchEngine, highlight: "QTextCharFormat") -> int:
+    """MainWindow.update_visible_highlights: select matches near the viewport."""
+    viewport = editor.viewport()
+    first = editor.cursorForPosition(QPoint(0, 0)).block()
+    last = editor.cursorForPosition(QPoint(viewport.width(), viewport.height())).block()
+    for _ in range(HIGHLIGHT_MARGIN_LINES):
+        if first.previous().isValid():
+            first = first.previous()
+        if last.next().isValid():
+            last = last.next()
+    
+    document = editor.document()
+    selections = []
+    for match_pos in engine.matches_between(first.position(), last.position() + last.length()):
+        cursor = QTextCursor(document)
+        cursor.setPosition(match_pos)
+        cursor.setPosition(match_pos + len(NEEDLE), QTextCursor.MoveMode.KeepAnchor)
+        selection = QTextEdit.ExtraSelection()
+        selection.cursor = cursor
+        selection.format = highlight
+        selections.append(selection)
+    editor.setExtraSelections(selections)
+    return len(selections)
+
+
+def bench_highlight(app, text: str) -> float:
+    """Median ms to rehighlight the viewport after a keystroke."""
+    editor = QPlainTextEdit()
+    editor.resize(800, 600)
+    editor.setPlainText(text)
+    editor.show()
+    app.processEvents()
+    
+    highlight = QTextCharFormat()
+    highlight.setBackground(QColor("#00d9ff"))
+    engine = SearchEngine(text)
+    engine.find(NEEDLE)
+    rng = random.Random(len(text))
+    timings = []
+    for _ in range(KEYSTROKES):
+        pos = rng.randint(0, len(engine))
+        cursor = QTextCursor(editor.document())
+        cursor.setPosition(pos)
+        cursor.insertText("x")
+        engine.apply_change(pos, 0, "x")
+        editor.setTextCursor(cursor)
+        editor.ensureCursorVisible()
+        app.processEvents()
+        
+        start = time.perf_counter()
+        highlight_visible(editor, engine, highlight)
+        timings.append(time.perf_counter() - start)
+    editor.close()
+    return median_ms(timings)
+
+
+def bench_legacy(text: str) -> float:
+    """Ms for one full legacy scan."""
+    start = time.perf_counter()
+    legacy_find(text, NEEDLE)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    """Run the benchmark across document sizes."""
+    app = QApplication(sys.argv) if QApplication is not None else None
+    
+    print("=" * 72)
+    print("SearchEngine keystroke latency")
+    print("=" * 72)
+    print(f"{'size':>10} {'matches':>9} {'engine ms':>11} {'highlight ms':>13} {'legacy ms':>11}")
+    
+    for size in (100_000, 500_000, 1_000_000, 2_000_000, 4_000_000, 8_000_000):
+        text = build_document(size)
+        matches = SearchEngine(text).find(NEEDLE)
+        engine_ms = bench_engine(text)
+        highlight = f"{bench_highlight(app, text):.3f}" if app is not None else "n/a"
+        legacy = f"{bench_legacy(text):.2f}" if size <= LEGACY_LIMIT else "skipped"
+        print(f"{len(text):>10} {matches:>9} {engine_ms:>11.3f} {highlight:>13} {legacy:>11}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Telemetry Benchmark
+Launches the dummy client, samples its process tree until it exits, and
+prints the summary and the cost of one sample.
+
+Run with: python benchmarks/bench_telemetry.py
+"""
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from telemetry import TelemetrySampler
+
+
+DUMMY = Path(__file__).resolve().parent / "dummy_client.py"
+
+
+def main():
+    """Run the benchmark."""
+    proc = subprocess.Popen([
+        sys.executable, str(DUMMY), "--seconds", "3", "--children", "2", "--exit-code", "3"
+    ])
+    
+    done = threading.Event()
+    summaries = []
+    
+    def on_exit(summary):
+        summaries.append(summary)
+        done.set()
+    
+    sampler = TelemetrySampler(proc, interval=0.2, capacity=10, on_exit=on_exit)
+    sampler.start()
+    
+    # Time samples with a second sampler while the tree is alive
+    time.sleep(0.5)
+    probe = TelemetrySampler(proc.pid)
+    start = time.perf_counter()
+    for _ in range(20):
+        probe.sample()
+    cost_ms = (time.perf_counter() - start) * 1000 / 20
+    
+    if not done.wait(30):
+        print("Client did not exit")
+        sys.exit(1)
+    
+    summary = summaries[0]
+    print(f"Sample cost: {cost_ms:.2f} ms")
+    for key, value in summary.items():
+        print(f"  {key:14} {value}")
+    
+    out = Path(tempfile.mkdtemp())
+    sampler.export_csv(out / "telemetry.csv")
+    sampler.export_json(out / "telemetry.json")
+    rows = (out / "telemetry.csv").read_text().count("\n") - 1
+    print(f"Exported {rows} samples to {out}")
+    
+    # Dummy plus two children, and its exit code carried through
+    ok = summary["exit_code"] == 3 and summary.get("processes_max", 0) == 3
+    print("OK" if ok else "MISMATCH")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
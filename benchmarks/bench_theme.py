@@ -0,0 +1,208 @@
+"""
+Theme Benchmark
+Times main window and dialog construction (build, show, first polish) with
+the single application stylesheet against per-widget setStyleSheet calls,
+and the cost of restyling the validation label.
+
+The per-widget sheets are the rules theme.py holds for each widget,
+rewritten to the plain type selectors main.py used to pass to each
+widget's setStyleSheet.
+
+Run with: python benchmarks/bench_theme.py
+"""
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+import theme
+
+
+ROUNDS = 15
+RESTYLES = 2000
+
+
+def parse_rules(sheet: str):
+    """Split QSS into (selector, body) pairs, one per comma-separated selector."""
+    rules = []
+    for selectors, body in re.findall(r"([^{}]+)\{([^{}]*)\}", sheet):
+        for selector in selectors.split(","):
+            rules.append((selector.strip(), body))
+    return rules
+
+
+RULES = parse_rules(theme.stylesheet())
+
+# Rules the main window used to set on itself, without names or properties
+WINDOW_SHEET = "".join(
+    f"{selector}{{{body}}}" for selector, body in RULES
+    if "#" not in selector and "[" not in selector and not selector.startswith("QDialog ")
+)
+
+
+def widget_sheet(widget: QWidget, state: str = "") -> str:
+    """Rebuild the sheet main.py used to set on one widget."""
+    name = widget.objectName()
+    variant = widget.property(theme.VARIANT_PROPERTY)
+    variant_attr = f'[variant="{variant}"]'
+    parts = []
+    for selector, body in RULES:
+        scope, _, last = selector.rpartition(" ")
+        if name and f"#{name}" in last and not scope:
+            last = last.replace(f"#{name}", "")
+            if "[state=" in last:
+                if f'[state="{state}"]' not in last:
+                    continue
+                last = re.sub(r"\[state=[^\]]*\]", "", last)
+            parts.append(f"{last}{{{body}}}")
+        elif variant and variant_attr in last:
+            parts.append(f"{last.replace(variant_attr, '')}{{{body}}}")
+    return "".join(parts)
+
+
+def top_level_sheet(top: QWidget) -> str:
+    """Rebuild the sheet main.py used to set on a window or dialog."""
+    prefix = f"{type(top).__mro__[1].__name__}#{top.objectName()} "
+    scoped = "".join(
+        f"{selector[len(prefix):]}{{{body}}}" for selector, body in RULES
+        if selector.startswith(prefix)
+    )
+    return WINDOW_SHEET + scoped
+
+
+def style_per_widget(top: QWidget) -> None:
+    """Style a widget tree the old way: one setStyleSheet per widget."""
+    top.setStyleSheet(top_level_sheet(top))
+    for widget in top.findChildren(QWidget):
+        sheet = widget_sheet(widget)
+        if sheet:
+            widget.setStyleSheet(sheet)
+
+
+def timed(app: QApplication, build, per_widget: bool) -> float:
+    """Build, style, show and polish a top-level widget; return ms."""
+    start = time.perf_counter()
+    top = build()
+    if per_widget:
+        style_per_widget(top)
+    top.show()
+    app.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+    top.hide()
+    cleanup = getattr(top, "bench_cleanup", None)
+    if cleanup:
+        cleanup()
+    top.deleteLater()
+    app.processEvents()
+    return elapsed
+
+
+def main():
+    """Run the benchmark."""
+    app = QApplication(sys.argv)
+    
+    # A throwaway profile so the window finds a settings file
+    folder = Path(tempfile.mkdtemp())
+    os.environ["LOCALAPPDATA"] = str(folder)
+    settings = folder / "Roblox" / "ClientSettings" / "IxpSettings.json"
+    settings.parent.mkdir(parents=True)
+    settings.write_text('{"FFlagBench": true}', encoding="utf-8")
+    
+    import main as novastrap
+    
+    class BenchWindow(novastrap.MainWindow):
+        def show_disclaimer(self):
+            return True
+        
+        def showEvent(self, event):
+            # Measure construction and first polish only
+            self.startup_pending = False
+            super().showEvent(event)
+        
+        def bench_cleanup(self):
+            self.logger.shutdown()
+    
+    window = BenchWindow()
+    store = window.file_manager.backup_store
+    window.bench_cleanup()
+    window.deleteLater()
+    app.processEvents()
+    
+    builders = {
+        "main window": BenchWindow,
+        "disclaimer dialog": novastrap.DisclaimerDialog,
+        "backup dialog": lambda: novastrap.BackupDialog(store),
+    }
+    
+    # Per-widget sheets are parsed on every construction; the application
+    # sheet is set once, as main() does, and parsed on first use
+    results = {}
+    for per_widget in (True, False):
+        app.setStyleSheet("" if per_widget else theme.stylesheet())
+        for label, build in builders.items():
+            timed(app, build, per_widget)
+            results[label, per_widget] = statistics.median(
+                timed(app, build, per_widget) for _ in range(ROUNDS)
+            )
+    
+    print("=" * 60)
+    print(f"Construction + show + polish, median of {ROUNDS} (ms)")
+    print("=" * 60)
+    print(f"{'':<20} {'per-widget':>11} {'app sheet':>10} {'speedup':>8}")
+    for label in builders:
+        old = results[label, True]
+        new = results[label, False]
+        print(f"{label:<20} {old:11.2f} {new:10.2f} {old / new:7.2f}x")
+    
+    print()
+    print("=" * 60)
+    print(f"Validation label restyle, {RESTYLES} alternating valid/invalid (ms)")
+    print("=" * 60)
+    app.setStyleSheet(theme.stylesheet())
+    window = BenchWindow()
+    window.show()
+    app.processEvents()
+    label = window.validation_label
+    sheets = {
+        state: widget_sheet(label, state) for state in (theme.VALID, theme.INVALID)
+    }
+    
+    timings = {}
+    start = time.perf_counter()
+    for i in range(RESTYLES):
+        label.setStyleSheet(sheets[theme.VALID if i % 2 else theme.INVALID])
+    timings["setStyleSheet"] = time.perf_counter() - start
+    
+    # What every keystroke used to do: reset the label to the same sheet
+    start = time.perf_counter()
+    for i in range(RESTYLES):
+        label.setStyleSheet(sheets[theme.VALID])
+    timings["setStyleSheet (unchanged)"] = time.perf_counter() - start
+    label.setStyleSheet("")
+    
+    start = time.perf_counter()
+    for i in range(RESTYLES):
+        theme.set_state(label, theme.VALID if i % 2 else theme.INVALID)
+    timings["theme.set_state"] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for i in range(RESTYLES):
+        theme.set_state(label, theme.VALID)
+    timings["theme.set_state (unchanged)"] = time.perf_counter() - start
+    
+    for name, seconds in timings.items():
+        print(f"{name:<28} {seconds * 1000:8.2f}")
+    window.bench_cleanup()
+
+
+if __name__ == "__main__":
+    main()
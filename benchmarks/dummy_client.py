@@ -0,0 +1,65 @@
+"""
+Dummy Client
+Stands in for the Roblox client when exercising telemetry and launch code:
+burns CPU, holds memory, writes to disk and runs child processes for a
+fixed time, then exits with a chosen code.
+
+Run with: python benchmarks/dummy_client.py [--seconds N] [--children N] [--mb N] [--exit-code N]
+                                             [--startup N] [--record-settings]
+
+--startup delays before memory is allocated, like a client loading. With
+--record-settings the client copies the IxpSettings.json it sees under
+LOCALAPPDATA at startup to IxpSettings.json.<pid>.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def main() -> int:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--children", type=int, default=1)
+    parser.add_argument("--mb", type=int, default=50)
+    parser.add_argument("--exit-code", type=int, default=0)
+    parser.add_argument("--startup", type=float, default=0.0)
+    parser.add_argument("--record-settings", action="store_true")
+    args, _ = parser.parse_known_args()
+    
+    time.sleep(args.startup)
+    if args.record_settings:
+        settings = os.path.join(os.environ["LOCALAPPDATA"], "Roblox", "ClientSettings", "IxpSettings.json")
+        with open(settings, "rb") as src, open(f"{settings}.{os.getpid()}", "wb") as dst:
+            dst.write(src.read())
+    
+    children = [
+        subprocess.Popen([
+            sys.executable, __file__,
+            "--seconds", str(args.seconds), "--children", "0", "--mb", str(args.mb // 2)
+        ])
+        for _ in range(args.children)
+    ]
+    
+    ballast = bytearray(args.mb * 1024 * 1024)
+    deadline = time.monotonic() + args.seconds
+    with tempfile.TemporaryFile() as scratch:
+        while time.monotonic() < deadline:
+            # Roughly half a core: spin 50 ms, sleep 50 ms
+            spin_until = time.monotonic() + 0.05
+            while time.monotonic() < spin_until:
+                pass
+            scratch.write(os.urandom(64 * 1024))
+            time.sleep(0.05)
+    
+    for child in children:
+        child.wait()
+    del ballast
+    return args.exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
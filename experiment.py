@@ -0,0 +1,343 @@
+"""
+Experiment - Headless A/B comparison of two flag profiles
+
+Applies each profile in turn, launches the client, samples its resource
+usage for a fixed time, stops it, and reports per-metric statistics.
+
+Run with: python experiment.py --a fast.json --b default.json --rounds 5 --seconds 60
+Use --stand-in to run against benchmarks/dummy_client.py instead of Roblox.
+"""
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import psutil
+
+from file_manager import FileManager
+from path_manager import PathManager
+from roblox_launcher import RobloxLauncher
+from telemetry import TelemetrySampler
+
+
+# Two-sided 95% critical values of Student's t for 1-30 degrees of freedom
+_T95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+# Metric name -> value taken from a TelemetrySample
+METRICS: Dict[str, Callable[[Any], float]] = {
+    "cpu_percent": lambda s: s.cpu_percent,
+    "rss_mb": lambda s: s.rss_bytes / 1048576,
+    "threads": lambda s: s.threads,
+}
+
+STAND_IN = Path(__file__).resolve().parent / "benchmarks" / "dummy_client.py"
+
+
+def t_critical(df: float) -> float:
+    """95% two-sided critical value of Student's t."""
+    if df < 1:
+        return math.inf
+    if df <= len(_T95):
+        return _T95[int(df) - 1]
+    return 2.000 if df <= 60 else 1.960
+
+
+def mean_ci(values: Sequence[float]) -> List[float]:
+    """
+    95% confidence interval of the mean.
+    
+    Returns:
+        [low, high]; infinite if fewer than two values
+    """
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return [-math.inf, math.inf]
+    half = t_critical(len(values) - 1) * statistics.stdev(values) / math.sqrt(len(values))
+    return [mean - half, mean + half]
+
+
+def diff_ci(a: Sequence[float], b: Sequence[float]) -> List[float]:
+    """
+    95% Welch confidence interval of mean(b) - mean(a).
+    
+    Returns:
+        [low, high]; infinite if either side has fewer than two values
+    """
+    diff = statistics.fmean(b) - statistics.fmean(a)
+    if len(a) < 2 or len(b) < 2:
+        return [-math.inf, math.inf]
+    va = statistics.variance(a) / len(a)
+    vb = statistics.variance(b) / len(b)
+    if va + vb == 0:
+        return [diff, diff]
+    df = (va + vb) ** 2 / (va ** 2 / (len(a) - 1) + vb ** 2 / (len(b) - 1))
+    half = t_critical(df) * math.sqrt(va + vb)
+    return [diff - half, diff + half]
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Percentile by linear interpolation between closest ranks."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class ExperimentRunner:
+    """Runs alternating launches of two flag profiles and compares them."""
+    
+    def __init__(
+        self,
+        file_manager: FileManager,
+        profiles: Dict[str, Dict[str, Any]],
+        rounds: int = 5,
+        seconds: float = 60.0,
+        interval: float = 1.0,
+        warmup: float = 0.0,
+        player_exe: Optional[Path] = None,
+        player_args: Sequence[str] = (),
+        log: Callable[[str], None] = print
+    ):
+        """
+        Initialize ExperimentRunner.
+        
+        Args:
+            file_manager: File manager for the settings file the client reads
+            profiles: Exactly two profiles, {"A": flags, "B": flags}
+            rounds: Launches per profile
+            seconds: Sampling time per launch
+            interval: Seconds between samples
+            warmup: Seconds after launch to leave out of the statistics
+            player_exe: Client executable (default: installed Roblox player)
+            player_args: Extra arguments for the client
+            log: Progress output
+        """
+        if len(profiles) != 2:
+            raise ValueError("Exactly two profiles are required")
+        self.file_manager = file_manager
+        self.profiles = profiles
+        self.rounds = rounds
+        self.seconds = seconds
+        self.interval = interval
+        self.warmup = warmup
+        self.player_exe = player_exe
+        self.player_args = list(player_args)
+        self.log = log
+    
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every round, then restore the original settings file.
+        
+        Profiles alternate order each round (AB, BA, ...) so drift over the
+        session does not favour either one.
+        
+        Returns:
+            Report as produced by report()
+        
+        Raises:
+            Exception: If the existing settings file cannot be read, a profile
+                cannot be applied or the client fails to launch
+        """
+        names = list(self.profiles)
+        # Per profile: mean of each metric for every launch, and all samples
+        launches = {name: {metric: [] for metric in METRICS} for name in names}
+        pooled = {name: {metric: [] for metric in METRICS} for name in names}
+        
+        # Raises if the file exists but is unreadable, before anything changes
+        original = self.file_manager.snapshot()
+        try:
+            for round_no in range(self.rounds):
+                order = names if round_no % 2 == 0 else names[::-1]
+                for name in order:
+                    self.log(f"Round {round_no + 1}/{self.rounds}: profile {name}")
+                    samples = self._run_once(self.profiles[name])
+                    if not samples:
+                        raise Exception(f"No samples collected for profile {name}")
+                    for metric, value_of in METRICS.items():
+                        values = [value_of(s) for s in samples]
+                        launches[name][metric].append(statistics.fmean(values))
+                        pooled[name][metric].extend(values)
+        finally:
+            self.file_manager.restore_snapshot(original)
+        
+        return self.report(launches, pooled)
+    
+    def report(
+        self,
+        launches: Dict[str, Dict[str, List[float]]],
+        pooled: Dict[str, Dict[str, List[float]]]
+    ) -> Dict[str, Any]:
+        """
+        Build the statistical comparison.
+        
+        Means and confidence intervals use one value per launch; p50 and p95
+        use every sample.
+        
+        Returns:
+            {"rounds", "seconds", "metrics": {metric: {profile: stats,
+            "difference": {"b_minus_a", "ci95"}}}}
+        """
+        a, b = list(self.profiles)
+        metrics = {}
+        for metric in METRICS:
+            entry = {}
+            for name in (a, b):
+                per_launch = launches[name][metric]
+                samples = pooled[name][metric]
+                entry[name] = {
+                    "mean": statistics.fmean(per_launch),
+                    "ci95": mean_ci(per_launch),
+                    "p50": percentile(samples, 50),
+                    "p95": percentile(samples, 95),
+                    "launches": len(per_launch),
+                    "samples": len(samples),
+                }
+            entry["difference"] = {
+                "b_minus_a": entry[b]["mean"] - entry[a]["mean"],
+                "ci95": diff_ci(launches[a][metric], launches[b][metric]),
+            }
+            metrics[metric] = entry
+        return {"rounds": self.rounds, "seconds": self.seconds, "metrics": metrics}
+    
+    def _run_once(self, flags: Dict[str, Any]) -> List[Any]:
+        """Apply flags, launch, sample for the configured time and stop the client."""
+        self.file_manager.atomic_write_json(flags)
+        
+        success, message = RobloxLauncher.launch_roblox(self.player_exe, self.player_args)
+        if not success:
+            raise Exception(message)
+        process = RobloxLauncher.last_process
+        
+        samples = []
+        try:
+            sampler = TelemetrySampler(process, interval=self.interval)
+            # The first reading primes cpu_percent and is always discarded
+            sampler.sample()
+            deadline = time.monotonic() + self.seconds
+            while time.monotonic() < deadline and sampler.root_alive():
+                time.sleep(self.interval)
+                sample = sampler.sample()
+                if sample is None:
+                    break
+                if sample.elapsed >= self.warmup:
+                    samples.append(sample)
+        finally:
+            self._stop_client(process)
+        return samples
+    
+    @staticmethod
+    def _stop_client(process) -> None:
+        """Terminate the client and any children it started."""
+        try:
+            children = psutil.Process(process.pid).children(recursive=True)
+        except psutil.NoSuchProcess:
+            children = []
+        for proc in [*children]:
+            try:
+                proc.terminate()
+            except psutil.NoSuchProcess:
+                pass
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+            process.wait()
+        psutil.wait_procs(children, timeout=5)
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Render a report as a text table.
+    
+    Args:
+        report: Result of ExperimentRunner.run
+    
+    Returns:
+        Multi-line table
+    """
+    lines = [
+        f"{report['rounds']} rounds x {report['seconds']:g} s per launch",
+        f"{'metric':<12} {'profile':<10} {'mean':>10} {'95% CI':>23} {'p50':>10} {'p95':>10}",
+    ]
+    for metric, entry in report["metrics"].items():
+        for name, stats in entry.items():
+            if name == "difference":
+                continue
+            low, high = stats["ci95"]
+            lines.append(
+                f"{metric:<12} {name:<10} {stats['mean']:>10.2f} "
+                f"{f'[{low:.2f}, {high:.2f}]':>23} {stats['p50']:>10.2f} {stats['p95']:>10.2f}"
+            )
+        diff = entry["difference"]
+        low, high = diff["ci95"]
+        verdict = "significant" if low > 0 or high < 0 else "not significant"
+        lines.append(
+            f"{'':<12} {'B - A':<10} {diff['b_minus_a']:>10.2f} "
+            f"{f'[{low:.2f}, {high:.2f}]':>23}  {verdict}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="A/B comparison of two FFlag profiles")
+    parser.add_argument("--a", type=Path, required=True, help="Profile A (JSON file)")
+    parser.add_argument("--b", type=Path, required=True, help="Profile B (JSON file)")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--warmup", type=float, default=0.0)
+    parser.add_argument("--target", type=Path, help="Settings file (default: Roblox ClientSettings)")
+    parser.add_argument("--exe", type=Path, help="Client executable (default: installed player)")
+    parser.add_argument("--stand-in", action="store_true", help="Use the dummy client")
+    parser.add_argument("--json", type=Path, help="Also write the report here")
+    args = parser.parse_args(argv)
+    
+    profiles = {}
+    for name, path in (("A", args.a), ("B", args.b)):
+        profiles[name] = json.loads(path.read_text(encoding="utf-8"))
+    
+    target = args.target
+    if target is None:
+        path_manager = PathManager()
+        if not path_manager.resolve_paths() or not path_manager.ensure_client_settings_exists():
+            print("Failed to resolve Roblox paths. Use --target.")
+            return 1
+        target = path_manager.target_file
+    
+    player_exe, player_args = args.exe, []
+    if args.stand_in:
+        player_exe = Path(sys.executable)
+        player_args = [str(STAND_IN), "--seconds", str(args.seconds + 5)]
+    
+    runner = ExperimentRunner(
+        FileManager(target),
+        profiles,
+        rounds=args.rounds,
+        seconds=args.seconds,
+        interval=args.interval,
+        warmup=args.warmup,
+        player_exe=player_exe,
+        player_args=player_args
+    )
+    report = runner.run()
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,53 @@
 """
 FileManager - Handles file operations including atomic writes, backups, and read-only attributes
 """
-import json
-import time
 import os
 import ctypes
+import hashlib
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Optional, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Mapping, NamedTuple, Tuple, Union
+
+from backup_store import BackupEntry, BackupStore
+from flag_store import FlagStore
+from json_codec import default_codec
+from json_validator import JsonValidator
+from tracing import traced
+
+
+class FlagChanges(NamedTuple):
+    """Flag-level difference between the file on disk and new data."""
+    
+    added: int
+    removed: int
+    changed: int
+    
+    @classmethod
+    def between(cls, old: Mapping[str, Any], new: Mapping[str, Any]) -> "FlagChanges":
+        """
+        Count flags added, removed and changed from old to new.
+        
+        Values of different types count as changed even if equal (1 vs true).
+        """
+        common = old.keys() & new.keys()
+        changed = sum(
+            1 for key in common
+            if old[key] != new[key] or type(old[key]) is not type(new[key])
+        )
+        return cls(len(new) - len(common), len(old) - len(common), changed)
+    
+    def summary(self) -> str:
+        """Human-readable description, e.g. "2 added, 1 changed"."""
+        parts = [
+            f"{count} {label}"
+            for count, label in (
+                (self.added, "added"),
+                (self.removed, "removed"),
+                (self.changed, "changed")
+            )
+            if count
+        ]
+        return ", ".join(parts) if parts else "formatting only"
 
 
 class FileManager:
@@ -16,6 +56,10 @@ class FileManager:
     FILE_ATTRIBUTE_READONLY = 0x01
     FILE_ATTRIBUTE_NORMAL = 0x80
     
+    # Folder in the backup store that old-layout backup files are moved to;
+    # retention never touches it
+    LEGACY_BACKUP_DIR = "legacy"
+    
     def __init__(self, target_path: Path):
         """
         Initialize FileManager.
@@ -24,13 +68,28 @@ class FileManager:
             target_path: Path to the target file
         """
         self.target_path = target_path
+        self.backup_store = BackupStore(
+            target_path.with_name(f"{target_path.stem}.backups")
+        )
+        self._legacy_migrated = False
+        
+        # What the target file holds: ((mtime_ns, size), content hash, flags).
+        # Reused while the file's stat is unchanged, so repeated compares
+        # need neither a read nor a parse.
+        self._disk: Optional[Tuple[Tuple[int, int], bytes, Dict[str, Any]]] = None
+        # Canonical text of the data last passed to pending_changes
+        self._pending: Tuple[Optional[Dict[str, Any]], str] = (None, "")
     
-    def backup_file(self) -> Optional[Path]:
+    @traced()
+    def backup_file(self) -> Optional[BackupEntry]:
         """
-        Create a timestamped backup of the target file if it exists.
+        Back up the target file if it exists.
+        
+        Content already in the store is not written again, and a backup
+        identical to the newest one returns that backup.
         
         Returns:
-            Path to backup file if created, None otherwise
+            The backup holding the current content, None if there is no file
         """
         if not self.target_path.exists():
             return None
@@ -39,54 +98,197 @@ class FileManager:
             # Remove read-only attribute before backing up
             self._clear_readonly()
             
-            stamp = time.strftime("%Y%m%d_%H%M%S")
-            bak = self.target_path.with_name(
-                f"{self.target_path.stem}.bak.{stamp}{self.target_path.suffix}"
-            )
-            
-            # Copy content to backup
-            bak.write_bytes(self.target_path.read_bytes())
-            return bak
+            self._migrate_legacy_backups()
+            return self.backup_store.add(self.target_path.read_bytes())
         except Exception as e:
             raise Exception(f"Failed to create backup: {e}")
     
-    def atomic_write_json(self, data: Dict[str, Any]) -> None:
+    @traced()
+    def atomic_write_json(
+        self,
+        data: Union[Dict[str, Any], FlagStore],
+        before_replace: Optional[Callable[[], None]] = None
+    ) -> None:
         """
         Atomically write JSON data to target file.
         
         Args:
-            data: Dictionary to write as JSON
+            data: Dictionary or FlagStore to write as JSON; a store
+                serializes itself without being copied into a dict
+            before_replace: Optional callback run once the new content is
+                safely on disk, just before it replaces the target. Raising
+                from it aborts the write and leaves the target untouched.
         
         Raises:
             Exception: If write fails
         """
+        pending_data, text = self._pending
+        if data is not pending_data:
+            try:
+                text = self._canonical(data)
+            except Exception as e:
+                raise Exception(f"Failed to write file: {e}")
+        self.atomic_write_text(text, before_replace)
+        self._remember_disk(text, data)
+    
+    @traced()
+    def pending_changes(self, data: Union[Dict[str, Any], FlagStore]) -> Optional[FlagChanges]:
+        """
+        Compare data against the target file.
+        
+        The file is read and parsed only if it changed since it was last
+        read or written here; otherwise the comparison costs one stat and,
+        for a new data object, one serialization.
+        
+        Args:
+            data: Dictionary or FlagStore that would be written
+        
+        Returns:
+            Flag counts that writing data would change, or None if the file
+            already holds exactly its canonical form
+        """
+        disk = self._disk_snapshot()
+        if disk is None:
+            return FlagChanges(len(data), 0, 0)
+        
+        stat_key, digest, disk_data = disk
+        if data is disk_data:
+            return None
+        
+        try:
+            text = self._canonical(data)
+        except Exception:
+            return FlagChanges.between(disk_data, data)
+        self._pending = (data, text)
+        
+        if hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest() == digest:
+            # Same content; let the next compare with this object skip serializing
+            self._disk = (stat_key, digest, data)
+            return None
+        return FlagChanges.between(disk_data, data)
+    
+    @staticmethod
+    def _canonical(data: Union[Dict[str, Any], FlagStore]) -> str:
+        """Canonical text of data, written straight from a FlagStore's columns."""
+        if isinstance(data, FlagStore):
+            return data.dumps_canonical()
+        return default_codec.dumps_canonical(data)
+    
+    def _disk_snapshot(self) -> Optional[Tuple[Tuple[int, int], bytes, Dict[str, Any]]]:
+        """Get the tracked state of the target file, re-reading it if it changed."""
+        try:
+            stat = self.target_path.stat()
+        except OSError:
+            self._disk = None
+            return None
+        
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if self._disk is not None and self._disk[0] == stat_key:
+            return self._disk
+        
+        try:
+            raw = self.target_path.read_bytes()
+        except OSError:
+            self._disk = None
+            return None
+        
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        try:
+            is_valid, disk_data = JsonValidator.cache.parse(raw.decode("utf-8"))[:2]
+        except UnicodeDecodeError:
+            is_valid, disk_data = False, None
+        if not is_valid or not isinstance(disk_data, dict):
+            disk_data = {}
+        
+        self._disk = (stat_key, digest, disk_data)
+        return self._disk
+    
+    def _remember_disk(self, text: str, data: Dict[str, Any]) -> None:
+        """Record what was just written to the target file."""
+        try:
+            stat = self.target_path.stat()
+        except OSError:
+            self._disk = None
+            return
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        self._disk = ((stat.st_mtime_ns, stat.st_size), digest, data)
+    
+    @traced()
+    def atomic_write_text(
+        self,
+        text: str,
+        before_replace: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Atomically write already-serialized JSON text to target file.
+        
+        The text is written as UTF-8 without newline translation, so the
+        file's bytes match what change detection hashes on every platform.
+        
+        Args:
+            text: JSON text to write
+            before_replace: Optional callback as for atomic_write_json
+        
+        Raises:
+            Exception: If write fails; the original exception is the cause
+        """
+        self.atomic_write_bytes(text.encode("utf-8"), before_replace)
+    
+    def atomic_write_bytes(
+        self,
+        content: bytes,
+        before_replace: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Atomically write exact bytes to target file.
+        
+        Args:
+            content: Bytes to write
+            before_replace: Optional callback as for atomic_write_json
+        
+        Raises:
+            Exception: If write fails; the original exception is the cause
+        """
+        tmpname = None
         try:
             # Ensure parent directory exists
             self.target_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Remove read-only attribute if file exists
-            if self.target_path.exists():
-                self._clear_readonly()
-            
             # Write to temporary file first
             with NamedTemporaryFile(
-                mode="w",
+                mode="wb",
                 dir=str(self.target_path.parent),
                 delete=False,
-                encoding="utf-8",
                 suffix=".tmp"
             ) as tf:
-                json.dump(data, tf, indent=2, ensure_ascii=False)
+                tmpname = Path(tf.name)
+                tf.write(content)
                 tf.flush()
                 os.fsync(tf.fileno())
-                tmpname = Path(tf.name)
+            
+            if before_replace is not None:
+                before_replace()
+            
+            # Remove read-only attribute if file exists
+            if self.target_path.exists():
+                self._clear_readonly()
             
             # Atomic replace
+            self._disk = None
             tmpname.replace(self.target_path)
-            
+            tmpname = None
+        
         except Exception as e:
-            raise Exception(f"Failed to write file: {e}")
+            raise Exception(f"Failed to write file: {e}") from e
+        finally:
+            # A failed or aborted write must not leave its temp file behind
+            if tmpname is not None:
+                try:
+                    tmpname.unlink()
+                except OSError:
+                    pass
     
+    @traced()
     def set_readonly(self) -> None:
         """Set the target file to read-only."""
         try:
@@ -108,6 +310,43 @@ class FileManager:
         except Exception:
             pass
     
+    def snapshot(self) -> Optional[bytes]:
+        """
+        Read the target file's exact bytes so they can be put back later.
+        
+        Returns:
+            File content, or None if the file does not exist
+        
+        Raises:
+            Exception: If the file exists but cannot be read (locked,
+                permission denied); callers must not treat it as missing
+        """
+        try:
+            return self.target_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise Exception(f"Failed to read {self.target_path.name}: {e}") from e
+    
+    def restore_snapshot(self, original: Optional[bytes]) -> None:
+        """
+        Put the target file back as a snapshot() found it.
+        
+        Args:
+            original: Bytes from snapshot(); None removes the file, since
+                there was none
+        
+        Raises:
+            Exception: If the file cannot be written or removed
+        """
+        if original is not None:
+            self.atomic_write_bytes(original)
+            return
+        self._clear_readonly()
+        self._disk = None
+        self.target_path.unlink(missing_ok=True)
+    
+    @traced()
     def read_current_content(self) -> Optional[str]:
         """
         Read current content of target file.
@@ -123,44 +362,82 @@ class FileManager:
         except Exception:
             return None
     
-    def get_backup_files(self) -> List[Path]:
+    @traced()
+    def backup_count(self) -> int:
         """
-        Get list of backup files for the target file.
+        Get the number of backups for the target file.
         
         Returns:
-            List of backup file paths, sorted by modification time (newest first)
+            Number of backups
         """
         try:
-            pattern = f"{self.target_path.stem}.bak.*{self.target_path.suffix}"
-            backups = list(self.target_path.parent.glob(pattern))
-            backups.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-            return backups
+            self._migrate_legacy_backups()
+            return self.backup_store.count()
+        except Exception:
+            return 0
+    
+    @traced()
+    def get_backup_files(self) -> List[BackupEntry]:
+        """
+        Get list of backups for the target file.
+        
+        Returns:
+            List of backups, newest first
+        """
+        try:
+            self._migrate_legacy_backups()
+            return self.backup_store.entries()
         except Exception:
             return []
     
-    def restore_backup(self, backup_path: Path) -> None:
+    @traced()
+    def restore_backup(self, backup: BackupEntry) -> None:
         """
-        Restore a backup file to the target file.
+        Restore a backup to the target file.
         
         Args:
-            backup_path: Path to the backup file to restore
+            backup: Backup to restore
         
         Raises:
             Exception: If restore fails
         """
         try:
-            if not backup_path.exists():
-                raise Exception("Backup file not found")
+            content = self.backup_store.read(backup).decode("utf-8")
             
             # Remove read-only from target if exists
             if self.target_path.exists():
                 self._clear_readonly()
             
-            # Copy backup to target
-            content = backup_path.read_text(encoding="utf-8")
-            data = json.loads(content)  # Validate it's valid JSON
-            self.atomic_write_json(data)
-            
+            # Copy backup to target, validating and formatting in one parse
+            formatted = JsonValidator.cache.formatted(content)
+            if formatted is None:
+                raise Exception(JsonValidator.cache.parse(content)[2])
+            self.atomic_write_text(formatted)
+        
         except Exception as e:
             raise Exception(f"Failed to restore backup: {e}")
-
+    
+    def _migrate_legacy_backups(self) -> None:
+        """
+        Import backups from the old one-file-per-backup layout into the store.
+        
+        The old files were never pruned, so they are kept: each is moved,
+        unchanged, into the store's legacy folder once its content is
+        stored. Store retention may later drop the imported entries from
+        the restore list, but never the files in the legacy folder.
+        """
+        if self._legacy_migrated:
+            return
+        
+        pattern = f"{self.target_path.stem}.bak.*{self.target_path.suffix}"
+        legacy = list(self.target_path.parent.glob(pattern))
+        legacy.sort(key=lambda p: p.stat().st_mtime)
+        if legacy:
+            kept_dir = self.backup_store.directory / self.LEGACY_BACKUP_DIR
+            kept_dir.mkdir(parents=True, exist_ok=True)
+            for path in legacy:
+                self.backup_store.add(path.read_bytes(), created=path.stat().st_mtime)
+                # Moving also marks the file as imported for later launches
+                path.replace(kept_dir / path.name)
+        
+        self._legacy_migrated = True
@@ -0,0 +1,114 @@
+"""
+FlagSchema - Checks FFlag value types by their key prefix
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class FlagSchema:
+    """Classifies flags by prefix and checks their value types."""
+    
+    KIND_FLAG = "Flag"
+    KIND_INT = "Int"
+    KIND_STRING = "String"
+    KIND_LOG = "Log"
+    
+    # FFlag/DFFlag, FInt/DFInt, FString/DFString, FLog/DFLog; one group per kind
+    # so match.lastindex identifies the kind without a method call
+    PREFIX = re.compile(r"D?F(?:(Flag)|(Int)|(String)|(Log))")
+    KINDS = (None, KIND_FLAG, KIND_INT, KIND_STRING, KIND_LOG)
+    
+    INTEGER = re.compile(r"[+-]?[0-9]+")
+    BOOL_STRINGS = frozenset(("true", "false", "True", "False", "TRUE", "FALSE"))
+    
+    EXPECTED = {
+        KIND_FLAG: "true/false",
+        KIND_INT: "an integer",
+        KIND_STRING: "a string",
+        KIND_LOG: "an integer log level",
+    }
+    
+    def __init__(self):
+        """Initialize FlagSchema."""
+        # Result for the last checked dict; ParseCache hands out the same
+        # object for identical text, so repeated validation is free
+        self._last: Tuple[Optional[Dict[str, Any]], List[Tuple[str, str]]] = (None, [])
+    
+    def classify(self, key: str) -> Optional[str]:
+        """
+        Classify a flag name by its prefix.
+        
+        Args:
+            key: Flag name
+        
+        Returns:
+            One of the KIND_* constants, or None for an unknown prefix
+        """
+        match = self.PREFIX.match(key)
+        return self.KINDS[match.lastindex] if match else None
+    
+    def check(self, data: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        Check every flag value against the type its prefix implies.
+        
+        Flags with an unknown prefix are not checked. The dict must not be
+        modified afterwards, as the result is remembered for it.
+        
+        Args:
+            data: Parsed flag dictionary
+        
+        Returns:
+            List of (key, problem) tuples sorted by key, empty if all values fit
+        """
+        last_data, last_problems = self._last
+        if data is last_data:
+            return last_problems
+        
+        problems = self.check_pairs(data.items())
+        problems.sort()
+        self._last = (data, problems)
+        return problems
+    
+    def check_pairs(self, pairs: Iterable[Tuple[str, Any]]) -> List[Tuple[str, str]]:
+        """
+        Check key/value pairs against the types their prefixes imply.
+        
+        Unlike check(), nothing is remembered, so ParseCache can check a
+        new document's top-level items once and cache the result with it.
+        
+        Args:
+            pairs: (key, value) tuples, e.g. dict items
+        
+        Returns:
+            List of (key, problem) tuples in pair order
+        """
+        problems = []
+        match = self.PREFIX.match
+        integer = self.INTEGER.fullmatch
+        bool_strings = self.BOOL_STRINGS
+        
+        # Kinds by group index: 1 Flag, 2 Int, 3 String, 4 Log
+        for key, value in pairs:
+            found = match(key)
+            if found is None:
+                continue
+            kind = found.lastindex
+            value_type = type(value)
+            
+            if value_type is str:
+                if kind == 3:
+                    continue
+                if kind == 1:
+                    if value in bool_strings or value.lower() in ("true", "false"):
+                        continue
+                elif (value.isdigit() and value.isascii()) or integer(value):
+                    continue
+            elif value_type is bool:
+                if kind == 1:
+                    continue
+            elif value_type is int:
+                if kind == 2 or kind == 4:
+                    continue
+            
+            problems.append((key, f"expects {self.EXPECTED[self.KINDS[kind]]}, got {value!r}"))
+        return problems
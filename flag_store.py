@@ -0,0 +1,521 @@
+"""
+FlagStore - Compact column store for a parsed flag set
+"""
+import json
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from enum import IntEnum
+from itertools import accumulate, repeat
+from json.encoder import encode_basestring
+from typing import Any, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from flag_schema import FlagSchema
+from json_codec import JsonBackend, default_codec
+
+
+class FlagPrefix(IntEnum):
+    """Flag name prefix, which decides the type a flag's value should have."""
+    
+    UNKNOWN = 0
+    FFLAG = 1
+    DFFLAG = 2
+    FINT = 3
+    DFINT = 4
+    FSTRING = 5
+    DFSTRING = 6
+    FLOG = 7
+    DFLOG = 8
+    
+    @classmethod
+    def of(cls, key: str) -> "FlagPrefix":
+        """
+        Classify a flag name by its prefix.
+        
+        Args:
+            key: Flag name
+        
+        Returns:
+            The name's prefix, UNKNOWN if it has none of the known ones
+        """
+        return cls(_prefix_code(key))
+    
+    @property
+    def text(self) -> str:
+        """Prefix as written in flag names, e.g. "DFInt"; empty for UNKNOWN."""
+        return _PREFIX_TEXT[self]
+    
+    @property
+    def kind(self) -> Optional[str]:
+        """FlagSchema.KIND_* the prefix implies, None for UNKNOWN."""
+        return FlagSchema.KINDS[(self + 1) // 2]
+
+
+class ValueType(IntEnum):
+    """How a value is held: in the integer column or as an object."""
+    
+    NULL = 0
+    BOOL = 1
+    INT = 2
+    STR = 3
+    # Floats, integers beyond 64 bits, arrays and objects
+    OTHER = 4
+
+
+_PREFIX_TEXT = ("", "FFlag", "DFFlag", "FInt", "DFInt", "FString", "DFString", "FLog", "DFLog")
+# The same prefixes FlagSchema.PREFIX matches. None starts another, and the
+# first three characters tell them apart, so one dict lookup finds the candidate
+_HEADS = {text[:3]: (text, code) for code, text in enumerate(_PREFIX_TEXT) if text}
+
+_KINDS = tuple(prefix.kind for prefix in FlagPrefix)
+
+_NULL, _BOOL, _INT, _STR, _OTHER = map(int, ValueType)
+_TYPE_CODES = {type(None): _NULL, bool: _BOOL, int: _INT, str: _STR}
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+_Flags = Union[Mapping, Iterable[Tuple[str, Any]]]
+
+
+def _prefix_code(key: str) -> int:
+    """FlagPrefix value of a flag name."""
+    candidate = _HEADS.get(key[:3])
+    return candidate[1] if candidate is not None and key.startswith(candidate[0]) else 0
+
+
+def _prefix_codes(keys: List[str]) -> bytearray:
+    """FlagPrefix values of many flag names."""
+    # The prefix lies within a name's first 8 characters ("DFString"), and
+    # names share far fewer of those than there are names
+    heads = [key[:8] for key in keys]
+    codes = dict.fromkeys(heads)
+    for head in codes:
+        codes[head] = _prefix_code(head)
+    return bytearray(map(codes.__getitem__, heads))
+
+
+def _nested(value: Any) -> str:
+    """Canonical text of an array, object or float at entry depth."""
+    # Nested lines are indented one level deeper than the entries
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+
+
+class FlagStore(Mapping):
+    """
+    Flags held as columns instead of a dict of objects.
+    
+    Names are interned into one string table: each is stored once, as
+    characters of a single str, and sliced out when asked for. Booleans
+    and 64-bit integers live unboxed in an array, equal strings share one
+    object, and each row records its name's prefix and value type in a
+    byte each. Lookup goes through an open-addressing table of row numbers
+    rather than a dict, which would hold every name again as an object and
+    leave the store larger than the plain dict it replaces; a lookup costs
+    about 1 µs instead of 0.1 µs. Canonical JSON is written straight from
+    the columns. Rows keep insertion (document) order.
+    
+    Values can be changed and flags added, but not removed; build a new
+    store instead. Adding a flag copies the name table, so build stores
+    in bulk.
+    """
+    
+    # Entries serialized per chunk by iter_canonical
+    CHUNK_ROWS = 4096
+    
+    __slots__ = ("_names", "_offsets", "_objects", "_ints", "_types", "_prefixes", "_table", "_mask")
+    
+    def __init__(self, flags: _Flags = ()):
+        """
+        Initialize FlagStore.
+        
+        Args:
+            flags: Mapping or (key, value) pairs in document order; a key
+                given twice keeps its first position and last value
+        """
+        self._names = ""
+        # Row r's name is _names[_offsets[r]:_offsets[r + 1]]
+        self._offsets = array("I", [0])
+        self._objects: List[Any] = []
+        self._ints = array("q")
+        self._types = bytearray()
+        self._prefixes = bytearray()
+        self._table = array("i")
+        self._mask = 0
+        
+        if isinstance(flags, dict):
+            # Keys are already unique; fill the columns, then index once
+            keys = list(flags)
+            self._extend(keys, list(flags.values()))
+            self._resize(keys)
+        else:
+            items = flags.items() if isinstance(flags, Mapping) else flags
+            for key, value in items:
+                self[key] = value
+    
+    def __getitem__(self, key: str) -> Any:
+        row = self._find(key)
+        if row < 0:
+            raise KeyError(key)
+        return self.value(row)
+    
+    def __contains__(self, key: object) -> bool:
+        return type(key) is str and self._find(key) >= 0
+    
+    def __iter__(self) -> Iterator[str]:
+        names = self._names
+        offsets = self._offsets
+        for row in range(len(self._types)):
+            yield names[offsets[row]:offsets[row + 1]]
+    
+    def __len__(self) -> int:
+        return len(self._types)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        row = self._find(key)
+        if row >= 0:
+            self.set_value(row, value)
+            return
+        self._extend([key], [value])
+        if len(self._types) * 2 > len(self._table):
+            self._resize()
+        else:
+            self._insert(len(self._types) - 1, hash(key))
+    
+    def __repr__(self) -> str:
+        return f"FlagStore({len(self._types)} flags)"
+    
+    def row_of(self, key: str) -> int:
+        """
+        Find a flag's row.
+        
+        Args:
+            key: Flag name
+        
+        Returns:
+            Row number, or -1 if the flag is not stored
+        """
+        return self._find(key)
+    
+    def key(self, row: int) -> str:
+        """Flag name in a row."""
+        return self._names[self._offsets[row]:self._offsets[row + 1]]
+    
+    def value(self, row: int) -> Any:
+        """Flag value in a row."""
+        value_type = self._types[row]
+        if value_type == _BOOL:
+            return self._ints[row] != 0
+        if value_type == _INT:
+            return self._ints[row]
+        return self._objects[row]
+    
+    def value_type(self, row: int) -> ValueType:
+        """How the value in a row is held."""
+        return ValueType(self._types[row])
+    
+    def prefix(self, row: int) -> FlagPrefix:
+        """Prefix of the flag name in a row."""
+        return FlagPrefix(self._prefixes[row])
+    
+    def kind(self, row: int) -> Optional[str]:
+        """FlagSchema.KIND_* the prefix of the name in a row implies."""
+        return _KINDS[self._prefixes[row]]
+    
+    def set_value(self, row: int, value: Any) -> None:
+        """
+        Replace the value in a row.
+        
+        Args:
+            row: Row to change
+            value: New value, of any JSON type
+        """
+        value_type = _TYPE_CODES.get(type(value), _OTHER)
+        if value_type == _INT and not _INT_MIN <= value <= _INT_MAX:
+            value_type = _OTHER
+        unboxed = value_type == _BOOL or value_type == _INT
+        self._types[row] = value_type
+        self._ints[row] = value if unboxed else 0
+        self._objects[row] = None if unboxed else value
+    
+    def key_list(self) -> List[str]:
+        """
+        Get every flag name in row order.
+        
+        Returns:
+            New list of names
+        """
+        names = self._names
+        offsets = self._offsets.tolist()
+        return [names[start:end] for start, end in zip(offsets, offsets[1:])]
+    
+    def value_list(self) -> List[Any]:
+        """
+        Get every value in row order.
+        
+        Returns:
+            New list of values
+        """
+        ints = self._ints
+        values = self._objects.copy()
+        for row, value_type in enumerate(self._types):
+            if value_type == _INT:
+                values[row] = ints[row]
+            elif value_type == _BOOL:
+                values[row] = ints[row] != 0
+        return values
+    
+    def to_dict(self) -> dict:
+        """
+        Get the flags as a plain dict.
+        
+        Returns:
+            New dict in row order
+        """
+        return dict(zip(self.key_list(), self.value_list()))
+    
+    def same_keys(self, keys: List[str]) -> bool:
+        """
+        Check whether keys are the stored names, in row order.
+        
+        Args:
+            keys: Flag names
+        
+        Returns:
+            True if the names and their order match
+        """
+        return (
+            len(keys) == len(self._types)
+            and "".join(keys) == self._names
+            and array("I", accumulate(map(len, keys), initial=0)) == self._offsets
+        )
+    
+    def find_rows(self, needle: str) -> List[int]:
+        """
+        Find the flags whose name contains a substring, ignoring case.
+        
+        The name table is searched as a whole rather than name by name.
+        
+        Args:
+            needle: Lowercase substring, non-empty
+        
+        Returns:
+            Matching rows in row order
+        """
+        names = self._names.lower()
+        if len(names) != len(self._names):
+            # Lowercasing changed some lengths; offsets no longer line up
+            return [row for row, key in enumerate(self) if needle in key.lower()]
+        
+        offsets = self._offsets
+        if names.count(needle) * 4 > len(offsets):
+            # Common substring: one bounded find per name beats one step per match
+            return [
+                row for row, (start, end) in enumerate(zip(offsets, offsets[1:]))
+                if names.find(needle, start, end) >= 0
+            ]
+        
+        size = len(needle)
+        rows = []
+        position = names.find(needle)
+        while position >= 0:
+            row = bisect_right(offsets, position) - 1
+            end = offsets[row + 1]
+            if position + size <= end:
+                rows.append(row)
+                position = names.find(needle, end)
+            else:
+                # Match runs into the next name
+                position = names.find(needle, position + 1)
+        return rows
+    
+    def prefix_rows(self, *prefixes: FlagPrefix) -> Iterator[int]:
+        """
+        Iterate over the rows of flags with the given prefixes.
+        
+        Args:
+            *prefixes: Prefixes to include
+        
+        Yields:
+            Row numbers in row order
+        """
+        column = self._prefixes
+        if len(prefixes) == 1:
+            # One byte to look for: let bytearray.find skip the other rows
+            code = prefixes[0]
+            row = column.find(code)
+            while row >= 0:
+                yield row
+                row = column.find(code, row + 1)
+            return
+        
+        wanted = bytes(sorted(prefixes))
+        for row, code in enumerate(column):
+            if code in wanted:
+                yield row
+    
+    def prefix_items(self, *prefixes: FlagPrefix) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the flags with the given prefixes.
+        
+        Args:
+            *prefixes: Prefixes to include
+        
+        Yields:
+            (key, value) tuples in row order
+        """
+        for row in self.prefix_rows(*prefixes):
+            yield self.key(row), self.value(row)
+    
+    def iter_canonical(self) -> Iterator[str]:
+        """
+        Serialize in the canonical form, a batch of entries at a time.
+        
+        The chunks join to exactly what JsonCodec.dumps_canonical produces
+        for the equivalent dict, without building that dict.
+        
+        Yields:
+            Text chunks
+        """
+        count = len(self._types)
+        if not count:
+            yield "{}"
+            return
+        
+        separator = "{\n  "
+        for start in range(0, count, self.CHUNK_ROWS):
+            yield separator + ",\n  ".join(self._entries(start, min(count, start + self.CHUNK_ROWS)))
+            separator = ",\n  "
+        yield "\n}"
+    
+    def dumps_canonical(self) -> str:
+        """
+        Serialize in the canonical indent=2 form FileManager writes.
+        
+        Returns:
+            Canonical JSON text
+        """
+        if default_codec.name != JsonBackend.name and _OTHER not in self._types:
+            # A fast backend serializes a flat dict several times quicker
+            # than the columns can be encoded here, even counting the dict
+            return default_codec.dumps_canonical(self.to_dict())
+        return "".join(self.iter_canonical())
+    
+    def write_canonical(self, stream: TextIO) -> None:
+        """
+        Write the canonical form to a text stream without joining it first.
+        
+        Args:
+            stream: Open text stream
+        """
+        stream.writelines(self.iter_canonical())
+    
+    def _entries(self, start: int, stop: int) -> List[str]:
+        """Encode rows start to stop as '"key": value' entries."""
+        encode = encode_basestring
+        names = self._names
+        offsets = self._offsets
+        return [
+            f"{encode(names[offsets[row]:offsets[row + 1]])}: " + (
+                encode(obj) if value_type == _STR
+                else str(number) if value_type == _INT
+                else ("true" if number else "false") if value_type == _BOOL
+                else "null" if value_type == _NULL
+                else _nested(obj)
+            )
+            for row, value_type, number, obj in zip(
+                range(start, stop),
+                self._types[start:stop],
+                self._ints[start:stop],
+                self._objects[start:stop]
+            )
+        ]
+    
+    def _extend(self, keys: List[str], values: List[Any]) -> None:
+        """Add rows for new keys without indexing them."""
+        for key in keys:
+            if type(key) is not str:
+                raise TypeError(f"Flag names must be strings, got {type(key).__name__}")
+        
+        offsets = self._offsets
+        offsets.extend(accumulate(map(len, keys), initial=offsets.pop()))
+        self._names += "".join(keys)
+        self._prefixes.extend(_prefix_codes(keys))
+        
+        # A column at a time; packing row by row is several times slower
+        codes = _TYPE_CODES
+        types = bytearray(map(codes.get, map(type, values), repeat(_OTHER, len(values))))
+        try:
+            numbers = array("q", [
+                value if value_type == _BOOL or value_type == _INT else 0
+                for value_type, value in zip(types, values)
+            ])
+        except OverflowError:
+            # Integers beyond 64 bits are held as objects
+            for row, value in enumerate(values):
+                if types[row] == _INT and not _INT_MIN <= value <= _INT_MAX:
+                    types[row] = _OTHER
+            numbers = array("q", [
+                value if value_type == _BOOL or value_type == _INT else 0
+                for value_type, value in zip(types, values)
+            ])
+        
+        # One object per distinct string, however many flags hold it
+        pool = {}
+        self._objects.extend([
+            pool.setdefault(value, value) if value_type == _STR
+            else value if value_type == _OTHER
+            else None
+            for value_type, value in zip(types, values)
+        ])
+        self._types.extend(types)
+        self._ints.extend(numbers)
+    
+    def _find(self, key: str) -> int:
+        """Row of a key via the table, -1 if absent."""
+        table = self._table
+        if not table:
+            return -1
+        names = self._names
+        offsets = self._offsets
+        size = len(key)
+        mask = self._mask
+        slot = hash(key) & mask
+        while True:
+            entry = table[slot]
+            if entry == 0:
+                return -1
+            # Entries are row + 1 so zero can mark an empty slot
+            start = offsets[entry - 1]
+            if offsets[entry] - start == size and names.startswith(key, start):
+                return entry - 1
+            slot = (slot + 1) & mask
+    
+    def _insert(self, row: int, key_hash: int) -> None:
+        """Index a row, probing linearly for a free slot."""
+        table = self._table
+        mask = self._mask
+        slot = key_hash & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = row + 1
+    
+    def _resize(self, keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Rebuild the table at no more than half full.
+        
+        Args:
+            keys: Every stored name in row order, if at hand; str objects
+                cache their hash, which slicing names out would recompute
+        """
+        size = 8
+        while size < len(self._types) * 2:
+            size *= 2
+        table = array("i", bytes(4 * size))
+        mask = size - 1
+        for row, key in enumerate(self if keys is None else keys, 1):
+            slot = hash(key) & mask
+            while table[slot]:
+                slot = (slot + 1) & mask
+            table[slot] = row
+        self._table = table
+        self._mask = mask
@@ -0,0 +1,528 @@
+"""
+FlagTableModel - Table model and proxy for viewing and editing flags as rows
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from PyQt6.QtCore import (
+    QAbstractProxyModel, QAbstractTableModel, QModelIndex, QObject,
+    QRegularExpression, Qt, pyqtSignal
+)
+from PyQt6.QtGui import QColor, QTextCursor, QTextDocument
+
+from flag_schema import FlagSchema
+from flag_store import FlagStore
+
+
+def parse_cell(text: str, current: Any) -> Any:
+    """
+    Convert edited cell text to a value of the same JSON type as the old one.
+    
+    Args:
+        text: Text typed into the cell
+        current: Value being replaced
+    
+    Returns:
+        New value
+    
+    Raises:
+        ValueError: If the text does not fit the value's type
+    """
+    if type(current) is str:
+        return text
+    
+    stripped = text.strip()
+    if type(current) is bool:
+        lowered = stripped.lower()
+        if lowered not in ("true", "false"):
+            raise ValueError("expects true/false")
+        return lowered == "true"
+    if type(current) is int:
+        try:
+            return int(stripped)
+        except ValueError:
+            raise ValueError("expects an integer")
+    return json.loads(stripped)
+
+
+def write_value(
+    document: QTextDocument,
+    key: str,
+    old: Any,
+    new: Any,
+    line_hint: int = -1
+) -> bool:
+    """
+    Replace one flag's value in a JSON document without rewriting the rest.
+    
+    Only the characters of the old value change, so a large document is
+    not re-laid out and the edit can be undone in the editor.
+    
+    Args:
+        document: Editor document holding one entry per line
+        key: Flag whose value changed
+        old: Value the document currently holds
+        new: Value to write
+        line_hint: Line (block number) the entry is expected on
+    
+    Returns:
+        True if the value was replaced, False if the entry could not be
+        found on a line of its own (the document is then unchanged)
+    """
+    name = json.dumps(key, ensure_ascii=False)
+    pattern = QRegularExpression("^\\s*" + QRegularExpression.escape(name) + "\\s*:\\s*")
+    
+    cursor = QTextCursor()
+    if line_hint >= 0:
+        # Canonical text has the entry for row r on line r + 1
+        block = document.findBlockByNumber(line_hint)
+        if block.isValid() and pattern.match(block.text()).hasMatch():
+            cursor = document.find(pattern, block.position())
+    if cursor.isNull():
+        cursor = document.find(pattern)
+    if cursor.isNull():
+        return False
+    
+    start = cursor.position()
+    rest = QTextCursor(cursor)
+    rest.setPosition(start)
+    rest.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+    value_text = rest.selectedText().rstrip()
+    if value_text.endswith(","):
+        value_text = value_text[:-1].rstrip()
+    
+    # Only a scalar that parses to the old value is safe to replace
+    try:
+        current = json.loads(value_text)
+    except ValueError:
+        return False
+    if type(current) is not type(old) or current != old:
+        return False
+    
+    # Document positions count UTF-16 code units
+    length = len(value_text.encode("utf-16-le")) // 2
+    cursor.setPosition(start)
+    cursor.setPosition(start + length, QTextCursor.MoveMode.KeepAnchor)
+    cursor.insertText(json.dumps(new, ensure_ascii=False))
+    return True
+
+
+def _value_sort_key(value: Any) -> Tuple[str, Any]:
+    """
+    Sort key giving every JSON value a place in one total order.
+    
+    Values are grouped by type; bools, numbers and strings compare natively
+    and anything else (null, arrays, objects) by its canonical JSON text.
+    """
+    value_type = type(value)
+    if value_type in (bool, int, float, str):
+        return value_type.__name__, value
+    return value_type.__name__, json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+class FlagTableModel(QAbstractTableModel):
+    """
+    Flags as key/type/value rows.
+    
+    Flags are held in a FlagStore rather than lists of objects. Rows are
+    handed to views a batch at a time as they scroll, and a new flag set
+    with the same keys updates only the rows whose values changed.
+    """
+    
+    KEY_COLUMN = 0
+    TYPE_COLUMN = 1
+    VALUE_COLUMN = 2
+    HEADERS = ("Flag", "Type", "Value")
+    
+    FETCH_SIZE = 5000
+    PROBLEM_COLOR = QColor("#ff4444")
+    
+    # Emitted after a value is edited in the table: (key, old value, new value)
+    flag_edited = pyqtSignal(str, object, object)
+    # Emitted when an edited value does not fit the flag: (key, reason)
+    edit_rejected = pyqtSignal(str, str)
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize FlagTableModel.
+        
+        Args:
+            parent: Owning QObject
+        """
+        super().__init__(parent)
+        self._store = FlagStore()
+        self._problems: Dict[str, str] = {}
+        self._loaded = 0
+        self._schema = FlagSchema()
+    
+    def set_flags(self, flags: Dict[str, Any], problems: Iterable[Tuple[str, str]] = ()) -> None:
+        """
+        Show a flag set.
+        
+        Args:
+            flags: Flags in document order
+            problems: (key, problem) tuples from the schema check
+        """
+        store = self._store
+        problems = dict(problems)
+        if not store.same_keys(list(flags)):
+            self.beginResetModel()
+            self._store = FlagStore(flags)
+            self._problems = problems
+            self._loaded = min(len(flags), self.FETCH_SIZE)
+            self.endResetModel()
+            return
+        
+        values = list(flags.values())
+        rows = {
+            row for row, (old, new) in enumerate(zip(store.value_list(), values))
+            if type(old) is not type(new) or old != new
+        }
+        for row in rows:
+            store.set_value(row, values[row])
+        for key in self._problems.keys() | problems.keys():
+            if self._problems.get(key) != problems.get(key):
+                rows.add(store.row_of(key))
+        self._problems = problems
+        
+        rows = [row for row in rows if row < self._loaded]
+        if rows:
+            last_column = len(self.HEADERS) - 1
+            if len(rows) > 100:
+                self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), last_column))
+            else:
+                for row in rows:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+    
+    def store(self) -> FlagStore:
+        """Flags shown, including edits made in the table. Must not be modified."""
+        return self._store
+    
+    def total(self) -> int:
+        """Number of flags, loaded or not."""
+        return len(self._store)
+    
+    def row_of(self, key: str) -> int:
+        """Row of a flag, or -1 if it is not shown."""
+        return self._store.row_of(key)
+    
+    def key(self, row: int) -> str:
+        """Flag name in a row."""
+        return self._store.key(row)
+    
+    def value(self, row: int) -> Any:
+        """Flag value in a row."""
+        return self._store.value(row)
+    
+    def kind(self, row: int) -> Optional[str]:
+        """Flag kind implied by the name's prefix in a row."""
+        return self._store.kind(row)
+    
+    def fetch_all(self) -> None:
+        """Load every remaining row, e.g. before sorting or filtering."""
+        total = len(self._store)
+        if self._loaded < total:
+            self.beginInsertRows(QModelIndex(), self._loaded, total - 1)
+            self._loaded = total
+            self.endInsertRows()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of rows loaded so far."""
+        if parent.isValid():
+            return 0
+        return self._loaded
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Key, type and value."""
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Cell text, problem highlighting and tooltips."""
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            if column == self.KEY_COLUMN:
+                return self._store.key(row)
+            if column == self.TYPE_COLUMN:
+                return self.kind(row) or ""
+            value = self._store.value(row)
+            return value if type(value) is str else json.dumps(value)
+        
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == self.VALUE_COLUMN and self._store.key(row) in self._problems:
+                return self.PROBLEM_COLOR
+            return None
+        
+        if role == Qt.ItemDataRole.ToolTipRole:
+            key = self._store.key(row)
+            problem = self._problems.get(key)
+            if problem:
+                return f"{key} {problem}"
+            if column == self.VALUE_COLUMN:
+                return f"JSON {type(self._store.value(row)).__name__}"
+            return None
+        
+        return None
+    
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        """Column titles."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Only values are editable."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.VALUE_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+    
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """Accept an edited value if it fits the flag's type."""
+        if not index.isValid() or index.column() != self.VALUE_COLUMN or role != Qt.ItemDataRole.EditRole:
+            return False
+        
+        row = index.row()
+        key = self._store.key(row)
+        old = self._store.value(row)
+        try:
+            new = parse_cell(str(value), old)
+        except ValueError as e:
+            self.edit_rejected.emit(key, str(e))
+            return False
+        
+        problems = self._schema.check({key: new})
+        if problems:
+            self.edit_rejected.emit(key, problems[0][1])
+            return False
+        if type(new) is type(old) and new == old:
+            return True
+        
+        self._store.set_value(row, new)
+        self._problems.pop(key, None)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        self.flag_edited.emit(key, old, new)
+        return True
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Whether rows remain to be loaded."""
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._store)
+    
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Load the next batch of rows."""
+        if parent.isValid():
+            return
+        end = min(len(self._store), self._loaded + self.FETCH_SIZE)
+        if end > self._loaded:
+            self.beginInsertRows(QModelIndex(), self._loaded, end - 1)
+            self._loaded = end
+            self.endInsertRows()
+
+
+class FlagFilterProxy(QAbstractProxyModel):
+    """
+    Filters FlagTableModel rows by name and sorts them by any column.
+    
+    Unlike QSortFilterProxyModel, the row mapping is computed in one pass
+    over the model's flag store rather than one callback per row, which keeps
+    filtering and sorting 100k flags interactive. Rows do not move when a
+    value is edited; sorting again picks up the change.
+    """
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize FlagFilterProxy.
+        
+        Args:
+            parent: Owning QObject
+        """
+        super().__init__(parent)
+        # Proxy row -> source row, and the inverse once needed (-1: hidden)
+        self._map: List[int] = []
+        self._reverse: Optional[List[int]] = None
+        self._filter = ""
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._resetting = False
+    
+    def setSourceModel(self, model: FlagTableModel) -> None:
+        """Attach the flag model. Call once."""
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self._on_source_about_to_reset)
+        model.modelReset.connect(self._on_source_reset)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.dataChanged.connect(self._on_data_changed)
+        self._rebuild()
+    
+    def set_filter_text(self, text: str) -> None:
+        """
+        Show only flags whose name contains text, ignoring case.
+        
+        Args:
+            text: Substring to match, empty to show all
+        """
+        text = text.lower()
+        if text != self._filter:
+            self._filter = text
+            self._refresh()
+    
+    def filter_text(self) -> str:
+        """Current name filter, lowercased."""
+        return self._filter
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort by a column; -1 restores document order."""
+        self._sort_column = column
+        self._sort_order = order
+        self._refresh()
+    
+    def mapToSource(self, index: QModelIndex) -> QModelIndex:
+        """Source index for a proxy index."""
+        if not index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self._map[index.row()], index.column())
+    
+    def mapFromSource(self, index: QModelIndex) -> QModelIndex:
+        """Proxy index for a source index, invalid if filtered out."""
+        if not index.isValid():
+            return QModelIndex()
+        reverse = self._reverse_map()
+        row = reverse[index.row()] if index.row() < len(reverse) else -1
+        if row < 0:
+            return QModelIndex()
+        return self.createIndex(row, index.column())
+    
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Index of a proxy cell."""
+        if parent.isValid() or not 0 <= row < len(self._map) or not 0 <= column < self.columnCount():
+            return QModelIndex()
+        return self.createIndex(row, column)
+    
+    def parent(self, index: Optional[QModelIndex] = None) -> Any:
+        """Rows have no parent; without an index, the owning QObject."""
+        if index is None:
+            return QObject.parent(self)
+        return QModelIndex()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of rows passing the filter."""
+        if parent.isValid():
+            return 0
+        return len(self._map)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Same columns as the source."""
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount()
+    
+    def _active(self) -> bool:
+        """Whether filtering or sorting needs every row loaded."""
+        return bool(self._filter) or self._sort_column >= 0
+    
+    def _refresh(self) -> None:
+        """Recompute the mapping after the filter or sort changed."""
+        source = self.sourceModel()
+        if source is not None and self._active() and source.canFetchMore(QModelIndex()):
+            # Loading the rest arrives as rowsInserted, which rebuilds
+            source.fetch_all()
+        else:
+            self._rebuild()
+    
+    def _rebuild(self) -> None:
+        """Reset the proxy with a freshly computed mapping."""
+        self.beginResetModel()
+        self._compute()
+        self.endResetModel()
+    
+    def _compute(self) -> None:
+        """Build the row mapping from the source's flag store."""
+        self._reverse = None
+        source = self.sourceModel()
+        if source is None:
+            self._map = []
+            return
+        
+        store = source.store()
+        count = source.rowCount()
+        rows = range(count)
+        if self._filter:
+            rows = [row for row in store.find_rows(self._filter) if row < count]
+        
+        column = self._sort_column
+        if column >= 0:
+            reverse = self._sort_order == Qt.SortOrder.DescendingOrder
+            if column == FlagTableModel.KEY_COLUMN:
+                sort_key = store.key
+            elif column == FlagTableModel.TYPE_COLUMN:
+                sort_key = lambda row: (source.kind(row) or "", store.key(row))
+            else:
+                values = store.value_list()
+                sort_key = lambda row: _value_sort_key(values[row])
+            rows = sorted(rows, key=sort_key, reverse=reverse)
+        
+        self._map = list(rows)
+    
+    def _reverse_map(self) -> List[int]:
+        """Source row -> proxy row, built on first use after a change."""
+        if self._reverse is None:
+            reverse = [-1] * self.sourceModel().rowCount()
+            for proxy_row, source_row in enumerate(self._map):
+                reverse[source_row] = proxy_row
+            self._reverse = reverse
+        return self._reverse
+    
+    def _on_source_about_to_reset(self) -> None:
+        """Follow the source into a reset."""
+        self._resetting = True
+        self.beginResetModel()
+    
+    def _on_source_reset(self) -> None:
+        """Remap against the new flag set."""
+        source = self.sourceModel()
+        if self._active() and source.canFetchMore(QModelIndex()):
+            source.fetch_all()
+        self._compute()
+        self._resetting = False
+        self.endResetModel()
+    
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        """Show newly loaded rows."""
+        if self._resetting:
+            return
+        if self._active():
+            self._rebuild()
+            return
+        # Unfiltered and unsorted: rows map one to one and arrive in order
+        self.beginInsertRows(QModelIndex(), len(self._map), len(self._map) + last - first)
+        self._map.extend(range(first, last + 1))
+        self._reverse = None
+        self.endInsertRows()
+    
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()) -> None:
+        """Forward value changes for rows that are shown."""
+        if self._resetting:
+            return
+        rows = [
+            index.row() for index in (
+                self.mapFromSource(self.sourceModel().index(row, 0))
+                for row in range(top_left.row(), bottom_right.row() + 1)
+            ) if index.isValid()
+        ]
+        if rows:
+            last_column = self.columnCount() - 1
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), last_column))
@@ -0,0 +1,206 @@
+"""
+JsonCodec - JSON parsing and canonical serialization with optional fast backends
+"""
+import json
+import os
+from typing import Any, Callable, List, Optional, Type
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+# Value types every backend serializes exactly like the stdlib. Floats are
+# excluded because backends format exponents differently (1e+16 vs 1e16).
+_PORTABLE_TYPES = frozenset((str, int, bool, type(None)))
+_STR = frozenset((str,))
+
+# Fast backends turn integers beyond 64 bits into floats at least this large
+_INT64_LIMIT = float(2 ** 63)
+
+
+def _has_wide_float(data: Any) -> bool:
+    """Whether parsed data holds a float outside the 64-bit integer range."""
+    if type(data) is float:
+        return abs(data) >= _INT64_LIMIT
+    if type(data) is dict:
+        data = data.values()
+    elif type(data) is not list:
+        return False
+    if _PORTABLE_TYPES.issuperset(map(type, data)):
+        return False
+    return any(map(_has_wide_float, data))
+
+
+class JsonBackend:
+    """Stdlib json backend; its output defines the canonical form."""
+    
+    name = "json"
+    
+    @staticmethod
+    def available() -> bool:
+        """Whether the backend's module is installed."""
+        return True
+    
+    def loads(self, text: str) -> Any:
+        """Parse JSON text."""
+        return json.loads(text)
+    
+    def dumps_canonical(self, data: Any) -> str:
+        """Serialize as indent=2, non-ASCII preserved."""
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class OrjsonBackend(JsonBackend):
+    """orjson backend."""
+    
+    name = "orjson"
+    
+    @staticmethod
+    def available() -> bool:
+        """Whether the backend's module is installed."""
+        return orjson is not None
+    
+    def loads(self, text: str) -> Any:
+        """Parse JSON text."""
+        return orjson.loads(text)
+    
+    def dumps_canonical(self, data: Any) -> str:
+        """Serialize as indent=2, non-ASCII preserved."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+class UjsonBackend(JsonBackend):
+    """ujson backend."""
+    
+    name = "ujson"
+    
+    @staticmethod
+    def available() -> bool:
+        """Whether the backend's module is installed."""
+        return ujson is not None
+    
+    def loads(self, text: str) -> Any:
+        """Parse JSON text."""
+        return ujson.loads(text)
+    
+    def dumps_canonical(self, data: Any) -> str:
+        """Serialize as indent=2, non-ASCII preserved."""
+        return ujson.dumps(data, indent=2, ensure_ascii=False, escape_forward_slashes=False)
+
+
+# Fast backends in order of preference; the stdlib is always the fallback
+BACKENDS: List[Type[JsonBackend]] = [OrjsonBackend, UjsonBackend, JsonBackend]
+
+
+def available_backends() -> List[str]:
+    """
+    Get the names of installed backends.
+    
+    Returns:
+        Backend names in order of preference
+    """
+    return [backend.name for backend in BACKENDS if backend.available()]
+
+
+class JsonCodec:
+    """Parses and serializes JSON through the fastest installed backend."""
+    
+    # Set to a backend name (e.g. "json") to override the automatic choice
+    BACKEND_ENV = "NOVASTRAP_JSON_BACKEND"
+    
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize JsonCodec.
+        
+        Args:
+            backend: Backend name to use (default: fastest installed)
+        
+        Raises:
+            ValueError: If the named backend is unknown or not installed
+        """
+        backend = backend or os.getenv(self.BACKEND_ENV) or None
+        self._stdlib = JsonBackend()
+        
+        if backend is None:
+            chosen = next(b for b in BACKENDS if b.available())
+        else:
+            chosen = next((b for b in BACKENDS if b.name == backend), None)
+            if chosen is None or not chosen.available():
+                raise ValueError(f"JSON backend not available: {backend}")
+        
+        self.backend = self._stdlib if chosen is JsonBackend else chosen()
+    
+    @property
+    def name(self) -> str:
+        """Name of the active backend."""
+        return self.backend.name
+    
+    def loads(self, text: str, object_pairs_hook: Optional[Callable] = None) -> Any:
+        """
+        Parse JSON text.
+        
+        Args:
+            text: JSON text to parse
+            object_pairs_hook: Optional hook as for json.loads. Only the
+                stdlib supports it, so it forces the stdlib backend.
+        
+        Returns:
+            Parsed data
+        
+        Raises:
+            json.JSONDecodeError: If the text is invalid, as the stdlib reports it
+        """
+        if object_pairs_hook is not None or self.backend is self._stdlib:
+            return json.loads(text, object_pairs_hook=object_pairs_hook)
+        
+        try:
+            data = self.backend.loads(text)
+        except Exception:
+            pass
+        else:
+            # Wider integers may have come back as floats without an error
+            if not _has_wide_float(data):
+                return data
+        # Errors, NaN and oversized integers are left to the stdlib so
+        # results and error messages are the same with every backend
+        return json.loads(text)
+    
+    def dumps_canonical(self, data: Any) -> str:
+        """
+        Serialize data in the canonical indent=2 form.
+        
+        Every backend produces text identical to the stdlib's; data the fast
+        backend cannot reproduce exactly is serialized by the stdlib.
+        
+        Args:
+            data: Data to serialize
+        
+        Returns:
+            Canonical JSON text
+        """
+        if self.backend is not self._stdlib and self._portable(data):
+            try:
+                return self.backend.dumps_canonical(data)
+            except Exception:
+                pass
+        return self._stdlib.dumps_canonical(data)
+    
+    @staticmethod
+    def _portable(data: Any) -> bool:
+        """Whether data is a flat object every backend serializes identically."""
+        return (
+            type(data) is dict
+            and _STR.issuperset(map(type, data))
+            and _PORTABLE_TYPES.issuperset(map(type, data.values()))
+        )
+
+
+# Shared by FileManager and JsonValidator
+default_codec = JsonCodec()
@@ -1,14 +1,314 @@
 """
 JsonValidator - Validates JSON content for FFlag configuration
 """
+import re
 import json
-from typing import Dict, Any, Tuple
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Any, Tuple, Optional, List
+
+from flag_schema import FlagSchema
+from json_codec import JsonBackend, JsonCodec, default_codec
+from tracing import traced
+
+
+# Values that hold no keys of their own
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+_STR_TYPES = frozenset((str,))
+
+
+def _surely_unique_keys(text: str, data: Any) -> bool:
+    """
+    Cheaply prove that parsing text collapsed no duplicate keys.
+    
+    Every key is followed by a colon, and outside strings colons appear
+    nowhere else. So a flat object whose text has no more colons than it
+    has keys, once colons inside its keys and string values are
+    discounted, cannot have lost a key to a duplicate.
+    
+    Args:
+        text: JSON text that was parsed
+        data: Result of parsing it without a hook
+    
+    Returns:
+        True if no key can be duplicated, False if that is not certain
+    """
+    if type(data) is not dict:
+        return False
+    types = set(map(type, data.values()))
+    if not _SCALAR_TYPES.issuperset(types):
+        return False
+    
+    colons = text.count(":")
+    if colons > len(data):
+        # Colons inside strings are not separators
+        if types == _STR_TYPES:
+            values = "".join(data.values())
+        else:
+            values = "".join(v for v in data.values() if type(v) is str)
+        in_strings = "".join(data).count(":") + values.count(":")
+        # A \u escape could decode to a colon the text does not contain
+        if in_strings and "\\u" in text:
+            return False
+        colons -= in_strings
+    return colons <= len(data)
+
+
+def _make_pairs_hook(conflicts: List[Tuple[str, List[str]]]):
+    """
+    Build an object_pairs_hook that records duplicate keys while parsing.
+    
+    Args:
+        conflicts: List that ("duplicate", [key]) tuples are appended to
+    """
+    def hook(pairs):
+        data = dict(pairs)
+        if len(data) != len(pairs):
+            counts = Counter(key for key, _ in pairs)
+            conflicts.extend(("duplicate", [key]) for key, n in counts.items() if n > 1)
+        return data
+    return hook
+
+
+def find_case_collisions(keys: Dict[str, Any]) -> List[Tuple[str, List[str]]]:
+    """
+    Find keys that differ only in letter case.
+    
+    Args:
+        keys: Dictionary (or other sized iterable) of keys
+    
+    Returns:
+        List of ("case", [variants]) tuples
+    """
+    if len(set(map(str.lower, keys))) == len(keys):
+        return []
+    groups: Dict[str, List[str]] = {}
+    for key in keys:
+        groups.setdefault(key.lower(), []).append(key)
+    return [("case", variants) for variants in groups.values() if len(variants) > 1]
+
+
+class _ParseEntry:
+    """Cached outcome of parsing one text. conflicts and problems are None until checked."""
+    
+    __slots__ = (
+        "ok", "data", "error_msg", "error_pos", "conflicts", "problems", "formatted", "cost"
+    )
+    
+    def __init__(self, ok, data, error_msg, error_pos, conflicts, problems):
+        self.ok = ok
+        self.data = data
+        self.error_msg = error_msg
+        self.error_pos = error_pos
+        self.conflicts = conflicts
+        self.problems = problems
+        self.formatted: Optional[str] = None
+        self.cost = 0
+
+
+class ParseCache:
+    """LRU cache of JSON parse results keyed by a hash of the text."""
+    
+    # Parsed objects take several times the memory of their source text
+    DATA_OVERHEAD = 4
+    
+    def __init__(
+        self,
+        max_entries: int = 8,
+        max_bytes: int = 64_000_000,
+        codec: Optional[JsonCodec] = None,
+        schema: Optional[FlagSchema] = None
+    ):
+        """
+        Initialize ParseCache.
+        
+        Args:
+            max_entries: Maximum number of cached documents
+            max_bytes: Approximate memory budget for all cached entries
+            codec: JSON codec to parse and format with (default: shared codec)
+            schema: Schema that checked parses are type-checked with
+        """
+        self.codec = codec or default_codec
+        self.schema = schema or FlagSchema()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, _ParseEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Hash text into a cache key."""
+        return hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+    
+    def parse(self, text: str) -> Tuple[
+        bool, Any, str, int, List[Tuple[str, List[str]]], List[Tuple[str, str]]
+    ]:
+        """
+        Parse JSON text, reusing an earlier parse of identical text.
+        
+        Duplicate keys (in any object), top-level keys differing only in
+        case and top-level flag type problems are detected during the same
+        parse.
+        
+        Args:
+            text: JSON text to parse
+        
+        Returns:
+            Tuple of (is_valid, data, error_message, error_position, conflicts, problems)
+            - conflicts: List of ("duplicate" or "case", [keys]) tuples
+            - problems: (key, problem) tuples from the schema, sorted by key
+            The data is shared between callers and must not be modified.
+        """
+        entry = self._lookup(text, check_conflicts=True)
+        return (
+            entry.ok, entry.data, entry.error_msg, entry.error_pos,
+            entry.conflicts, entry.problems
+        )
+    
+    def formatted(self, text: str) -> Optional[str]:
+        """
+        Get the canonical pretty-printed form of JSON text.
+        
+        Formatting does not need conflict detection, so a miss is parsed by
+        the codec's fastest backend.
+        
+        Args:
+            text: JSON text to format
+        
+        Returns:
+            Formatted text, or None if the text is not valid JSON
+        """
+        key = self._key(text)
+        entry = self._lookup(text, key)
+        if not entry.ok:
+            return None
+        if entry.formatted is None:
+            formatted = self.codec.dumps_canonical(entry.data)
+            with self._lock:
+                if entry.formatted is None:
+                    entry.formatted = formatted
+                    if key in self._entries:
+                        entry.cost += len(formatted)
+                        self._total_bytes += len(formatted)
+                        self._evict()
+        return entry.formatted
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with hits, misses, entries and approximate bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+    
+    def clear(self) -> None:
+        """Drop all cached entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+    
+    def _lookup(
+        self,
+        text: str,
+        key: Optional[bytes] = None,
+        check_conflicts: bool = False
+    ) -> _ParseEntry:
+        """Return the cache entry for text, parsing it on a miss."""
+        if key is None:
+            key = self._key(text)
+        
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and not (check_conflicts and cached.conflicts is None):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        
+        # Parse outside the lock so other threads are not held up
+        try:
+            if check_conflicts:
+                conflicts: List[Tuple[str, List[str]]] = []
+                # A fast backend parses first; only documents it cannot prove
+                # free of duplicates are parsed again with the hook. The
+                # stdlib gains nothing from parsing twice.
+                data = None
+                if self.codec.name != JsonBackend.name:
+                    data = self.codec.loads(text)
+                if data is None or not _surely_unique_keys(text, data):
+                    data = self.codec.loads(text, object_pairs_hook=_make_pairs_hook(conflicts))
+                if isinstance(data, dict):
+                    conflicts.extend(find_case_collisions(data))
+                    # Only the top-level object holds flags
+                    problems = self.schema.check_pairs(data.items())
+                    problems.sort()
+                else:
+                    problems = []
+            else:
+                conflicts = problems = None
+                data = self.codec.loads(text)
+            entry = _ParseEntry(True, data, "", -1, conflicts, problems)
+        except json.JSONDecodeError as e:
+            error_msg = f"Invalid JSON: {e.msg} at line {e.lineno}, column {e.colno}"
+            entry = _ParseEntry(False, None, error_msg, e.pos, [], [])
+        except Exception as e:
+            entry = _ParseEntry(False, None, f"Invalid JSON: {str(e)}", -1, [], [])
+        
+        entry.cost = len(text) * self.DATA_OVERHEAD if entry.ok else 0
+        if entry.cost <= self.max_bytes:
+            with self._lock:
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    # Upgrading an unchecked entry; keep its formatted text
+                    self._total_bytes -= previous.cost
+                    if previous.formatted is not None:
+                        entry.formatted = previous.formatted
+                        entry.cost += len(previous.formatted)
+                self._entries[key] = entry
+                self._total_bytes += entry.cost
+                self._evict()
+        return entry
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries until within limits. Lock must be held."""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.cost
 
 
 class JsonValidator:
     """Validates JSON content for FFlag files."""
     
-    MAX_SIZE = 1_000_000  # 1 MB
+    # Larger documents are checked against the per-entry limits, and larger
+    # files are imported entry by entry instead of read whole
+    STREAM_THRESHOLD = 1_000_000  # 1 MB
+    
+    # Problems listed in the error message before the rest are summarized
+    MAX_REPORTED_PROBLEMS = 5
+    
+    # Shared by all callers so one parse serves validate, format and save
+    schema = FlagSchema()
+    cache = ParseCache(schema=schema)
+    # Last dict found within the per-entry limits; the cache hands out the
+    # same object for identical text, so it is not checked again
+    _within_limits: Optional[Dict[str, Any]] = None
     
     @staticmethod
     def validate(text: str) -> Tuple[bool, str, Dict[str, Any]]:
@@ -24,30 +324,193 @@ class JsonValidator:
             - error_message: Empty string if valid, error message otherwise
             - parsed_data: Parsed JSON dict if valid, empty dict otherwise
         """
+        is_valid, error_msg, data, _ = JsonValidator.validate_with_position(text)
+        return is_valid, error_msg, data
+    
+    @staticmethod
+    @traced()
+    def validate_with_position(text: str) -> Tuple[bool, str, Dict[str, Any], int]:
+        """
+        Validate JSON text and report where the error is.
+        
+        Args:
+            text: JSON text to validate
+        
+        Returns:
+            Tuple of (is_valid, error_message, parsed_data, error_position)
+            - error_position: Character offset of the syntax error, or -1 if
+              valid or the error has no position
+        """
         # Check if empty
         if not text or not text.strip():
-            return False, "JSON content is empty", {}
+            return False, "JSON content is empty", {}, -1
         
-        # Check size
-        if len(text) > JsonValidator.MAX_SIZE:
-            return False, f"JSON too large (max {JsonValidator.MAX_SIZE} bytes)", {}
+        ok, data, error_msg, error_pos, conflicts, problems = JsonValidator._parse_object(text)
+        if not ok:
+            return False, error_msg, {}, error_pos
         
-        # Parse JSON
-        try:
-            data = json.loads(text)
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON: {e.msg} at line {e.lineno}, column {e.colno}"
-            return False, error_msg, {}
-        except Exception as e:
-            return False, f"Invalid JSON: {str(e)}", {}
+        # Duplicate keys would silently collapse to the last value
+        if conflicts:
+            error_msg, error_pos = JsonValidator.describe_conflicts(text, conflicts)
+            return False, error_msg, {}, error_pos
+        
+        # Flag value types were checked against their prefixes while parsing
+        if problems:
+            return False, JsonValidator.describe_problems(problems), {}, text.find(f'"{problems[0][0]}"')
+        
+        return True, "", data, -1
+    
+    @staticmethod
+    def parse_flags(text: str) -> Tuple[Optional[Dict[str, Any]], List[Tuple[str, str]]]:
+        """
+        Parse flags even if some values have the wrong type for their prefix.
+        
+        Args:
+            text: JSON text to parse
+        
+        Returns:
+            Tuple of (flags, problems)
+            - flags: Parsed dict, empty for empty text, None if the text is
+              not a JSON object or has duplicate or case-variant keys
+            - problems: (key, problem) tuples from the schema check
+        """
+        if not text or not text.strip():
+            return {}, []
+        ok, data, _, _, conflicts, problems = JsonValidator._parse_object(text)
+        if not ok or conflicts:
+            return None, []
+        return data, problems
+    
+    @staticmethod
+    def _parse_object(text: str) -> Tuple[
+        bool, Any, str, int, List[Tuple[str, List[str]]], List[Tuple[str, str]]
+    ]:
+        """
+        Parse text that must hold a JSON object.
+        
+        Returns:
+            Tuple of (ok, data, error_message, error_position, conflicts, problems)
+        """
+        ok, data, error_msg, error_pos, conflicts, problems = JsonValidator.cache.parse(text)
+        if not ok:
+            return False, None, error_msg, error_pos, [], []
         
         # Check that it's an object (dict)
         if not isinstance(data, dict):
-            return False, "Top-level JSON must be an object ({})", {}
+            return False, None, "Top-level JSON must be an object ({})", -1, [], []
+        
+        # Large documents get the same per-entry limits as streamed imports
+        if len(text) > JsonValidator.STREAM_THRESHOLD:
+            error = JsonValidator.check_entry_limits(text, data)
+            if error is not None:
+                return False, None, error[0], error[1], [], []
+        return True, data, "", -1, conflicts, problems
+    
+    @staticmethod
+    def check_entry_limits(text: str, data: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+        """
+        Check parsed flags against the StreamValidator per-entry limits.
+        
+        Args:
+            text: JSON text the flags were parsed from
+            data: Parsed top-level object
+        
+        Returns:
+            Tuple of (error_message, position of the offending key), or None
+            if every entry is within the limits. The dict must not be
+            modified afterwards, as a pass is remembered for it.
+        """
+        if data is JsonValidator._within_limits:
+            return None
+        
+        from stream_validator import StreamValidator
+        
+        max_key = StreamValidator.MAX_KEY_LENGTH
+        max_entry = StreamValidator.MAX_ENTRY_SIZE
+        for key, value in data.items():
+            value_type = type(value)
+            if value_type is str:
+                size = len(value)
+            elif value_type is dict or value_type is list:
+                size = len(json.dumps(value, ensure_ascii=False))
+            else:
+                size = 0
+            
+            if len(key) > max_key:
+                problem = f"Key too long (max {max_key} characters)"
+            elif len(key) + size > max_entry:
+                problem = f"Entry too large (max {max_entry} characters)"
+            else:
+                continue
+            pos = text.find(json.dumps(key, ensure_ascii=False))
+            line = text.count("\n", 0, pos) + 1
+            column = pos - text.rfind("\n", 0, pos)
+            return f"Invalid JSON: {problem} at line {line}, column {column}", pos
+        
+        JsonValidator._within_limits = data
+        return None
+    
+    @staticmethod
+    def describe_conflicts(text: str, conflicts: List[Tuple[str, List[str]]]) -> Tuple[str, int]:
+        """
+        Summarize duplicate and case-variant keys with their line numbers.
+        
+        Args:
+            text: JSON text the conflicts were found in
+            conflicts: List of ("duplicate" or "case", [keys]) tuples
+        
+        Returns:
+            Tuple of (error_message, position of the first conflicting key)
+        """
+        details = []
+        first_pos = -1
+        for kind, keys in conflicts[:JsonValidator.MAX_REPORTED_PROBLEMS]:
+            pattern = re.compile(
+                re.escape(json.dumps(keys[0], ensure_ascii=False)) + r"\s*:",
+                re.IGNORECASE if kind == "case" else 0
+            )
+            positions = [m.start() for m in pattern.finditer(text)]
+            if positions and (first_pos < 0 or positions[0] < first_pos):
+                first_pos = positions[0]
+            
+            # Count newlines incrementally between successive matches
+            lines = []
+            line = 1
+            previous = 0
+            for pos in positions:
+                line += text.count("\n", previous, pos)
+                previous = pos
+                lines.append(str(line))
+            where = f" on lines {', '.join(lines)}" if lines else ""
+            
+            if kind == "duplicate":
+                details.append(f"duplicate key {keys[0]}{where}")
+            else:
+                details.append(f"keys differing only in case {' / '.join(keys)}{where}")
         
-        return True, "", data
+        if len(conflicts) > JsonValidator.MAX_REPORTED_PROBLEMS:
+            details.append(f"and {len(conflicts) - JsonValidator.MAX_REPORTED_PROBLEMS} more")
+        return f"Conflicting keys ({len(conflicts)}): {'; '.join(details)}", first_pos
     
     @staticmethod
+    def describe_problems(problems: List[Tuple[str, str]]) -> str:
+        """
+        Summarize flag type problems in one message.
+        
+        Args:
+            problems: List of (key, problem) tuples from FlagSchema.check
+        
+        Returns:
+            Human-readable error message
+        """
+        shown = problems[:JsonValidator.MAX_REPORTED_PROBLEMS]
+        details = "; ".join(f"{key} {problem}" for key, problem in shown)
+        if len(problems) > len(shown):
+            details += f"; and {len(problems) - len(shown)} more"
+        return f"Wrong flag value types ({len(problems)}): {details}"
+    
+    @staticmethod
+    @traced()
     def format_json(text: str) -> str:
         """
         Format/prettify JSON text.
@@ -58,9 +521,6 @@ class JsonValidator:
         Returns:
             Formatted JSON text, or original text if parsing fails
         """
-        try:
-            data = json.loads(text)
-            return json.dumps(data, indent=2, ensure_ascii=False)
-        except Exception:
-            return text
+        formatted = JsonValidator.cache.formatted(text)
+        return text if formatted is None else formatted
 
@@ -0,0 +1,255 @@
+"""
+LaunchScheduler - Starts several Roblox clients, each with its own flag profile
+"""
+import json
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import psutil
+
+from file_manager import FileManager
+from roblox_launcher import RobloxLauncher
+
+
+class InstanceSpec(NamedTuple):
+    """What to launch for one instance."""
+    
+    name: str
+    place_id: Optional[int] = None
+    # Flags the instance must start with; None uses whatever is applied
+    flags: Optional[Dict[str, Any]] = None
+    args: Sequence[str] = ()
+
+
+class InstanceResult:
+    """Outcome and timings of one launched instance."""
+    
+    STATUS_PENDING = "pending"
+    STATUS_READY = "ready"
+    STATUS_EXITED = "exited"
+    STATUS_TIMEOUT = "timeout"
+    STATUS_FAILED = "failed"
+    
+    def __init__(self, name: str):
+        """
+        Initialize InstanceResult.
+        
+        Args:
+            name: Instance name from its InstanceSpec
+        """
+        self.name = name
+        self.status = self.STATUS_PENDING
+        self.process = None
+        self.pid: Optional[int] = None
+        self.spawn_ms: Optional[float] = None
+        self.ready_ms: Optional[float] = None
+        self.exit_code: Optional[int] = None
+        self.error = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Result as a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "status": self.status,
+            "pid": self.pid,
+            "spawn_ms": self.spawn_ms,
+            "ready_ms": self.ready_ms,
+            "exit_code": self.exit_code,
+            "error": self.error,
+        }
+
+
+class LaunchScheduler:
+    """
+    Launches a batch of instances with a concurrency limit.
+    
+    Clients read the shared settings file while starting, so a profile stays
+    applied until every instance started with it is ready; instances that
+    share a profile start in parallel, others wait their turn.
+    """
+    
+    # A client counts as started once its memory passes this
+    READY_RSS_BYTES = 100 * 1024 * 1024
+    STARTUP_TIMEOUT = 60.0
+    POLL_INTERVAL = 0.05
+    # Seconds a terminated client gets to exit before it is killed
+    STOP_TIMEOUT = 5.0
+    
+    def __init__(
+        self,
+        file_manager: FileManager,
+        max_concurrent: int = 2,
+        stagger: float = 0.0,
+        wait_exit: bool = True,
+        ready_rss_bytes: int = READY_RSS_BYTES,
+        startup_timeout: float = STARTUP_TIMEOUT,
+        player_exe: Optional[Path] = None,
+        player_args: Sequence[str] = ()
+    ):
+        """
+        Initialize LaunchScheduler.
+        
+        Args:
+            file_manager: File manager for the settings file clients read
+            max_concurrent: Maximum instances in flight; with wait_exit an
+                instance occupies its slot until it exits
+            stagger: Minimum seconds between consecutive starts
+            wait_exit: Wait for every started instance to exit and record exit
+                codes; instances that time out are always stopped
+            ready_rss_bytes: Memory at which an instance counts as started
+            startup_timeout: Seconds to wait for an instance to start
+            player_exe: Client executable (default: installed Roblox player)
+            player_args: Extra arguments for every instance
+        """
+        self.file_manager = file_manager
+        self.max_concurrent = max(1, max_concurrent)
+        self.stagger = stagger
+        self.wait_exit = wait_exit
+        self.ready_rss_bytes = ready_rss_bytes
+        self.startup_timeout = startup_timeout
+        self.player_exe = player_exe
+        self.player_args = list(player_args)
+        
+        self._cond = threading.Condition()
+        # Canonical text of the applied profile and instances starting with it
+        self._applied: Optional[str] = None
+        self._starting = 0
+        self._next_start = 0.0
+        self._start_lock = threading.Lock()
+        self.results: List[InstanceResult] = []
+    
+    def run(self, specs: Sequence[InstanceSpec]) -> List[InstanceResult]:
+        """
+        Launch every instance and restore the settings file afterwards.
+        
+        Args:
+            specs: Instances to launch, started in this order as slots free up
+        
+        Returns:
+            One result per spec, in the same order
+        
+        Raises:
+            Exception: If flags are to be applied but the existing settings
+                file cannot be read, so it could not be restored afterwards
+        """
+        self.results = [InstanceResult(spec.name) for spec in specs]
+        applies_flags = any(spec.flags is not None for spec in specs)
+        # Raises if the file exists but is unreadable, before anything changes
+        original = self.file_manager.snapshot() if applies_flags else None
+        try:
+            with ThreadPoolExecutor(self.max_concurrent, thread_name_prefix="Launch") as pool:
+                for spec, result in zip(specs, self.results):
+                    pool.submit(self._run_instance, spec, result)
+        finally:
+            if applies_flags:
+                self.file_manager.restore_snapshot(original)
+        return self.results
+    
+    def stop_all(self) -> None:
+        """Terminate every instance from the last run that is still running."""
+        for result in self.results:
+            if result.process is not None and result.process.poll() is None:
+                self._stop(result.process)
+    
+    def _stop(self, process) -> int:
+        """Terminate a client, killing it if it does not exit in time."""
+        process.terminate()
+        try:
+            return process.wait(timeout=self.STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            return process.wait(timeout=self.STOP_TIMEOUT)
+    
+    def _run_instance(self, spec: InstanceSpec, result: InstanceResult) -> None:
+        """Worker: apply the profile, start the client and wait for startup."""
+        try:
+            self._acquire_profile(spec.flags)
+        except Exception as e:
+            result.status = InstanceResult.STATUS_FAILED
+            result.error = f"Failed to apply flags: {e}"
+            return
+        
+        try:
+            self._wait_stagger()
+            start = time.perf_counter()
+            process = RobloxLauncher.start_player(
+                spec.place_id, self.player_exe, [*self.player_args, *spec.args]
+            )
+            result.spawn_ms = (time.perf_counter() - start) * 1000
+            result.process = process
+            result.pid = process.pid
+            self._wait_ready(process, start, result)
+        except Exception as e:
+            result.status = InstanceResult.STATUS_FAILED
+            result.error = str(e)
+            return
+        finally:
+            self._release_profile(spec.flags)
+        
+        if result.status == InstanceResult.STATUS_TIMEOUT:
+            # Never started; stop it rather than wait on a hung client
+            try:
+                result.exit_code = self._stop(result.process)
+            except Exception as e:
+                result.error = f"Failed to stop client: {e}"
+        elif self.wait_exit and result.exit_code is None:
+            result.exit_code = result.process.wait()
+            result.status = InstanceResult.STATUS_EXITED
+    
+    def _acquire_profile(self, flags: Optional[Dict[str, Any]]) -> None:
+        """Wait until flags can be applied, then apply them if needed."""
+        if flags is None:
+            return
+        key = json.dumps(flags, sort_keys=True)
+        with self._cond:
+            while self._starting and self._applied != key:
+                self._cond.wait()
+            if self._applied != key:
+                self.file_manager.atomic_write_json(flags)
+                self._applied = key
+            self._starting += 1
+    
+    def _release_profile(self, flags: Optional[Dict[str, Any]]) -> None:
+        """Note that an instance using flags has finished starting."""
+        if flags is None:
+            return
+        with self._cond:
+            self._starting -= 1
+            self._cond.notify_all()
+    
+    def _wait_stagger(self) -> None:
+        """Keep consecutive starts at least `stagger` seconds apart."""
+        with self._start_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self.stagger
+        if start_at > now:
+            time.sleep(start_at - now)
+    
+    def _wait_ready(self, process, start: float, result: InstanceResult) -> None:
+        """Poll until the client starts, exits or times out."""
+        deadline = start + self.startup_timeout
+        try:
+            watched = psutil.Process(process.pid)
+        except psutil.NoSuchProcess:
+            # Already gone; poll() reports how it exited
+            watched = None
+        while time.perf_counter() < deadline:
+            code = process.poll()
+            if code is not None:
+                result.exit_code = code
+                result.status = InstanceResult.STATUS_EXITED
+                return
+            try:
+                if watched is not None and watched.memory_info().rss >= self.ready_rss_bytes:
+                    result.ready_ms = (time.perf_counter() - start) * 1000
+                    result.status = InstanceResult.STATUS_READY
+                    return
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+            time.sleep(self.POLL_INTERVAL)
+        result.status = InstanceResult.STATUS_TIMEOUT
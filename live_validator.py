@@ -0,0 +1,104 @@
+"""
+LiveValidator - Debounced background validation of the editor document
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QTextDocument
+
+from json_validator import JsonValidator
+
+
+ValidationResult = Tuple[bool, str, Dict[str, Any], int]
+
+
+class LiveValidator(QObject):
+    """Validates the editor text off the UI thread after typing pauses."""
+    
+    DEBOUNCE_MS = 400
+    
+    # Emitted on the UI thread with (is_valid, error_message, error_position)
+    validated = pyqtSignal(bool, str, int)
+    
+    # Internal hand-off from the worker thread: (generation, result)
+    _finished = pyqtSignal(int, object)
+    
+    def __init__(self, document: QTextDocument, parent: Optional[QObject] = None):
+        """
+        Initialize LiveValidator.
+        
+        Args:
+            document: Editor document to validate
+            parent: Owning QObject
+        """
+        super().__init__(parent)
+        self.document = document
+        
+        # Bumped on every edit; results from older generations are stale
+        self._generation = 0
+        self._result_generation = -1
+        self._result: Optional[ValidationResult] = None
+        
+        # One worker is enough: a newer job always supersedes a queued one
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._start_validation)
+        
+        self._finished.connect(self._on_finished)
+    
+    def schedule(self) -> None:
+        """Note an edit and restart the debounce timer."""
+        self._generation += 1
+        self._timer.start()
+    
+    def latest_result(self) -> Optional[ValidationResult]:
+        """
+        Get the validation result for the current document text.
+        
+        Returns:
+            Tuple of (is_valid, error_message, parsed_data, error_position),
+            or None if the text changed since the last validation
+        """
+        if self._result_generation == self._generation:
+            return self._result
+        return None
+    
+    def remember(self, result: ValidationResult) -> None:
+        """
+        Store a result computed on the UI thread for the current text.
+        
+        Args:
+            result: Result of JsonValidator.validate_with_position
+        """
+        self._timer.stop()
+        self._result = result
+        self._result_generation = self._generation
+    
+    def _start_validation(self) -> None:
+        """Capture the text and hand it to the worker thread."""
+        generation = self._generation
+        text = self.document.toPlainText()
+        self._pool.clear()
+        self._pool.start(lambda: self._run(generation, text))
+    
+    def _run(self, generation: int, text: str) -> None:
+        """Worker thread body."""
+        try:
+            result = JsonValidator.validate_with_position(text)
+        except Exception as e:
+            result = (False, f"Validation failed: {e}", {}, -1)
+        self._finished.emit(generation, result)
+    
+    def _on_finished(self, generation: int, result: ValidationResult) -> None:
+        """Accept a worker result unless newer edits arrived meanwhile."""
+        if generation != self._generation:
+            return
+        
+        self._result = result
+        self._result_generation = generation
+        is_valid, error_msg, _, error_pos = result
+        self.validated.emit(is_valid, error_msg, error_pos)
@@ -0,0 +1,351 @@
+"""
+LogReader - Reads the end, pages and time ranges of large log files
+"""
+import bisect
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+
+# Log lines start with "YYYY-MM-DD HH:MM:SS"; see AppLogger's formatter
+TIMESTAMP_LENGTH = 19
+
+TimeBound = Union[str, datetime]
+
+
+def line_timestamp(line: bytes) -> Optional[bytes]:
+    """
+    Get the timestamp a log line starts with.
+    
+    Returns:
+        The timestamp as bytes, which sort chronologically, or None for
+        continuation lines such as tracebacks
+    """
+    stamp = line[:TIMESTAMP_LENGTH]
+    if (
+        len(stamp) == TIMESTAMP_LENGTH
+        and stamp[4:5] == b"-" and stamp[10:11] == b" " and stamp[13:14] == b":"
+        and stamp[:4].isdigit()
+    ):
+        return stamp
+    return None
+
+
+class LogReader:
+    """
+    Reads parts of a log file without reading the whole file.
+    
+    The last lines, and pages going backwards from any point, are found by
+    reading blocks backwards from the end. An optional sidecar index of the
+    byte offset and timestamp of every INDEX_STRIDE-th line adds paging by
+    line number and time-range lookups.
+    """
+    
+    BLOCK_SIZE = 64 * 1024
+    INDEX_STRIDE = 1000
+    INDEX_SUFFIX = ".idx"
+    
+    # Byte offset, then the line's timestamp (blank if it has none)
+    RECORD_FORMAT = "{:016d} {:19s}\n"
+    RECORD_SIZE = 16 + 1 + TIMESTAMP_LENGTH + 1
+    
+    def __init__(self, path: Path, use_index: bool = False, block_size: int = BLOCK_SIZE):
+        """
+        Initialize LogReader.
+        
+        Args:
+            path: Log file
+            use_index: Keep a sidecar index (path + ".idx") for line-number
+                paging and time ranges
+            block_size: Bytes read per block
+        """
+        self.path = path
+        self.use_index = use_index
+        self.block_size = block_size
+        # Index records as (offset, timestamp) and the state of the last scan
+        self._records: List[Tuple[int, bytes]] = []
+        self._line_count = 0
+        self._scanned = 0
+    
+    @property
+    def index_path(self) -> Path:
+        """Path of the sidecar index."""
+        return self.path.with_name(self.path.name + self.INDEX_SUFFIX)
+    
+    def tail(self, count: int) -> List[str]:
+        """
+        Get the last lines of the log.
+        
+        Args:
+            count: Number of lines
+        
+        Returns:
+            Up to count lines, oldest first, each ending with its newline
+        """
+        return self.lines_before(None, count)[0]
+    
+    def lines_before(self, end: Optional[int], count: int) -> Tuple[List[str], int]:
+        """
+        Get the lines that end at a byte offset, for paging backwards.
+        
+        Args:
+            end: Byte offset the last line ends at (None: end of file); pass
+                the returned offset to get the previous page
+            count: Number of lines
+        
+        Returns:
+            Tuple of (lines, offset of the first returned line); the offset
+            is 0 once the start of the file is reached
+        """
+        if count <= 0:
+            return [], end or 0
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return [], 0
+        
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            end = size if end is None else min(end, size)
+            
+            # Read blocks backwards until count line breaks precede the last
+            # line (a newline ending the range does not start a line)
+            chunks = []
+            newlines = 0
+            trailing = 0
+            pos = end
+            while pos > 0 and newlines - trailing < count:
+                step = min(self.block_size, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                if not chunks and chunk.endswith(b"\n"):
+                    trailing = 1
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+        
+        buf = b"".join(reversed(chunks))
+        start = len(buf) - trailing
+        for _ in range(count):
+            newline = buf.rfind(b"\n", 0, start)
+            if newline < 0:
+                # Fewer lines than requested; only possible when pos is 0
+                start = 0
+                break
+            start = newline
+        else:
+            start += 1
+        
+        return self._decode_lines(buf[start:]), pos + start
+    
+    def update_index(self) -> int:
+        """
+        Bring the sidecar index up to date with the log.
+        
+        Only text appended since the last update is scanned. The index is
+        rebuilt if the log was truncated or replaced.
+        
+        Returns:
+            Number of lines in the log
+        """
+        if not self._records:
+            self._load_index()
+        
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self._scanned or not self._index_matches_log():
+            self._records = []
+            self._line_count = 0
+            self._scanned = 0
+            self.index_path.unlink(missing_ok=True)
+        if size == self._scanned and self._records:
+            return self._line_count
+        
+        # Resume at the last indexed line and count lines from there
+        if self._records:
+            offset = self._records[-1][0]
+            line_no = (len(self._records) - 1) * self.INDEX_STRIDE
+        else:
+            offset = 0
+            line_no = 0
+        
+        new_records = []
+        last_stamp = self._records[-1][1] if self._records else b""
+        for line_offset, line in self._iter_lines(offset):
+            stamp = line_timestamp(line)
+            if stamp is not None:
+                last_stamp = stamp
+            if line_no % self.INDEX_STRIDE == 0 and line_no // self.INDEX_STRIDE >= len(self._records):
+                new_records.append((line_offset, last_stamp))
+                self._records.append((line_offset, last_stamp))
+            line_no += 1
+            self._scanned = line_offset + len(line)
+        
+        self._line_count = line_no
+        if new_records:
+            with open(self.index_path, "ab") as f:
+                for record_offset, stamp in new_records:
+                    f.write(self.RECORD_FORMAT.format(record_offset, stamp.decode("ascii")).encode("ascii"))
+        return self._line_count
+    
+    def line_count(self) -> int:
+        """Number of lines in the log (updates the index)."""
+        return self.update_index()
+    
+    def read_lines(self, start: int, count: int) -> List[str]:
+        """
+        Get lines by line number, for paging forwards.
+        
+        Args:
+            start: Number of the first line (0-based)
+            count: Number of lines
+        
+        Returns:
+            Up to count lines, each ending with its newline
+        """
+        self.update_index()
+        if start >= self._line_count or count <= 0:
+            return []
+        record = start // self.INDEX_STRIDE
+        skip = start - record * self.INDEX_STRIDE
+        
+        lines = []
+        for _, line in self._iter_lines(self._records[record][0]):
+            if skip:
+                skip -= 1
+                continue
+            lines.append(line)
+            if len(lines) == count:
+                break
+        return self._decode_lines(b"".join(lines))
+    
+    def lines_between(self, start: TimeBound, end: TimeBound) -> List[str]:
+        """
+        Get the lines logged within a time range.
+        
+        Continuation lines belong to the timestamped line before them.
+        
+        Args:
+            start: Earliest time, inclusive
+            end: Latest time, inclusive
+        
+        Returns:
+            Lines in the range, oldest first
+        """
+        low = self._bound(start)
+        high = self._bound(end)
+        
+        if self.use_index:
+            self.update_index()
+            stamps = [stamp for _, stamp in self._records]
+            # Last indexed line strictly before the range; the range starts after it
+            record = max(bisect.bisect_left(stamps, low) - 1, 0)
+            offset = self._records[record][0] if self._records else 0
+        else:
+            offset = self._offset_before(low)
+        
+        lines = []
+        stamp = b""
+        for _, line in self._iter_lines(offset):
+            found = line_timestamp(line)
+            if found is not None:
+                stamp = found
+            if stamp > high:
+                break
+            if stamp >= low:
+                lines.append(line)
+        return self._decode_lines(b"".join(lines))
+    
+    def _offset_before(self, low: bytes) -> int:
+        """Page backwards to an offset whose line is logged before low."""
+        offset = None
+        while offset != 0:
+            lines, offset = self.lines_before(offset, self.INDEX_STRIDE)
+            stamps = [line_timestamp(line.encode("utf-8")) for line in lines]
+            if any(stamp is not None and stamp < low for stamp in stamps):
+                break
+        return offset or 0
+    
+    def _iter_lines(self, offset: int) -> Iterator[Tuple[int, bytes]]:
+        """Yield (offset, line with newline) from a byte offset to the end."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(offset)
+            pending = b""
+            while True:
+                chunk = f.read(self.block_size)
+                if not chunk:
+                    break
+                buf = pending + chunk
+                begin = 0
+                while True:
+                    newline = buf.find(b"\n", begin)
+                    if newline < 0:
+                        break
+                    yield offset, buf[begin:newline + 1]
+                    offset += newline + 1 - begin
+                    begin = newline + 1
+                pending = buf[begin:]
+            if pending:
+                yield offset, pending
+    
+    def _load_index(self) -> None:
+        """Read the sidecar index, ignoring a torn final record."""
+        try:
+            data = self.index_path.read_bytes()
+        except FileNotFoundError:
+            return
+        records = []
+        for i in range(0, len(data) - self.RECORD_SIZE + 1, self.RECORD_SIZE):
+            record = data[i:i + self.RECORD_SIZE]
+            try:
+                offset = int(record[:16])
+            except ValueError:
+                break
+            records.append((offset, record[17:17 + TIMESTAMP_LENGTH].rstrip()))
+        if len(data) % self.RECORD_SIZE:
+            # Drop the torn record so later appends stay aligned
+            with open(self.index_path, "r+b") as f:
+                f.truncate(len(records) * self.RECORD_SIZE)
+        
+        self._records = records
+        if records:
+            # Everything up to the last record is known; the rest is rescanned
+            self._scanned = records[-1][0]
+            self._line_count = (len(records) - 1) * self.INDEX_STRIDE
+    
+    def _index_matches_log(self) -> bool:
+        """Check that the first record still describes the log's first line."""
+        if not self._records:
+            return True
+        try:
+            with open(self.path, "rb") as f:
+                head = f.read(TIMESTAMP_LENGTH)
+        except FileNotFoundError:
+            return False
+        return self._records[0] == (0, line_timestamp(head) or b"")
+    
+    @staticmethod
+    def _bound(value: TimeBound) -> bytes:
+        """Convert a time bound to the log's timestamp format."""
+        if isinstance(value, datetime):
+            value = value.strftime("%Y-%m-%d %H:%M:%S")
+        return value.encode("ascii")
+    
+    @staticmethod
+    def _decode_lines(data: bytes) -> List[str]:
+        """Split bytes into decoded lines that keep their newline."""
+        if not data:
+            return []
+        text = data.decode("utf-8", errors="replace")
+        lines = text.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+            return [line + "\n" for line in lines]
+        return [line + "\n" for line in lines[:-1]] + [lines[-1]]
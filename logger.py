@@ -1,19 +1,122 @@
 """
 Logger - Handles application logging
 """
+import atexit
+import gzip
 import logging
+import os
+import queue
+import shutil
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
+
+from log_reader import LogReader, line_timestamp
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """Rotates by size or age and gzips rotated segments (log.1.gz, log.2.gz, ...)."""
+    
+    def __init__(
+        self,
+        filename: Path,
+        max_bytes: int,
+        max_age_seconds: float,
+        backup_count: int
+    ):
+        """
+        Initialize CompressingRotatingFileHandler.
+        
+        Args:
+            filename: Log file
+            max_bytes: Rotate once the file would exceed this size
+            max_age_seconds: Rotate once the file's first record is this old
+            backup_count: Number of compressed segments to keep
+        """
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.max_age_seconds = max_age_seconds
+        self.rotations = 0
+        self.namer = lambda name: name + ".gz"
+        self.rotator = self._compress
+        self._started = self._first_record_time()
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Rotate on size, or when the oldest record in the file is too old."""
+        if super().shouldRollover(record):
+            return True
+        return record.created - self._started >= self.max_age_seconds and self.stream.tell() > 0
+    
+    def doRollover(self) -> None:
+        """Rotate, then start the age clock for the new file."""
+        super().doRollover()
+        self.rotations += 1
+        self._started = time.time()
+    
+    @staticmethod
+    def _compress(source: str, dest: str) -> None:
+        """Gzip the full log into a rotated segment and remove the original."""
+        with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+    
+    def _first_record_time(self) -> float:
+        """Time of the first record already in the file, or now if empty."""
+        try:
+            with open(self.baseFilename, "rb") as f:
+                stamp = line_timestamp(f.read(32))
+            if stamp is not None:
+                return time.mktime(time.strptime(stamp.decode("ascii"), "%Y-%m-%d %H:%M:%S"))
+        except (OSError, ValueError):
+            pass
+        return time.time()
+
+
+class CountingQueueHandler(QueueHandler):
+    """Queue handler that drops records when the queue is full and counts them."""
+    
+    def __init__(self, log_queue: queue.Queue):
+        """
+        Initialize CountingQueueHandler.
+        
+        Args:
+            log_queue: Bounded queue read by the writer thread
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record without blocking the caller."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class DrainingQueueListener(QueueListener):
+    """Queue listener whose stop() always gets its sentinel in, even when the queue is full."""
+    
+    def enqueue_sentinel(self) -> None:
+        """Block until the sentinel fits, so every queued record is written first."""
+        self.queue.put(self._sentinel)
 
 
 class AppLogger:
     """Application logger for FFlag Editor."""
     
+    MAX_BYTES = 5 * 1024 * 1024
+    MAX_AGE_SECONDS = 7 * 24 * 3600
+    BACKUP_COUNT = 5
+    QUEUE_SIZE = 10000
+    
     def __init__(self, log_file: Optional[Path] = None):
         """
         Initialize logger.
         
+        Records are handed to a queue and written by a background thread,
+        so logging never waits for the disk.
+        
         Args:
             log_file: Path to log file (default: fflag_editor.log in current directory)
         """
@@ -21,24 +124,37 @@ class AppLogger:
             log_file = Path("fflag_editor.log")
         
         self.log_file = log_file
+        self.reader = LogReader(self.log_file)
         self.logger = logging.getLogger("FFlagEditor")
         self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
         
         # Remove existing handlers
         self.logger.handlers.clear()
         
-        # File handler
-        file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
-        file_handler.setLevel(logging.INFO)
+        # File handler, run by the writer thread
+        self.file_handler = CompressingRotatingFileHandler(
+            self.log_file,
+            max_bytes=self.MAX_BYTES,
+            max_age_seconds=self.MAX_AGE_SECONDS,
+            backup_count=self.BACKUP_COUNT
+        )
+        self.file_handler.setLevel(logging.INFO)
         
         # Formatter
         formatter = logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        file_handler.setFormatter(formatter)
+        self.file_handler.setFormatter(formatter)
+        
+        self.queue: queue.Queue = queue.Queue(self.QUEUE_SIZE)
+        self.queue_handler = CountingQueueHandler(self.queue)
+        self.logger.addHandler(self.queue_handler)
         
-        self.logger.addHandler(file_handler)
+        self.listener = DrainingQueueListener(self.queue, self.file_handler)
+        self.listener.start()
+        atexit.register(self.shutdown)
     
     def info(self, message: str) -> None:
         """Log info message."""
@@ -56,6 +172,30 @@ class AppLogger:
         """Log success message (as info)."""
         self.logger.info(f"SUCCESS: {message}")
     
+    def stats(self) -> Dict[str, int]:
+        """
+        Get logging counters.
+        
+        Returns:
+            Dictionary with queue_depth (records waiting to be written),
+            dropped (records lost to a full queue) and rotations
+        """
+        return {
+            "queue_depth": self.queue.qsize(),
+            "dropped": self.queue_handler.dropped,
+            "rotations": self.file_handler.rotations,
+        }
+    
+    def shutdown(self) -> None:
+        """Write every queued record, then stop the writer thread and close the file."""
+        if self.listener is None:
+            return
+        self.logger.removeHandler(self.queue_handler)
+        self.listener.stop()
+        self.listener = None
+        self.file_handler.close()
+        atexit.unregister(self.shutdown)
+    
     def get_recent_logs(self, lines: int = 100) -> str:
         """
         Get recent log entries.
@@ -70,20 +210,19 @@ class AppLogger:
             if not self.log_file.exists():
                 return "No logs available"
             
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                recent = all_lines[-lines:] if len(all_lines) > lines else all_lines
-                return ''.join(recent)
+            # Reads backwards from the end, so cost does not grow with the log
+            return ''.join(self.reader.tail(lines))
         except Exception as e:
             return f"Error reading logs: {e}"
     
     def clear_logs(self) -> None:
         """Clear the log file."""
         try:
+            # Release the file before deleting it
+            self.shutdown()
             if self.log_file.exists():
                 self.log_file.unlink()
-                # Reinitialize logger
-                self.__init__(self.log_file)
         except Exception:
             pass
-
+        # Reinitialize logger
+        self.__init__(self.log_file)
@@ -4,22 +4,37 @@ Made by Nova
 
 A beautiful, modern Windows desktop utility for editing Roblox ClientSettings FFlags.
 """
+import io
+import json
 import sys
 from pathlib import Path
+
+# Import first so the startup timeline covers Qt and the managers
+from startup_timeline import timeline
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTextEdit, QPushButton, QLabel, QMessageBox, QFileDialog,
-    QDialog, QDialogButtonBox, QListWidget, QStatusBar, QLineEdit
+    QDialog, QDialogButtonBox, QListView, QStatusBar, QLineEdit, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QIcon, QTextCursor, QTextCharFormat, QColor
+from PyQt6.QtCore import Qt, QEvent, QPoint, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QIcon, QTextCursor, QTextCharFormat, QTextFormat, QColor
 
+# Modules only needed after the window is shown (psutil, win32api, the
+# stream validator, the backup and flag table models) are imported where
+# they are used; the validator and file manager still bring in the JSON
+# codec, flag schema and flag store here
 from path_manager import PathManager
 from file_manager import FileManager
 from json_validator import JsonValidator
-from process_watcher import ProcessWatcher
 from logger import AppLogger
-from roblox_launcher import RobloxLauncher
+from search_engine import SearchEngine
+from live_validator import LiveValidator
+from apply_pipeline import ApplyPipeline
+import theme
+from tracing import traced, tracer
+
+timeline.mark("imports")
 
 
 class DisclaimerDialog(QDialog):
@@ -30,27 +45,7 @@ class DisclaimerDialog(QDialog):
         self.setWindowTitle("NovaStrap - Important Notice")
         self.setModal(True)
         self.setMinimumWidth(550)
-        
-        # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a1a;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QPushButton {
-                background-color: #00d9ff;
-                color: #000000;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #00b8e6;
-            }
-        """)
+        self.setObjectName("disclaimerDialog")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(25, 25, 25, 25)
@@ -58,21 +53,11 @@ class DisclaimerDialog(QDialog):
         
         # NovaStrap branding
         brand_label = QLabel("NovaStrap")
-        brand_label.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: #00d9ff;
-            padding-bottom: 5px;
-        """)
+        brand_label.setObjectName("brand")
         layout.addWidget(brand_label)
         
         credit_label = QLabel("Made by Nova")
-        credit_label.setStyleSheet("""
-            font-size: 10px;
-            color: #888888;
-            font-style: italic;
-            padding-bottom: 15px;
-        """)
+        credit_label.setObjectName("credit")
         layout.addWidget(credit_label)
         
         # Disclaimer text
@@ -89,7 +74,7 @@ class DisclaimerDialog(QDialog):
             "<p><b>By continuing, you acknowledge these risks.</b></p>"
         )
         disclaimer.setWordWrap(True)
-        disclaimer.setStyleSheet("color: #cccccc;")
+        disclaimer.setObjectName("disclaimerText")
         layout.addWidget(disclaimer)
         
         # Buttons
@@ -107,22 +92,12 @@ class DisclaimerDialog(QDialog):
 class BackupDialog(QDialog):
     """Dialog to select and restore a backup."""
     
-    def __init__(self, backups, parent=None):
+    def __init__(self, store, parent=None):
         super().__init__(parent)
         self.setWindowTitle("NovaStrap - Restore Backup")
         self.setModal(True)
         self.setMinimumSize(650, 450)
-        
-        # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a1a;
-            }
-            QLabel {
-                color: #e0e0e0;
-                font-size: 13px;
-            }
-        """)
+        self.setObjectName("backupDialog")
         
         self.selected_backup = None
         
@@ -134,10 +109,12 @@ class BackupDialog(QDialog):
         info = QLabel("<b style='color: #00d9ff;'>Select a backup to restore:</b>")
         layout.addWidget(info)
         
-        # List of backups
-        self.backup_list = QListWidget()
-        for backup in backups:
-            self.backup_list.addItem(backup.name)
+        # List of backups, loaded a page at a time as the view scrolls
+        from backup_list_model import BackupListModel
+        self.backup_model = BackupListModel(store, self)
+        self.backup_list = QListView()
+        self.backup_list.setModel(self.backup_model)
+        self.backup_list.setUniformItemSizes(True)
         layout.addWidget(self.backup_list)
         
         # Buttons
@@ -145,55 +122,56 @@ class BackupDialog(QDialog):
             QDialogButtonBox.StandardButton.Ok | 
             QDialogButtonBox.StandardButton.Cancel
         )
-        buttons.button(QDialogButtonBox.StandardButton.Ok).setStyleSheet("""
-            QPushButton {
-                background-color: #00d9ff;
-                color: #000000;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #00b8e6;
-            }
-        """)
-        buttons.button(QDialogButtonBox.StandardButton.Cancel).setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-            }
-        """)
+        theme.set_variant(buttons.button(QDialogButtonBox.StandardButton.Cancel), theme.CANCEL)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
         
         self.setLayout(layout)
-        self.backups = backups
     
     def accept(self):
         """Accept and store selected backup."""
-        current_row = self.backup_list.currentRow()
-        if current_row >= 0:
-            self.selected_backup = self.backups[current_row]
+        current = self.backup_list.currentIndex()
+        if current.isValid():
+            self.selected_backup = self.backup_model.entry(current.row())
         super().accept()
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # Lines above and below the viewport that also get match highlights
+    HIGHLIGHT_MARGIN_LINES = 40
+    
+    # Seconds between resource samples of a launched client
+    TELEMETRY_INTERVAL = 1.0
+    
+    EDITOR_PLACEHOLDER = (
+        "{\n"
+        '  "FFlagSomeFeature": "True",\n'
+        '  "DFIntSomeValue": "0"\n'
+        "}"
+    )
+    
+    # Emitted from the sampling thread with the summary when the client exits
+    telemetry_finished = pyqtSignal(dict)
+    
+    # Internal hand-off of the formatted settings file from the loader thread
+    _content_loaded = pyqtSignal(str, bool)
+    
+    # Internal hand-off of an imported file: path, formatted text, invalid-JSON
+    # message, other error message
+    _file_imported = pyqtSignal(str, str, str, str)
+    
     def __init__(self):
         super().__init__()
         
         # Initialize components
         self.path_manager = PathManager()
         self.file_manager = None
+        self.process_watcher = None
+        self.telemetry = None
+        self.startup_pending = True
         self.logger = AppLogger()
         self.validator = JsonValidator()
         
@@ -204,6 +182,7 @@ class MainWindow(QMainWindow):
         # Show disclaimer on first run
         if not self.show_disclaimer():
             sys.exit(0)
+        timeline.mark("disclaimer")
         
         # Initialize paths
         if not self.initialize_paths():
@@ -215,9 +194,10 @@ class MainWindow(QMainWindow):
             sys.exit(1)
         
         self.setup_ui()
-        self.setup_status_checker()
-        self.load_existing_content()
+        timeline.mark("ui built")
         
+        # Process watching, player discovery and loading the settings file
+        # start once the window is on screen; see finish_startup()
         self.logger.info("Application started")
     
     def show_disclaimer(self) -> bool:
@@ -236,10 +216,11 @@ class MainWindow(QMainWindow):
         self.file_manager = FileManager(self.path_manager.target_file)
         return True
     
+    @traced()
     def setup_ui(self):
         """Setup the user interface."""
-        # Apply modern dark theme
-        self.apply_dark_theme()
+        # Styling comes from the application stylesheet (theme.py) via
+        # object names and the variant/state properties
         
         # Central widget
         central_widget = QWidget()
@@ -256,27 +237,12 @@ class MainWindow(QMainWindow):
         
         # NovaStrap branding
         brand_label = QLabel("NovaStrap")
-        brand_label.setStyleSheet("""
-            QLabel {
-                font-size: 28px;
-                font-weight: bold;
-                color: #00d9ff;
-                padding: 10px 0;
-                letter-spacing: 2px;
-            }
-        """)
+        brand_label.setObjectName("brand")
         header_layout.addWidget(brand_label)
         
         # Made by Nova
         credit_label = QLabel("Made by Nova")
-        credit_label.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                color: #888888;
-                font-style: italic;
-                padding-bottom: 10px;
-            }
-        """)
+        credit_label.setObjectName("credit")
         header_layout.addWidget(credit_label)
         
         main_layout.addLayout(header_layout)
@@ -287,14 +253,7 @@ class MainWindow(QMainWindow):
         
         # Path display with modern card style
         path_container = QWidget()
-        path_container.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-                border-radius: 8px;
-                padding: 12px;
-                border: 1px solid #2a2a2a;
-            }
-        """)
+        path_container.setObjectName("pathCard")
         path_layout = QVBoxLayout(path_container)
         path_layout.setContentsMargins(0, 0, 0, 0)
         
@@ -306,21 +265,14 @@ class MainWindow(QMainWindow):
         
         # Status row with modern styling
         status_container = QWidget()
-        status_container.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-                border-radius: 8px;
-                padding: 12px;
-                border: 1px solid #2a2a2a;
-            }
-        """)
+        status_container.setObjectName("statusCard")
         status_layout = QHBoxLayout(status_container)
         status_layout.setContentsMargins(0, 0, 0, 0)
         
         self.status_label = QLabel("Status: Ready")
-        self.status_label.setStyleSheet("color: #cccccc;")
+        self.status_label.setObjectName("statusText")
         self.roblox_status_label = QLabel()
-        self.update_roblox_status()
+        self.update_roblox_status(False, {})
         
         status_layout.addWidget(self.status_label)
         status_layout.addStretch()
@@ -333,14 +285,7 @@ class MainWindow(QMainWindow):
         editor_header_layout = QHBoxLayout()
         
         editor_label = QLabel("Paste your JSON FFlags here:")
-        editor_label.setStyleSheet("""
-            QLabel {
-                font-size: 13px;
-                font-weight: bold;
-                color: #00d9ff;
-                padding-top: 10px;
-            }
-        """)
+        editor_label.setObjectName("editorLabel")
         editor_header_layout.addWidget(editor_label)
         
         editor_header_layout.addStretch()
@@ -353,75 +298,39 @@ class MainWindow(QMainWindow):
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Search FFlags...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #1a1a1a;
-                color: #e0e0e0;
-                border: 2px solid #2a2a2a;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 12px;
-                min-width: 200px;
-            }
-            QLineEdit:focus {
-                border-color: #00d9ff;
-            }
-        """)
+        self.search_input.setObjectName("search")
         self.search_input.returnPressed.connect(self.search_next)
         search_layout.addWidget(self.search_input)
         
         self.find_next_btn = QPushButton("▼ Next")
         self.find_next_btn.clicked.connect(self.search_next)
-        self.find_next_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                color: #00d9ff;
-            }
-        """)
+        theme.set_variant(self.find_next_btn, theme.TOOL)
         search_layout.addWidget(self.find_next_btn)
         
         self.find_prev_btn = QPushButton("▲ Prev")
         self.find_prev_btn.clicked.connect(self.search_previous)
-        self.find_prev_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a2a;
-                color: #e0e0e0;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                color: #00d9ff;
-            }
-        """)
+        theme.set_variant(self.find_prev_btn, theme.TOOL)
         search_layout.addWidget(self.find_prev_btn)
         
         self.search_count_label = QLabel("")
-        self.search_count_label.setStyleSheet("color: #888888; font-size: 11px; padding-left: 8px;")
+        self.search_count_label.setObjectName("searchCount")
         search_layout.addWidget(self.search_count_label)
         
+        # Switches between the text editor and the flag table
+        self.table_toggle_btn = QPushButton("▦ Table")
+        self.table_toggle_btn.setCheckable(True)
+        self.table_toggle_btn.setToolTip("Edit flags as a sortable table")
+        self.table_toggle_btn.toggled.connect(self.set_table_mode)
+        theme.set_variant(self.table_toggle_btn, theme.TOOL)
+        search_layout.addWidget(self.table_toggle_btn)
+        
         editor_header_layout.addWidget(search_container)
         
         main_layout.addLayout(editor_header_layout)
         
         # JSON editor with modern dark theme
         self.editor = QTextEdit()
-        self.editor.setPlaceholderText(
-            "{\n"
-            '  "FFlagSomeFeature": "True",\n'
-            '  "DFIntSomeValue": "0"\n'
-            "}"
-        )
+        self.editor.setPlaceholderText(self.EDITOR_PLACEHOLDER)
         
         # Set monospaced font
         font = QFont("Consolas", 11)
@@ -429,36 +338,20 @@ class MainWindow(QMainWindow):
             font = QFont("Courier New", 11)
         self.editor.setFont(font)
         
-        # Modern editor styling
-        self.editor.setStyleSheet("""
-            QTextEdit {
-                background-color: #0d0d0d;
-                color: #e0e0e0;
-                border: 2px solid #2a2a2a;
-                border-radius: 8px;
-                padding: 15px;
-                selection-background-color: #00d9ff;
-                selection-color: #000000;
-            }
-            QTextEdit:focus {
-                border: 2px solid #00d9ff;
-            }
-        """)
+        self.editor.setObjectName("editor")
         
         # Enable line wrap off for better JSON viewing
         self.editor.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         
-        main_layout.addWidget(self.editor, stretch=1)
+        # The flag table is only built the first time it is shown
+        self.editor_stack = QStackedWidget()
+        self.editor_stack.addWidget(self.editor)
+        self.flag_table = None
+        main_layout.addWidget(self.editor_stack, stretch=1)
         
         # Validation status with modern styling
         self.validation_label = QLabel("")
-        self.validation_label.setStyleSheet("""
-            QLabel {
-                padding: 8px;
-                border-radius: 6px;
-                font-size: 12px;
-            }
-        """)
+        self.validation_label.setObjectName("validation")
         main_layout.addWidget(self.validation_label)
         
         # Primary action buttons (Save & Launch)
@@ -467,12 +360,12 @@ class MainWindow(QMainWindow):
         
         self.save_btn = QPushButton("💾 Save & Apply")
         self.save_btn.clicked.connect(self.save_and_apply)
-        self.style_button(self.save_btn, primary=True)
+        theme.set_variant(self.save_btn, theme.PRIMARY)
         primary_button_layout.addWidget(self.save_btn)
         
         self.launch_btn = QPushButton("🚀 Launch Roblox")
         self.launch_btn.clicked.connect(self.launch_roblox)
-        self.style_button(self.launch_btn, launch=True)
+        theme.set_variant(self.launch_btn, theme.LAUNCH)
         primary_button_layout.addWidget(self.launch_btn)
         
         main_layout.addLayout(primary_button_layout)
@@ -483,27 +376,27 @@ class MainWindow(QMainWindow):
         
         self.validate_btn = QPushButton("🔍 Validate")
         self.validate_btn.clicked.connect(self.validate_json)
-        self.style_button(self.validate_btn, secondary=True)
+        theme.set_variant(self.validate_btn, theme.SECONDARY)
         button_layout.addWidget(self.validate_btn)
         
         self.clear_btn = QPushButton("🗑️ Clear")
         self.clear_btn.clicked.connect(self.clear_editor)
-        self.style_button(self.clear_btn, secondary=True)
+        theme.set_variant(self.clear_btn, theme.SECONDARY)
         button_layout.addWidget(self.clear_btn)
         
         self.import_btn = QPushButton("📁 Import")
         self.import_btn.clicked.connect(self.import_file)
-        self.style_button(self.import_btn, secondary=True)
+        theme.set_variant(self.import_btn, theme.SECONDARY)
         button_layout.addWidget(self.import_btn)
         
         self.export_btn = QPushButton("💾 Export")
         self.export_btn.clicked.connect(self.export_file)
-        self.style_button(self.export_btn, secondary=True)
+        theme.set_variant(self.export_btn, theme.SECONDARY)
         button_layout.addWidget(self.export_btn)
         
         self.restore_btn = QPushButton("⏮️ Restore")
         self.restore_btn.clicked.connect(self.restore_backup)
-        self.style_button(self.restore_btn, secondary=True)
+        theme.set_variant(self.restore_btn, theme.SECONDARY)
         button_layout.addWidget(self.restore_btn)
         
         main_layout.addLayout(button_layout)
@@ -511,197 +404,68 @@ class MainWindow(QMainWindow):
         # Status bar with modern styling
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
-        self.statusBar.setStyleSheet("""
-            QStatusBar {
-                background-color: #0a0a0a;
-                color: #888888;
-                border-top: 1px solid #2a2a2a;
-                padding: 5px;
-            }
-        """)
         self.statusBar.showMessage("Ready")
         
+        # Cancels a running save; only shown while one is in progress
+        self.cancel_apply_btn = QPushButton("Cancel")
+        self.cancel_apply_btn.setToolTip("Cancel the save in progress")
+        theme.set_variant(self.cancel_apply_btn, theme.SECONDARY)
+        self.cancel_apply_btn.hide()
+        self.statusBar.addPermanentWidget(self.cancel_apply_btn)
+        
+        # Initialize search state
+        self.search_engine = SearchEngine()
+        self.current_match_index = -1
+        self.highlight_format = QTextCharFormat()
+        self.highlight_format.setBackground(QColor("#00d9ff"))
+        self.highlight_format.setForeground(QColor("#000000"))
+        
+        # Inline marker for the latest validation error
+        self.error_selections = []
+        self.error_line_format = QTextCharFormat()
+        self.error_line_format.setBackground(QColor(255, 68, 68, 40))
+        self.error_line_format.setProperty(QTextFormat.Property.FullWidthSelection, True)
+        self.error_char_format = QTextCharFormat()
+        self.error_char_format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
+        self.error_char_format.setUnderlineColor(QColor("#ff4444"))
+        
+        # Highlights only cover the viewport, so rebuild them when it moves
+        self.editor.verticalScrollBar().valueChanged.connect(self.update_visible_highlights)
+        self.editor.viewport().installEventFilter(self)
+        
         # Connect editor changes to clear validation and update search
+        self.editor.document().contentsChange.connect(self.on_document_contents_change)
         self.editor.textChanged.connect(self.on_editor_changed)
         self.search_input.textChanged.connect(self.on_search_changed)
         
-        # Initialize search state
-        self.current_search_matches = []
-        self.current_match_index = -1
-    
-    def apply_dark_theme(self):
-        """Apply modern dark theme to the application."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #121212;
-            }
-            QWidget {
-                background-color: #121212;
-                color: #e0e0e0;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QMessageBox {
-                background-color: #1a1a1a;
-            }
-            QMessageBox QLabel {
-                color: #e0e0e0;
-            }
-            QDialog {
-                background-color: #1a1a1a;
-            }
-            QListWidget {
-                background-color: #0d0d0d;
-                color: #e0e0e0;
-                border: 2px solid #2a2a2a;
-                border-radius: 8px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QListWidget::item:selected {
-                background-color: #00d9ff;
-                color: #000000;
-            }
-            QListWidget::item:hover {
-                background-color: #2a2a2a;
-            }
-            QScrollBar:vertical {
-                background-color: #0d0d0d;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #2a2a2a;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #3a3a3a;
-            }
-            QScrollBar:horizontal {
-                background-color: #0d0d0d;
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #2a2a2a;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: #3a3a3a;
-            }
-            QScrollBar::add-line, QScrollBar::sub-line {
-                border: none;
-                background: none;
-            }
-        """)
-    
-    def style_button(self, button, primary=False, secondary=False, launch=False):
-        """Apply modern styling to buttons."""
-        if primary:
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #00d9ff;
-                    color: #000000;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 12px 24px;
-                    font-weight: bold;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background-color: #00b8e6;
-                }
-                QPushButton:pressed {
-                    background-color: #0099cc;
-                }
-                QPushButton:disabled {
-                    background-color: #2a2a2a;
-                    color: #666666;
-                }
-            """)
-        elif launch:
-            button.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                                stop:0 #00ff88, stop:1 #00d9ff);
-                    color: #000000;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 12px 24px;
-                    font-weight: bold;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                                stop:0 #00e67a, stop:1 #00b8e6);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                                stop:0 #00cc6f, stop:1 #0099cc);
-                }
-                QPushButton:disabled {
-                    background-color: #2a2a2a;
-                    color: #666666;
-                }
-            """)
-        elif secondary:
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #1a1a1a;
-                    color: #e0e0e0;
-                    border: 2px solid #2a2a2a;
-                    border-radius: 8px;
-                    padding: 12px 20px;
-                    font-weight: 500;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #2a2a2a;
-                    border-color: #00d9ff;
-                    color: #00d9ff;
-                }
-                QPushButton:pressed {
-                    background-color: #0d0d0d;
-                }
-                QPushButton:disabled {
-                    background-color: #0d0d0d;
-                    color: #666666;
-                    border-color: #1a1a1a;
-                }
-            """)
-        else:
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2a2a2a;
-                    color: #e0e0e0;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 10px 20px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #3a3a3a;
-                }
-                QPushButton:pressed {
-                    background-color: #1a1a1a;
-                }
-            """)
+        # Validate in the background once typing pauses
+        self.live_validator = LiveValidator(self.editor.document(), self)
+        self.editor.textChanged.connect(self.live_validator.schedule)
+        self.live_validator.validated.connect(self.on_live_validation)
+        
+        # Saves run off the UI thread, one at a time
+        self.apply_pipeline = ApplyPipeline(self.file_manager, self)
+        self.apply_pipeline.stage.connect(self.on_apply_stage)
+        self.apply_pipeline.finished.connect(self.on_apply_finished)
+        self.cancel_apply_btn.clicked.connect(self.apply_pipeline.cancel)
+        # Job id -> what to do when it finishes ("save" or "launch")
+        self.apply_jobs = {}
+        
+        self.telemetry_finished.connect(self.on_telemetry_finished)
+        self._content_loaded.connect(self.on_content_loaded)
+        self._file_imported.connect(self.on_file_imported)
     
     def setup_status_checker(self):
-        """Setup timer to periodically check Roblox status."""
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_roblox_status)
-        self.status_timer.start(3000)  # Check every 3 seconds
+        """Start the background watcher that reports Roblox status changes."""
+        from process_watcher_thread import ProcessWatcherThread
+        self.update_roblox_status(False, {})
+        self.process_watcher = ProcessWatcherThread(self)
+        self.process_watcher.state_changed.connect(self.update_roblox_status)
+        self.process_watcher.start()
     
-    def update_roblox_status(self):
+    @traced()
+    def update_roblox_status(self, is_running, processes):
         """Update Roblox process status display."""
-        is_running = ProcessWatcher.is_roblox_running()
         if is_running:
             self.roblox_status_label.setText("⚠️ <b style='color: #ff4444;'>Roblox Running</b>")
             self.roblox_status_label.setToolTip(
@@ -712,117 +476,179 @@ class MainWindow(QMainWindow):
             self.roblox_status_label.setText("✓ <b style='color: #00d9ff;'>Roblox Not Running</b>")
             self.roblox_status_label.setToolTip("Roblox is not running")
     
-    def load_existing_content(self):
-        """Load existing content from target file if it exists."""
-        content = self.file_manager.read_current_content()
+    @traced()
+    def load_existing_content(self, force=False):
+        """
+        Read and format the target file in the background.
+        
+        Args:
+            force: Replace the editor text even if it is not empty, e.g.
+                after restoring a backup. The startup load (False) keeps
+                anything the user typed while it ran.
+        """
+        self.editor.setPlaceholderText("Loading IxpSettings.json...")
+        QThreadPool.globalInstance().start(lambda: self._read_existing_content(force))
+    
+    def _read_existing_content(self, force):
+        """Loader thread body."""
+        try:
+            content = self.file_manager.read_current_content() or ""
+        except Exception as e:
+            self.logger.error(f"Failed to load existing content: {str(e)}")
+            content = ""
         if content:
             try:
                 # Format the JSON for display
-                formatted = self.validator.format_json(content)
-                self.editor.setPlainText(formatted)
-                self.logger.info("Loaded existing IxpSettings.json content")
+                content = self.validator.format_json(content)
             except Exception:
-                self.editor.setPlainText(content)
+                pass
+        self._content_loaded.emit(content, force)
+    
+    def on_content_loaded(self, content, force):
+        """Show the loaded file; at startup, only if the user has not typed yet."""
+        self.editor.setPlaceholderText(self.EDITOR_PLACEHOLDER)
+        if force:
+            self.editor.setPlainText(content)
+            self.logger.info("Reloaded IxpSettings.json content")
+            return
+        
+        if content and self.editor.document().isEmpty():
+            self.editor.setPlainText(content)
+            self.logger.info("Loaded existing IxpSettings.json content")
+        
+        timeline.mark("content loaded")
+        self.logger.info("Startup timeline:\n" + timeline.report())
     
     def on_editor_changed(self):
         """Handle editor text changes."""
         # Clear validation message when user types
         self.validation_label.setText("")
-        self.validation_label.setStyleSheet("""
-            QLabel {
-                padding: 8px;
-                border-radius: 6px;
-                font-size: 12px;
-            }
-        """)
+        theme.set_state(self.validation_label, "")
         # Reset search when content changes
-        if hasattr(self, 'search_input') and self.search_input.text():
+        if hasattr(self, 'search_input') and self.search_input.text() and not self.table_mode():
             self.highlight_all_matches()
     
+    def on_document_contents_change(self, position, chars_removed, chars_added):
+        """Keep the search index in sync with an editor edit."""
+        document = self.editor.document()
+        expected = len(self.search_engine) + chars_added - chars_removed
+        if expected != document.characterCount() - 1:
+            # Bulk replacements (setPlainText, clear) report ranges that include
+            # the trailing block separator, so resync from the full text instead
+            self.search_engine.reset(self.editor.toPlainText())
+            return
+        
+        cursor = QTextCursor(document)
+        cursor.setPosition(position)
+        cursor.setPosition(position + chars_added, QTextCursor.MoveMode.KeepAnchor)
+        added_text = cursor.selectedText().replace("\u2029", "\n").replace("\u00a0", " ")
+        self.search_engine.apply_change(position, chars_removed, added_text)
+    
     def on_search_changed(self):
         """Handle search input changes."""
-        self.highlight_all_matches()
+        if self.table_mode():
+            self.filter_table()
+        else:
+            self.highlight_all_matches()
     
     def highlight_all_matches(self):
         """Highlight all search matches in the editor."""
         search_text = self.search_input.text()
         
         if not search_text:
-            # Clear highlights
-            self.editor.setExtraSelections([])
+            # Clear match highlights, keeping the error marker
+            self.editor.setExtraSelections(self.error_selections)
             self.search_count_label.setText("")
-            self.current_search_matches = []
+            self.search_engine.find("")
             self.current_match_index = -1
             return
         
-        # Get editor content
-        content = self.editor.toPlainText()
+        # Count matches (case-insensitive) in the incremental index
+        count = self.search_engine.find(search_text)
         
-        # Find all matches (case-insensitive)
-        self.current_search_matches = []
-        search_lower = search_text.lower()
-        start = 0
+        # Update count label
+        if count:
+            self.search_count_label.setText(f"{count} found")
+            self.current_match_index = 0
+            self.jump_to_match(0)
+        else:
+            self.search_count_label.setText("Not found")
+            self.current_match_index = -1
         
-        while True:
-            index = content.lower().find(search_lower, start)
-            if index == -1:
-                break
-            self.current_search_matches.append(index)
-            start = index + 1
+        self.update_visible_highlights()
+    
+    def update_visible_highlights(self):
+        """Highlight the search matches in and around the visible viewport."""
+        if not self.search_engine.match_count():
+            self.editor.setExtraSelections(self.error_selections)
+            return
         
-        # Create extra selections for highlights
+        # Visible block range, widened by a margin so short scrolls stay covered
+        viewport = self.editor.viewport()
+        first = self.editor.cursorForPosition(QPoint(0, 0)).block()
+        last = self.editor.cursorForPosition(QPoint(viewport.width(), viewport.height())).block()
+        for _ in range(self.HIGHLIGHT_MARGIN_LINES):
+            if first.previous().isValid():
+                first = first.previous()
+            if last.next().isValid():
+                last = last.next()
+        
+        document = self.editor.document()
+        search_len = len(self.search_input.text())
         extra_selections = []
-        highlight_format = QTextCharFormat()
-        highlight_format.setBackground(QColor("#00d9ff"))
-        highlight_format.setForeground(QColor("#000000"))
-        
-        for match_pos in self.current_search_matches:
-            selection = QTextEdit.ExtraSelection()
-            cursor = self.editor.textCursor()
+        for match_pos in self.search_engine.matches_between(
+            first.position(), last.position() + last.length()
+        ):
+            cursor = QTextCursor(document)
             cursor.setPosition(match_pos)
-            cursor.movePosition(QTextCursor.MoveOperation.Right, 
-                              QTextCursor.MoveMode.KeepAnchor, 
-                              len(search_text))
+            cursor.setPosition(match_pos + search_len, QTextCursor.MoveMode.KeepAnchor)
+            selection = QTextEdit.ExtraSelection()
             selection.cursor = cursor
-            selection.format = highlight_format
+            selection.format = self.highlight_format
             extra_selections.append(selection)
         
-        # Apply all highlights
-        self.editor.setExtraSelections(extra_selections)
-        
-        # Update count label
-        if self.current_search_matches:
-            self.search_count_label.setText(f"{len(self.current_search_matches)} found")
-            self.current_match_index = 0
-            self.jump_to_match(0)
-        else:
-            self.search_count_label.setText("Not found")
-            self.current_match_index = -1
+        self.editor.setExtraSelections(self.error_selections + extra_selections)
+    
+    def eventFilter(self, obj, event):
+        """Refresh viewport highlights when the editor is resized."""
+        if event.type() == QEvent.Type.Resize and obj is self.editor.viewport():
+            self.update_visible_highlights()
+        elif event.type() == QEvent.Type.Paint and self.startup_pending and obj is self.editor.viewport():
+            timeline.mark("first paint")
+        return super().eventFilter(obj, event)
     
     def search_next(self):
         """Jump to next search match."""
-        if not self.current_search_matches:
+        if self.table_mode():
+            self.step_table_row(1)
+            return
+        count = self.search_engine.match_count()
+        if not count:
             return
         
-        self.current_match_index = (self.current_match_index + 1) % len(self.current_search_matches)
+        self.current_match_index = (self.current_match_index + 1) % count
         self.jump_to_match(self.current_match_index)
         self.update_search_position_label()
     
     def search_previous(self):
         """Jump to previous search match."""
-        if not self.current_search_matches:
+        if self.table_mode():
+            self.step_table_row(-1)
+            return
+        count = self.search_engine.match_count()
+        if not count:
             return
         
-        self.current_match_index = (self.current_match_index - 1) % len(self.current_search_matches)
+        self.current_match_index = (self.current_match_index - 1) % count
         self.jump_to_match(self.current_match_index)
         self.update_search_position_label()
     
     def jump_to_match(self, index):
         """Jump to a specific match index."""
-        if index < 0 or index >= len(self.current_search_matches):
+        if index < 0 or index >= self.search_engine.match_count():
             return
         
-        match_pos = self.current_search_matches[index]
+        match_pos = self.search_engine.match_at(index)
         search_text = self.search_input.text()
         
         # Create cursor and move to the match
@@ -840,43 +666,194 @@ class MainWindow(QMainWindow):
     
     def update_search_position_label(self):
         """Update the search position label."""
-        if self.current_search_matches:
-            self.search_count_label.setText(
-                f"{self.current_match_index + 1}/{len(self.current_search_matches)}"
-            )
+        count = self.search_engine.match_count()
+        if count:
+            self.search_count_label.setText(f"{self.current_match_index + 1}/{count}")
     
+    @pyqtSlot()
+    @traced()
     def validate_json(self):
         """Validate JSON in editor."""
-        text = self.editor.toPlainText()
-        is_valid, error_msg, data = self.validator.validate(text)
+        # Reuse the background result when the text has not changed since
+        result = self.live_validator.latest_result()
+        if result is None:
+            result = self.validator.validate_with_position(self.editor.toPlainText())
+            self.live_validator.remember(result)
+        is_valid, error_msg, data, error_pos = result
+        
+        self.show_validation_result(is_valid, error_msg)
+        self.set_error_marker(error_pos)
         
         if is_valid:
-            self.validation_label.setText("✓ <span style='color: #00d9ff; font-weight: bold;'>Valid JSON</span>")
-            self.validation_label.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(0, 217, 255, 0.1);
-                    border: 1px solid #00d9ff;
-                    border-radius: 6px;
-                    padding: 8px;
-                }
-            """)
             self.statusBar.showMessage("✓ JSON is valid", 3000)
             self.logger.info("JSON validation passed")
         else:
-            self.validation_label.setText(f"✗ <span style='color: #ff4444; font-weight: bold;'>{error_msg}</span>")
-            self.validation_label.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(255, 68, 68, 0.1);
-                    border: 1px solid #ff4444;
-                    border-radius: 6px;
-                    padding: 8px;
-                }
-            """)
             self.statusBar.showMessage("✗ JSON validation failed", 3000)
             self.logger.warning(f"JSON validation failed: {error_msg}")
         
         return is_valid, error_msg, data
     
+    def on_live_validation(self, is_valid, error_msg, error_pos):
+        """Show the result of a background validation."""
+        if self.table_mode():
+            self.sync_table()
+        if self.editor.document().isEmpty():
+            # Nothing typed yet, so there is nothing to complain about
+            self.set_error_marker(-1)
+            return
+        
+        self.show_validation_result(is_valid, error_msg)
+        self.set_error_marker(error_pos)
+    
+    def table_mode(self):
+        """Whether the flag table is shown instead of the text editor."""
+        return self.flag_table is not None and self.editor_stack.currentWidget() is self.flag_table
+    
+    def setup_flag_table(self):
+        """Build the flag table, its model and its filter proxy."""
+        from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+        from flag_table_model import FlagFilterProxy, FlagTableModel
+        
+        self.flag_model = FlagTableModel(self)
+        self.flag_model.flag_edited.connect(self.on_flag_edited)
+        self.flag_model.edit_rejected.connect(self.on_flag_edit_rejected)
+        self.flag_proxy = FlagFilterProxy(self)
+        self.flag_proxy.setSourceModel(self.flag_model)
+        
+        table = QTableView()
+        table.setObjectName("flagTable")
+        table.setModel(self.flag_proxy)
+        table.setWordWrap(False)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+            | QAbstractItemView.EditTrigger.AnyKeyPressed
+        )
+        
+        # Fixed row heights and column widths: sizing never visits every row
+        rows = table.verticalHeader()
+        rows.hide()
+        rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(26)
+        columns = table.horizontalHeader()
+        columns.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        columns.setStretchLastSection(True)
+        columns.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        columns.setSortIndicatorClearable(True)
+        table.setColumnWidth(FlagTableModel.KEY_COLUMN, 420)
+        table.setColumnWidth(FlagTableModel.TYPE_COLUMN, 80)
+        table.setSortingEnabled(True)
+        
+        self.flag_table = table
+        self.editor_stack.addWidget(table)
+    
+    @traced()
+    def set_table_mode(self, enabled):
+        """Show the flag table or the text editor."""
+        if enabled:
+            if self.flag_table is None:
+                self.setup_flag_table()
+            # Drop the editor's match highlights; the error marker stays
+            self.editor.setExtraSelections(self.error_selections)
+            self.editor_stack.setCurrentWidget(self.flag_table)
+            self.search_input.setPlaceholderText("🔍 Filter flags...")
+            self.sync_table()
+            self.filter_table()
+        else:
+            self.editor_stack.setCurrentWidget(self.editor)
+            self.search_input.setPlaceholderText("🔍 Search FFlags...")
+            self.highlight_all_matches()
+            self.update_visible_highlights()
+    
+    @traced()
+    def sync_table(self):
+        """Show the editor's flags and their type problems in the table."""
+        result = self.live_validator.latest_result()
+        if result is not None and result[0]:
+            flags, problems = result[2], []
+        else:
+            # Invalid text may still be a flag object whose values have
+            # the wrong types; those are shown and marked in the table
+            flags, problems = self.validator.parse_flags(self.editor.toPlainText())
+        if flags is None:
+            self.statusBar.showMessage("Fix the JSON errors to update the table", 5000)
+            return
+        self.flag_model.set_flags(flags, problems)
+        self.update_table_count()
+    
+    def filter_table(self):
+        """Filter the table by the search text."""
+        self.flag_proxy.set_filter_text(self.search_input.text())
+        self.update_table_count()
+    
+    def update_table_count(self):
+        """Show how many flags the table lists."""
+        total = self.flag_model.total()
+        if self.flag_proxy.filter_text():
+            self.search_count_label.setText(f"{self.flag_proxy.rowCount()}/{total}")
+        else:
+            self.search_count_label.setText(f"{total} flags")
+    
+    def step_table_row(self, step):
+        """Move the table selection up or down by one row."""
+        count = self.flag_proxy.rowCount()
+        if not count:
+            return
+        current = self.flag_table.currentIndex()
+        row = (current.row() + step) % count if current.isValid() else 0
+        self.flag_table.setCurrentIndex(self.flag_proxy.index(row, self.flag_model.VALUE_COLUMN))
+    
+    def on_flag_edited(self, key, old, new):
+        """Write a value edited in the table back into the editor text."""
+        from flag_table_model import write_value
+        
+        # Entries of canonical text start on line 1, in model row order
+        line = self.flag_model.row_of(key) + 1
+        if not write_value(self.editor.document(), key, old, new, line):
+            # Not one entry per line; rewrite the text from the table
+            self.editor.setPlainText(self.flag_model.store().dumps_canonical())
+        self.statusBar.showMessage(f"Set {key} to {json.dumps(new)}", 3000)
+    
+    def on_flag_edit_rejected(self, key, reason):
+        """Explain why a table edit was not applied."""
+        self.statusBar.showMessage(f"✗ {key} {reason}", 5000)
+    
+    def show_validation_result(self, is_valid, error_msg):
+        """Update the validation label."""
+        if is_valid:
+            self.validation_label.setText("✓ <span style='color: #00d9ff; font-weight: bold;'>Valid JSON</span>")
+            theme.set_state(self.validation_label, theme.VALID)
+        else:
+            self.validation_label.setText(f"✗ <span style='color: #ff4444; font-weight: bold;'>{error_msg}</span>")
+            theme.set_state(self.validation_label, theme.INVALID)
+    
+    def set_error_marker(self, error_pos):
+        """Mark the error position in the editor, or clear it if error_pos < 0."""
+        self.error_selections = []
+        
+        if error_pos >= 0:
+            document = self.editor.document()
+            error_pos = min(error_pos, document.characterCount() - 1)
+            
+            cursor = QTextCursor(document)
+            cursor.setPosition(error_pos)
+            line = QTextEdit.ExtraSelection()
+            line.cursor = QTextCursor(cursor)
+            line.format = self.error_line_format
+            
+            cursor.movePosition(QTextCursor.MoveOperation.Right, QTextCursor.MoveMode.KeepAnchor)
+            char = QTextEdit.ExtraSelection()
+            char.cursor = cursor
+            char.format = self.error_char_format
+            
+            self.error_selections = [line, char]
+        
+        self.update_visible_highlights()
+    
+    @pyqtSlot()
+    @traced()
     def save_and_apply(self):
         """Save JSON to target file and apply settings."""
         # Validate first
@@ -890,7 +867,7 @@ class MainWindow(QMainWindow):
             return
         
         # Check if Roblox is running
-        if ProcessWatcher.is_roblox_running():
+        if self.process_watcher is not None and self.process_watcher.is_running():
             reply = QMessageBox.question(
                 self,
                 "Roblox Running",
@@ -903,24 +880,68 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.No:
                 return
         
-        try:
-            # Create backup
-            backup = self.file_manager.backup_file()
-            if backup:
-                self.logger.info(f"Created backup: {backup.name}")
-            
-            # Write file atomically
-            self.file_manager.atomic_write_json(data)
-            self.logger.info("Wrote JSON to target file")
-            
-            # Set read-only
-            self.file_manager.set_readonly()
-            self.logger.success("Set file to read-only")
+        self.start_apply(data, "save")
+    
+    @traced()
+    def start_apply(self, data, purpose):
+        """
+        Queue data to be written to the target file off the UI thread.
+        
+        Args:
+            data: Validated flag dictionary
+            purpose: "save" to report the result, "launch" to launch afterwards
+        """
+        job_id = self.apply_pipeline.submit(data)
+        self.apply_jobs[job_id] = purpose
+        self.cancel_apply_btn.show()
+        self.statusBar.showMessage("Saving...")
+    
+    def on_apply_stage(self, job_id, stage):
+        """Show the stage a save has reached."""
+        self.statusBar.showMessage(f"{stage}...")
+    
+    @traced()
+    def on_apply_finished(self, job_id, success, error_msg, changes):
+        """Report a finished save and continue a pending launch."""
+        purpose = self.apply_jobs.pop(job_id, "save")
+        if not self.apply_pipeline.is_busy():
+            self.cancel_apply_btn.hide()
+        
+        if not success:
+            if error_msg == "Cancelled":
+                self.logger.warning("Save cancelled; target file left unchanged")
+                self.statusBar.showMessage("Save cancelled", 5000)
+                return
             
-            # Update status
-            self.statusBar.showMessage("✓ Saved and applied successfully!", 5000)
+            self.logger.error(f"Save failed: {error_msg}")
+            self.statusBar.showMessage("✗ Save failed", 5000)
+            if purpose == "launch":
+                QMessageBox.warning(
+                    self,
+                    "Save Failed",
+                    f"Failed to save settings:\n\n{error_msg}\n\nLaunching anyway..."
+                )
+                self.launch_now()
+            else:
+                QMessageBox.critical(
+                    self,
+                    "Save Error",
+                    f"Failed to save file:\n\n{error_msg}"
+                )
+            return
+        
+        if changes is None:
+            self.logger.info("Target file already up to date; skipped write")
+            self.statusBar.showMessage("✓ No changes - settings already applied", 5000)
+            self.status_label.setText(f"Status: Already up to date at {self.get_timestamp()}")
+        else:
+            self.logger.success(f"Saved settings ({changes.summary()})")
+            self.statusBar.showMessage(f"✓ Saved and applied: {changes.summary()}", 5000)
             self.status_label.setText(f"Status: Saved successfully at {self.get_timestamp()}")
-            
+        
+        if purpose == "launch":
+            self.launch_now()
+        elif changes is not None:
             QMessageBox.information(
                 self,
                 "Success",
@@ -929,16 +950,6 @@ class MainWindow(QMainWindow):
                 "Attribute: Read-Only\n\n"
                 "Restart Roblox for changes to take effect."
             )
-            
-        except Exception as e:
-            error_text = str(e)
-            self.logger.error(f"Save failed: {error_text}")
-            self.statusBar.showMessage("✗ Save failed", 5000)
-            QMessageBox.critical(
-                self,
-                "Save Error",
-                f"Failed to save file:\n\n{error_text}"
-            )
     
     def clear_editor(self):
         """Clear the editor content."""
@@ -955,6 +966,8 @@ class MainWindow(QMainWindow):
             self.validation_label.setText("")
             self.logger.info("Editor cleared")
     
+    @pyqtSlot()
+    @traced()
     def import_file(self):
         """Import JSON from file."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -965,34 +978,66 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
-            try:
+            # Reading, validating and formatting a large file takes seconds,
+            # so it runs off the UI thread like the startup load
+            self.statusBar.showMessage("Importing...")
+            QThreadPool.globalInstance().start(lambda: self._read_import(file_path))
+    
+    def _read_import(self, file_path):
+        """Import thread body."""
+        formatted = invalid = error = ""
+        try:
+            if Path(file_path).stat().st_size > self.validator.STREAM_THRESHOLD:
+                from stream_validator import StreamValidator, StreamValidationError
+                
+                # Validate and format straight from disk, one entry at a time
+                out = io.StringIO()
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        StreamValidator(f).write_formatted(out)
+                    formatted = out.getvalue()
+                except StreamValidationError as e:
+                    invalid = f"Invalid JSON: {e}"
+            else:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
                 # Validate before importing
                 is_valid, error_msg, data = self.validator.validate(content)
-                if not is_valid:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid JSON",
-                        f"The selected file contains invalid JSON:\n\n{error_msg}"
-                    )
-                    return
-                
-                # Format and load
-                formatted = self.validator.format_json(content)
-                self.editor.setPlainText(formatted)
-                self.logger.info(f"Imported JSON from: {file_path}")
-                self.statusBar.showMessage("✓ Imported successfully", 3000)
-                
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Import Error",
-                    f"Failed to import file:\n\n{str(e)}"
-                )
-                self.logger.error(f"Import failed: {str(e)}")
+                if is_valid:
+                    formatted = self.validator.format_json(content)
+                else:
+                    invalid = error_msg
+        except Exception as e:
+            error = str(e)
+        self._file_imported.emit(file_path, formatted, invalid, error)
     
+    def on_file_imported(self, file_path, formatted, invalid, error):
+        """Show an imported file, or why it could not be imported."""
+        self.statusBar.clearMessage()
+        if invalid:
+            QMessageBox.warning(
+                self,
+                "Invalid JSON",
+                f"The selected file contains invalid JSON:\n\n{invalid}"
+            )
+            return
+        if error:
+            QMessageBox.critical(
+                self,
+                "Import Error",
+                f"Failed to import file:\n\n{error}"
+            )
+            self.logger.error(f"Import failed: {error}")
+            return
+        
+        # Load formatted content
+        self.editor.setPlainText(formatted)
+        self.logger.info(f"Imported JSON from: {file_path}")
+        self.statusBar.showMessage("✓ Imported successfully", 3000)
+    
+    @pyqtSlot()
+    @traced()
     def export_file(self):
         """Export current editor content to file."""
         # Validate first
@@ -1023,7 +1068,7 @@ class MainWindow(QMainWindow):
                 
                 self.logger.info(f"Exported JSON to: {file_path}")
                 self.statusBar.showMessage("✓ Exported successfully", 3000)
-                
+            
             except Exception as e:
                 QMessageBox.critical(
                     self,
@@ -1032,27 +1077,31 @@ class MainWindow(QMainWindow):
                 )
                 self.logger.error(f"Export failed: {str(e)}")
     
+    @pyqtSlot()
+    @traced()
     def restore_backup(self):
         """Restore from a previous backup."""
-        backups = self.file_manager.get_backup_files()
+        if self.apply_pipeline.is_busy():
+            self.statusBar.showMessage("Wait for the current save to finish", 3000)
+            return
         
-        if not backups:
+        if not self.file_manager.backup_count():
             QMessageBox.information(
                 self,
                 "No Backups",
-                "No backup files found."
+                "No backups found."
             )
             return
         
         # Show backup selection dialog
-        dialog = BackupDialog(backups, self)
+        dialog = BackupDialog(self.file_manager.backup_store, self)
         if dialog.exec() == QDialog.DialogCode.Accepted and dialog.selected_backup:
             try:
                 # Restore the backup
                 self.file_manager.restore_backup(dialog.selected_backup)
                 
-                # Reload content
-                self.load_existing_content()
+                # Reload content, replacing what the editor shows
+                self.load_existing_content(force=True)
                 
                 # Set read-only again
                 self.file_manager.set_readonly()
@@ -1065,7 +1114,7 @@ class MainWindow(QMainWindow):
                     "Success",
                     f"Backup restored successfully:\n\n{dialog.selected_backup.name}"
                 )
-                
+            
             except Exception as e:
                 self.logger.error(f"Restore failed: {str(e)}")
                 QMessageBox.critical(
@@ -1074,6 +1123,8 @@ class MainWindow(QMainWindow):
                     f"Failed to restore backup:\n\n{str(e)}"
                 )
     
+    @pyqtSlot()
+    @traced()
     def launch_roblox(self):
         """Launch Roblox with current settings."""
         # Check if there are unsaved changes
@@ -1111,25 +1162,19 @@ class MainWindow(QMainWindow):
                     if retry == QMessageBox.StandardButton.No:
                         return
                 else:
-                    # Save the settings
-                    try:
-                        backup = self.file_manager.backup_file()
-                        if backup:
-                            self.logger.info(f"Created backup: {backup.name}")
-                        
-                        self.file_manager.atomic_write_json(data)
-                        self.file_manager.set_readonly()
-                        self.logger.success("Saved settings before launch")
-                        self.statusBar.showMessage("✓ Settings saved", 3000)
-                    except Exception as e:
-                        QMessageBox.warning(
-                            self,
-                            "Save Failed",
-                            f"Failed to save settings:\n\n{str(e)}\n\nLaunching anyway..."
-                        )
+                    # Save in the background; launch once it finishes
+                    self.start_apply(data, "launch")
+                    return
+        
+        self.launch_now()
+    
+    @traced()
+    def launch_now(self):
+        """Launch Roblox, asking first if it is already running."""
+        from roblox_launcher import RobloxLauncher
         
         # Check if Roblox is already running
-        if ProcessWatcher.is_roblox_running():
+        if self.process_watcher is not None and self.process_watcher.is_running():
             reply = QMessageBox.question(
                 self,
                 "Roblox Already Running",
@@ -1144,10 +1189,13 @@ class MainWindow(QMainWindow):
         # Launch Roblox
         self.statusBar.showMessage("Launching Roblox...", 2000)
         success, message = RobloxLauncher.launch_roblox()
+        if self.process_watcher is not None:
+            self.process_watcher.scan_now()
         
         if success:
             self.logger.success(f"Launched Roblox: {message}")
             self.statusBar.showMessage(f"✓ {message}", 5000)
+            self.start_telemetry(RobloxLauncher.last_process)
             QMessageBox.information(
                 self,
                 "Roblox Launched",
@@ -1165,14 +1213,152 @@ class MainWindow(QMainWindow):
                 "Please make sure Roblox is installed in the default location."
             )
     
+    def start_telemetry(self, process):
+        """Sample the launched client's resource usage until it exits."""
+        if process is None:
+            return
+        from telemetry import TelemetrySampler
+        if self.telemetry is not None:
+            self.telemetry.stop()
+        try:
+            self.telemetry = TelemetrySampler(
+                process,
+                interval=self.TELEMETRY_INTERVAL,
+                on_exit=self.telemetry_finished.emit
+            )
+        except Exception as e:
+            self.telemetry = None
+            self.logger.warning(f"Telemetry unavailable: {str(e)}")
+            return
+        self.telemetry.start()
+        self.logger.info(f"Sampling client telemetry (PID {process.pid})")
+    
+    @traced()
+    def on_telemetry_finished(self, summary):
+        """Export and report telemetry once the client exits."""
+        sampler = self.telemetry
+        self.telemetry = None
+        if sampler is None or summary["pid"] != sampler.pid:
+            return
+        
+        from datetime import datetime
+        folder = self.logger.log_file.parent / "telemetry"
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+            sampler.export_csv(folder / f"client_{stamp}.csv")
+            sampler.export_json(folder / f"client_{stamp}.json")
+        except Exception as e:
+            self.logger.error(f"Telemetry export failed: {str(e)}")
+        
+        if not summary["samples"]:
+            return
+        text = (
+            f"Session: {summary['duration']:.0f} s, exit code {summary['exit_code']}\n"
+            f"CPU: {summary['cpu_avg']:.1f}% average, {summary['cpu_max']:.1f}% peak\n"
+            f"Memory: {summary['rss_avg'] / 1048576:.0f} MB average, "
+            f"{summary['rss_max'] / 1048576:.0f} MB peak\n"
+            f"Threads: {summary['threads_max']} peak\n"
+            f"Disk: {summary['read_bytes'] / 1048576:.1f} MB read, "
+            f"{summary['write_bytes'] / 1048576:.1f} MB written"
+        )
+        self.logger.info("Client telemetry: " + text.replace("\n", "; "))
+        self.statusBar.showMessage(
+            f"Roblox exited - CPU {summary['cpu_avg']:.1f}% avg, "
+            f"{summary['rss_max'] / 1048576:.0f} MB peak", 10000
+        )
+        QMessageBox.information(
+            self,
+            "Roblox Session Summary",
+            f"{text}\n\nSamples saved to:\n{folder}"
+        )
+    
+    def export_trace(self):
+        """Write the recorded spans beside the log for chrome://tracing."""
+        from datetime import datetime
+        folder = self.logger.log_file.parent / "traces"
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+            count = tracer.export_jsonl(folder / f"trace_{stamp}.jsonl")
+            tracer.export_chrome(folder / f"trace_{stamp}.json")
+            self.logger.info(f"Exported {count} trace spans to {folder}")
+        except Exception as e:
+            self.logger.error(f"Trace export failed: {str(e)}")
+    
     def get_timestamp(self) -> str:
         """Get current timestamp string."""
         from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
+    def showEvent(self, event):
+        """Finish startup once the first frame has been drawn."""
+        super().showEvent(event)
+        if self.startup_pending:
+            timeline.mark("window shown")
+            # Queued behind the paint events the show just posted
+            QTimer.singleShot(0, self.finish_startup)
+    
+    @traced()
+    def finish_startup(self):
+        """Start the work deferred from __init__."""
+        self.startup_pending = False
+        timeline.mark("first paint")
+        
+        from roblox_launcher import RobloxLauncher
+        
+        # Resolve the player in the background so Launch is instant
+        RobloxLauncher.warm_cache()
+        self.setup_status_checker()
+        self.load_existing_content()
+        timeline.mark("interactive")
+    
+    def changeEvent(self, event):
+        """Adapt Roblox status polling to window visibility and focus."""
+        if self.process_watcher is not None:
+            if event.type() == QEvent.Type.WindowStateChange:
+                self.process_watcher.set_background(self.isMinimized())
+            elif event.type() == QEvent.Type.ActivationChange and self.isActiveWindow():
+                self.process_watcher.set_background(False)
+                self.process_watcher.focused()
+        super().changeEvent(event)
+    
     def closeEvent(self, event):
         """Handle window close event."""
+        # Results already queued for the event loop would otherwise reach
+        # the handlers after the logger is shut down, or show a dialog
+        self.apply_pipeline.stage.disconnect(self.on_apply_stage)
+        self.apply_pipeline.finished.disconnect(self.on_apply_finished)
+        
+        # Abandon queued saves; one past its replace step finishes first
+        if self.apply_pipeline.is_busy():
+            self.apply_pipeline.cancel()
+            self.apply_pipeline.wait()
+            self.logger.warning("Pending save cancelled on exit")
+        
+        if self.telemetry is not None:
+            self.telemetry.stop()
+        if self.process_watcher is not None:
+            self.process_watcher.stop()
+            scans = self.process_watcher.stats()
+            self.logger.info(
+                f"Roblox status scans: {scans['checks']} "
+                f"(fixed 3 s polling: {scans['fixed_checks']})"
+            )
+        stats = JsonValidator.cache.stats()
+        self.logger.info(
+            f"Parse cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['entries']} entries"
+        )
+        log_stats = self.logger.stats()
+        if log_stats["dropped"]:
+            self.logger.warning(f"Dropped {log_stats['dropped']} log records (queue full)")
+        if tracer.enabled:
+            self.export_trace()
         self.logger.info("Application closed")
+        
+        # Flush every queued record before the window goes away
+        self.logger.shutdown()
         event.accept()
 
 
@@ -1181,6 +1367,8 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("NovaStrap")
     app.setOrganizationName("Nova")
+    theme.apply(app)
+    timeline.mark("qt started")
     
     window = MainWindow()
     window.show()
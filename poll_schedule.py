@@ -0,0 +1,104 @@
+"""
+PollSchedule - Adaptive interval for periodic background checks
+"""
+import time
+from typing import Dict
+
+
+class PollSchedule:
+    """
+    Decides how long to wait before the next check.
+    
+    The interval grows while nothing changes, grows further while the
+    window is in the background, and drops to fast polling for a few
+    checks after a launch. Focusing the window asks for one check now,
+    at most once per FOCUS_COOLDOWN_MS, so switching windows back and
+    forth does not keep the checks fast.
+    """
+    
+    FAST_MS = 1000
+    BASE_MS = 3000
+    MAX_FOREGROUND_MS = 30000
+    MAX_BACKGROUND_MS = 120000
+    BACKOFF = 1.5
+    FAST_CHECKS = 10
+    FOCUS_COOLDOWN_MS = 30000
+    
+    def __init__(self):
+        """Initialize PollSchedule in the foreground at the base interval."""
+        self.background = False
+        self.checks = 0
+        self._interval_ms = float(self.BASE_MS)
+        self._fast_left = 0
+        self._started = time.monotonic()
+        self._last_focus = None
+    
+    def record(self, changed: bool) -> float:
+        """
+        Record a completed check and get the delay before the next one.
+        
+        Args:
+            changed: Whether the check found a change
+        
+        Returns:
+            Delay in milliseconds
+        """
+        self.checks += 1
+        
+        if changed:
+            self._interval_ms = float(self.BASE_MS)
+        
+        if self._fast_left:
+            self._fast_left -= 1
+            return self.FAST_MS
+        
+        if not changed:
+            cap = self.MAX_BACKGROUND_MS if self.background else self.MAX_FOREGROUND_MS
+            factor = self.BACKOFF * self.BACKOFF if self.background else self.BACKOFF
+            self._interval_ms = min(self._interval_ms * factor, cap)
+        return self._interval_ms
+    
+    def set_background(self, background: bool) -> None:
+        """
+        Note whether the window is hidden or minimized.
+        
+        Args:
+            background: True while the window is not visible
+        """
+        self.background = background
+        if not background:
+            self._interval_ms = min(self._interval_ms, float(self.BASE_MS))
+    
+    def boost(self) -> None:
+        """Poll fast for the next few checks, e.g. after a launch."""
+        self._interval_ms = float(self.BASE_MS)
+        self._fast_left = self.FAST_CHECKS
+    
+    def focus(self) -> bool:
+        """
+        Note that the window gained focus.
+        
+        Returns:
+            True if a check should run now; False within FOCUS_COOLDOWN_MS
+            of the last focus that asked for one
+        """
+        now = time.monotonic()
+        if self._last_focus is not None and (now - self._last_focus) * 1000 < self.FOCUS_COOLDOWN_MS:
+            return False
+        self._last_focus = now
+        self._interval_ms = float(self.BASE_MS)
+        return True
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get check counts.
+        
+        Returns:
+            Dictionary with the checks done and the checks a fixed
+            BASE_MS interval would have done over the same time
+        """
+        elapsed_ms = (time.monotonic() - self._started) * 1000
+        return {
+            "checks": self.checks,
+            "fixed_checks": int(elapsed_ms // self.BASE_MS) + 1,
+        }
@@ -2,7 +2,9 @@
 ProcessWatcher - Detects if Roblox processes are running
 """
 import psutil
-from typing import List
+from typing import Dict, List, Optional
+
+from tracing import traced
 
 
 class ProcessWatcher:
@@ -16,6 +18,87 @@ class ProcessWatcher:
         "RobloxStudio.exe"
     ]
     
+    def __init__(self):
+        """Initialize ProcessWatcher with no processes known yet."""
+        # Creation time of the process inspected under each PID at the last
+        # refresh; a PID not in here, or now held by a newer process, is inspected
+        self._seen: Dict[int, float] = {}
+        # Roblox processes being tracked, by PID
+        self._roblox: Dict[int, psutil.Process] = {}
+        self.scans = 0
+    
+    @traced()
+    def refresh(self) -> bool:
+        """
+        Update the tracked Roblox processes.
+        
+        Each PID's creation time is read, and process names are looked up
+        only for PIDs that are new or reused since the last refresh. PIDs
+        whose name could not be read are tried again next time. Tracked
+        processes are checked for exit.
+        
+        Returns:
+            True if the set of running Roblox processes changed
+        """
+        self.scans += 1
+        try:
+            pids = psutil.pids()
+        except Exception:
+            return False
+        
+        changed = False
+        for pid, proc in list(self._roblox.items()):
+            # is_running() also catches a reused PID via the creation time
+            if not proc.is_running():
+                del self._roblox[pid]
+                changed = True
+        
+        seen = {}
+        for pid in pids:
+            try:
+                proc = psutil.Process(pid)
+                created = self._creation_time(proc)
+                if created is not None and self._seen.get(pid) == created:
+                    seen[pid] = created
+                    continue
+                if proc.name() in self.ROBLOX_PROCESS_NAMES and pid not in self._roblox:
+                    self._roblox[pid] = proc
+                    changed = True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if created is not None:
+                seen[pid] = created
+        
+        self._seen = seen
+        return changed
+    
+    @staticmethod
+    def _creation_time(proc: psutil.Process) -> Optional[float]:
+        """Creation time of a process, None if it cannot be read."""
+        try:
+            return proc.create_time()
+        except psutil.AccessDenied:
+            return None
+    
+    def running(self) -> bool:
+        """Whether a Roblox process was running at the last refresh."""
+        return bool(self._roblox)
+    
+    def running_processes(self) -> Dict[int, str]:
+        """
+        Get the Roblox processes found at the last refresh.
+        
+        Returns:
+            Dictionary of PID to process name
+        """
+        names = {}
+        for pid, proc in self._roblox.items():
+            try:
+                names[pid] = proc.name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return names
+    
     @staticmethod
     def is_roblox_running() -> bool:
         """
@@ -0,0 +1,101 @@
+"""
+ProcessWatcherThread - Watches Roblox processes on a background thread
+"""
+import threading
+from typing import Dict, Optional
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from poll_schedule import PollSchedule
+from process_watcher import ProcessWatcher
+
+
+class ProcessWatcherThread(QThread):
+    """
+    Keeps the Roblox process state current without touching the UI thread.
+    
+    Callers read the state from memory; the state_changed signal fires only
+    when Roblox starts or exits. Scans follow an adaptive PollSchedule.
+    """
+    
+    # Emitted with (is_running, {pid: name}) whenever the state changes
+    state_changed = pyqtSignal(bool, dict)
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize ProcessWatcherThread.
+        
+        Args:
+            parent: Owning QObject
+        """
+        super().__init__(parent)
+        self.watcher = ProcessWatcher()
+        self.schedule = PollSchedule()
+        self._lock = threading.Lock()
+        self._running = False
+        self._processes: Dict[int, str] = {}
+        self._wake = threading.Event()
+        self._stop = False
+    
+    def is_running(self) -> bool:
+        """Whether Roblox was running at the last scan."""
+        with self._lock:
+            return self._running
+    
+    def processes(self) -> Dict[int, str]:
+        """Roblox processes found at the last scan, as {pid: name}."""
+        with self._lock:
+            return dict(self._processes)
+    
+    def scan_now(self) -> None:
+        """Scan immediately and poll fast for a while, e.g. right after a launch."""
+        with self._lock:
+            self.schedule.boost()
+        self._wake.set()
+    
+    def focused(self) -> None:
+        """Scan soon after the window gains focus; see PollSchedule.focus."""
+        with self._lock:
+            scan = self.schedule.focus()
+        if scan:
+            self._wake.set()
+    
+    def set_background(self, background: bool) -> None:
+        """
+        Back off further while the window is hidden or minimized.
+        
+        Args:
+            background: True while the window is not visible
+        """
+        with self._lock:
+            self.schedule.set_background(background)
+    
+    def stats(self) -> Dict[str, int]:
+        """Scan counts from the schedule; see PollSchedule.stats."""
+        with self._lock:
+            return self.schedule.stats()
+    
+    def stop(self) -> None:
+        """Stop the thread and wait for it to exit."""
+        self._stop = True
+        self._wake.set()
+        self.wait()
+    
+    def run(self) -> None:
+        """Thread body: scan, publish changes, sleep until the next scan."""
+        first = True
+        while not self._stop:
+            # Cleared before scanning so a wake-up during the scan is kept
+            self._wake.clear()
+            changed = self.watcher.refresh()
+            if changed or first:
+                processes = self.watcher.running_processes()
+                with self._lock:
+                    self._running = bool(processes)
+                    self._processes = processes
+                self.state_changed.emit(bool(processes), processes)
+                first = False
+            
+            with self._lock:
+                delay_ms = self.schedule.record(changed)
+            self._wake.wait(delay_ms / 1000)
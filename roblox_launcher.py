@@ -3,18 +3,39 @@ RobloxLauncher - Handles launching Roblox with applied FFlags
 """
 import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
+
+from tracing import traced
+
+try:
+    import win32api
+except ImportError:
+    win32api = None
 
 
 class RobloxLauncher:
     """Launches Roblox player after applying FFlags."""
     
+    # Handle of the most recently launched client, for telemetry
+    last_process: Optional[subprocess.Popen] = None
+    
+    # Discovery cache: (Versions folder, its mtime_ns, resolved player or
+    # None, players missing from version folders at the time of the scan)
+    _install_cache: Optional[Tuple[Path, int, Optional[Path], Tuple[Path, ...]]] = None
+    _install_lock = threading.Lock()
+    
     @staticmethod
+    @traced()
     def find_roblox_player() -> Optional[Path]:
         """
         Find the Roblox player executable.
         
+        The result is cached until the Versions folder's modification time
+        changes, i.e. until an install is added or removed, or until a
+        version folder that had no player when scanned gets one.
+        
         Returns:
             Path to RobloxPlayerBeta.exe if found, None otherwise
         """
@@ -23,44 +44,146 @@ class RobloxLauncher:
             if not local_appdata:
                 return None
             
-            roblox_path = Path(local_appdata) / "Roblox"
-            if not roblox_path.exists():
+            versions_path = Path(local_appdata) / "Roblox" / "Versions"
+            try:
+                mtime = versions_path.stat().st_mtime_ns
+            except OSError:
                 return None
             
-            # Look for RobloxPlayerBeta.exe in Versions folders
-            versions_path = roblox_path / "Versions"
-            if not versions_path.exists():
-                return None
-            
-            # Find the most recent version folder
-            version_folders = [f for f in versions_path.iterdir() if f.is_dir()]
-            
-            for version_folder in sorted(version_folders, reverse=True):
-                player_exe = version_folder / "RobloxPlayerBeta.exe"
-                if player_exe.exists():
-                    return player_exe
-            
-            return None
+            with RobloxLauncher._install_lock:
+                cached = RobloxLauncher._install_cache
+                if (
+                    cached is not None
+                    and cached[0] == versions_path
+                    and cached[1] == mtime
+                    and (cached[2] is None or cached[2].exists())
+                    and not any(missing.exists() for missing in cached[3])
+                ):
+                    return cached[2]
+                
+                player_exe, missing = RobloxLauncher._newest_install(versions_path)
+                RobloxLauncher._install_cache = (versions_path, mtime, player_exe, missing)
+                return player_exe
             
         except Exception:
             return None
     
     @staticmethod
-    def launch_roblox() -> Tuple[bool, str]:
+    def warm_cache() -> None:
+        """Resolve the player executable on a background thread."""
+        threading.Thread(
+            target=RobloxLauncher.find_roblox_player,
+            name="RobloxInstallDiscovery",
+            daemon=True
+        ).start()
+    
+    @staticmethod
+    def _newest_install(versions_path: Path) -> Tuple[Optional[Path], Tuple[Path, ...]]:
+        """
+        Pick the newest player among the version folders.
+        
+        Version folders are named by hash, so their names say nothing about
+        age. The executable's file version decides when it can be read,
+        then its modification time.
+        
+        Returns:
+            Tuple of (newest player or None, player paths not present, e.g.
+            in an install still being extracted)
+        """
+        best_key = None
+        best_exe = None
+        missing = []
+        with os.scandir(versions_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                player_exe = Path(entry.path) / "RobloxPlayerBeta.exe"
+                try:
+                    mtime = player_exe.stat().st_mtime_ns
+                except OSError:
+                    missing.append(player_exe)
+                    continue
+                key = (RobloxLauncher._file_version(player_exe), mtime)
+                if best_key is None or key > best_key:
+                    best_key, best_exe = key, player_exe
+        return best_exe, tuple(missing)
+    
+    @staticmethod
+    def _file_version(path: Path) -> Tuple[int, ...]:
+        """File version of an executable, or () if unavailable."""
+        if win32api is None:
+            return ()
+        try:
+            info = win32api.GetFileVersionInfo(str(path), "\\")
+            ms, ls = info["FileVersionMS"], info["FileVersionLS"]
+            return (ms >> 16, ms & 0xFFFF, ls >> 16, ls & 0xFFFF)
+        except Exception:
+            return ()
+    
+    @staticmethod
+    @traced()
+    def start_player(
+        place_id: Optional[int] = None,
+        player_exe: Optional[Path] = None,
+        args: Sequence[str] = ()
+    ) -> subprocess.Popen:
+        """
+        Start a Roblox player process.
+        
+        Unlike the launch_* methods this neither records the process in
+        last_process nor catches errors, so several can be started at once.
+        
+        Args:
+            place_id: Roblox place ID to join (optional)
+            player_exe: Executable to run instead of the installed player
+                (e.g. a stand-in client for experiments)
+            args: Extra command-line arguments, placed before the place link
+        
+        Returns:
+            Handle of the started process
+        
+        Raises:
+            Exception: If the player is not found or fails to start
+        """
+        if player_exe is None:
+            player_exe = RobloxLauncher.find_roblox_player()
+        if not player_exe:
+            raise Exception("Roblox player executable not found. Please ensure Roblox is installed.")
+        
+        command = [str(player_exe), *args]
+        if place_id:
+            # Launch with deep link
+            command.append(f"roblox://placeid={place_id}")
+        return subprocess.Popen(command, shell=False)
+    
+    @staticmethod
+    @traced()
+    def launch_roblox(
+        player_exe: Optional[Path] = None,
+        args: Sequence[str] = ()
+    ) -> Tuple[bool, str]:
         """
         Launch Roblox player.
         
+        Args:
+            player_exe: Executable to run instead of the installed player
+                (e.g. a stand-in client for experiments)
+            args: Extra command-line arguments
+        
         Returns:
             Tuple of (success, message)
         """
         try:
-            player_exe = RobloxLauncher.find_roblox_player()
+            if player_exe is None:
+                player_exe = RobloxLauncher.find_roblox_player()
             
             if not player_exe:
                 return False, "Roblox player executable not found. Please ensure Roblox is installed."
             
             # Launch Roblox
-            subprocess.Popen([str(player_exe)], shell=False)
+            RobloxLauncher.last_process = RobloxLauncher.start_player(
+                player_exe=player_exe, args=args
+            )
             
             return True, f"Launched Roblox from {player_exe.parent.name}"
             
@@ -68,6 +191,7 @@ class RobloxLauncher:
             return False, f"Failed to launch Roblox: {str(e)}"
     
     @staticmethod
+    @traced()
     def launch_roblox_with_game(place_id: Optional[int] = None) -> Tuple[bool, str]:
         """
         Launch Roblox with a specific game.
@@ -84,20 +208,16 @@ class RobloxLauncher:
             if not player_exe:
                 return False, "Roblox player executable not found. Please ensure Roblox is installed."
             
+            RobloxLauncher.last_process = RobloxLauncher.start_player(place_id, player_exe)
             if place_id:
-                # Launch with deep link
-                roblox_url = f"roblox://placeid={place_id}"
-                subprocess.Popen([str(player_exe), roblox_url], shell=False)
                 return True, f"Launching Roblox and joining place {place_id}"
-            else:
-                # Launch normally
-                subprocess.Popen([str(player_exe)], shell=False)
-                return True, f"Launched Roblox from {player_exe.parent.name}"
+            return True, f"Launched Roblox from {player_exe.parent.name}"
             
         except Exception as e:
             return False, f"Failed to launch Roblox: {str(e)}"
     
     @staticmethod
+    @traced()
     def get_roblox_version() -> Optional[str]:
         """
         Get the installed Roblox version.
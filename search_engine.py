@@ -0,0 +1,272 @@
+"""
+SearchEngine - Incremental case-insensitive search over the editor text
+"""
+from bisect import bisect_left, bisect_right
+from typing import List
+
+
+def fold_case(text: str) -> str:
+    """
+    Lower-case text without changing its length.
+    
+    Characters whose lower-case form expands (e.g. 'İ') are kept as-is so
+    that offsets in the folded copy line up with editor positions.
+    
+    Args:
+        text: Text to fold
+    
+    Returns:
+        Folded text of the same length
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+class SearchEngine:
+    """
+    Keeps a case-folded copy of the editor text and finds matches in it.
+    
+    The folded text is held in chunks, each with the matches starting in
+    it stored relative to the chunk. An edit refolds and rescans only the
+    chunks it touches, so its cost depends on the chunk size rather than
+    the document size.
+    """
+    
+    # Chunks are split once they grow past twice this many characters
+    CHUNK_SIZE = 16384
+    
+    def __init__(self, text: str = ""):
+        """
+        Initialize SearchEngine.
+        
+        Args:
+            text: Initial document text
+        """
+        self._chunks: List[str] = []
+        # Document offset of each chunk's first character
+        self._starts: List[int] = []
+        # Per chunk, offsets (relative to the chunk) of matches starting in it
+        self._hits: List[List[int]] = []
+        self._length = 0
+        self._total = 0
+        self._needle = ""
+        self._flat: List[int] = []
+        self._flat_valid = True
+        self.reset(text)
+    
+    def __len__(self) -> int:
+        """Length of the indexed text."""
+        return self._length
+    
+    def reset(self, text: str) -> None:
+        """
+        Rebuild the index from the full document text.
+        
+        Args:
+            text: Full document text
+        """
+        self._chunks = self._split(fold_case(text)) or [""]
+        self._length = len(text)
+        self._restart(0)
+        self._rescan_all()
+    
+    def apply_change(self, position: int, chars_removed: int, added_text: str) -> None:
+        """
+        Apply a document edit, as reported by QTextDocument.contentsChange.
+        
+        Only the chunks holding the edited range are refolded, and only
+        they and the chunks whose matches could reach into the edit are
+        rescanned.
+        
+        Args:
+            position: Offset where the edit starts
+            chars_removed: Number of characters removed at position
+            added_text: Text inserted at position
+        """
+        end = position + chars_removed
+        first = self._chunk_at(position)
+        last = self._chunk_at(end)
+        
+        starts = self._starts
+        chunks = self._chunks
+        merged = (
+            chunks[first][:position - starts[first]]
+            + fold_case(added_text)
+            + chunks[last][end - starts[last]:]
+        )
+        pieces = self._split(merged)
+        if not pieces and len(chunks) == last - first + 1:
+            pieces = [""]
+        
+        removed_hits = self._hits[first:last + 1]
+        chunks[first:last + 1] = pieces
+        self._hits[first:last + 1] = [[] for _ in pieces]
+        self._length += len(added_text) - chars_removed
+        self._restart(first)
+        
+        if not self._needle:
+            return
+        
+        self._total -= sum(map(len, removed_hits))
+        self._flat_valid = False
+        
+        # Matches starting up to len(needle) - 1 characters before the edit
+        # may run into it, so earlier chunks reaching that far are rescanned
+        reach = position - len(self._needle) + 1
+        scan_from = min(first, len(chunks) - 1)
+        while scan_from > 0 and starts[scan_from] > reach:
+            scan_from -= 1
+        for index in range(scan_from, first + len(pieces)):
+            self._rescan(index)
+    
+    def find(self, needle: str) -> int:
+        """
+        Make needle the active search text.
+        
+        Args:
+            needle: Text to search for, empty to clear the search
+        
+        Returns:
+            Number of (possibly overlapping) case-insensitive matches
+        """
+        folded = fold_case(needle)
+        if folded == self._needle:
+            return self._total
+        
+        previous = self._needle
+        self._needle = folded
+        self._flat_valid = False
+        if not folded:
+            self._hits = [[] for _ in self._chunks]
+            self._total = 0
+        elif previous and folded.startswith(previous):
+            # Typing more characters can only narrow the previous result
+            total = 0
+            for index, hits in enumerate(self._hits):
+                if hits:
+                    text = self._window(index)
+                    hits[:] = [p for p in hits if text.startswith(folded, p)]
+                    total += len(hits)
+            self._total = total
+        else:
+            self._rescan_all()
+        return self._total
+    
+    def find_all(self, needle: str) -> List[int]:
+        """
+        Find all (possibly overlapping) case-insensitive matches.
+        
+        Args:
+            needle: Text to search for
+        
+        Returns:
+            Sorted list of match start offsets. The list is owned by the
+            engine and must not be modified.
+        """
+        self.find(needle)
+        if not self._flat_valid:
+            self._flat = [
+                start + p for start, hits in zip(self._starts, self._hits) for p in hits
+            ]
+            self._flat_valid = True
+        return self._flat
+    
+    def match_count(self) -> int:
+        """Number of matches of the active needle."""
+        return self._total
+    
+    def match_at(self, index: int) -> int:
+        """
+        Get the offset of one match of the active needle.
+        
+        Args:
+            index: Match number, 0 <= index < match_count()
+        
+        Returns:
+            Document offset where the match starts
+        """
+        for start, hits in zip(self._starts, self._hits):
+            if index < len(hits):
+                return start + hits[index]
+            index -= len(hits)
+        raise IndexError("match index out of range")
+    
+    def matches_between(self, start: int, stop: int) -> List[int]:
+        """
+        Get the active matches starting within [start, stop).
+        
+        Args:
+            start: First offset of the range
+            stop: End offset of the range (exclusive)
+        
+        Returns:
+            Sorted list of match offsets from the active needle
+        """
+        found = []
+        if stop <= start or not self._total:
+            return found
+        first = self._chunk_at(max(0, start))
+        last = self._chunk_at(min(stop, self._length))
+        for index in range(first, last + 1):
+            base = self._starts[index]
+            hits = self._hits[index]
+            lo = bisect_left(hits, start - base)
+            hi = bisect_left(hits, stop - base, lo)
+            found.extend(base + p for p in hits[lo:hi])
+        return found
+    
+    def _split(self, text: str) -> List[str]:
+        """Cut text into chunks no longer than twice CHUNK_SIZE."""
+        size = self.CHUNK_SIZE
+        if len(text) <= 2 * size:
+            return [text] if text else []
+        return [text[i:i + size] for i in range(0, len(text), size)]
+    
+    def _chunk_at(self, position: int) -> int:
+        """Index of the chunk holding position; the end belongs to the last chunk."""
+        return max(0, bisect_right(self._starts, position) - 1)
+    
+    def _restart(self, first: int) -> None:
+        """Recompute chunk start offsets from chunk first on."""
+        starts = self._starts
+        del starts[first:]
+        offset = starts[-1] + len(self._chunks[first - 1]) if first else 0
+        for chunk in self._chunks[first:]:
+            starts.append(offset)
+            offset += len(chunk)
+    
+    def _window(self, index: int) -> str:
+        """A chunk plus the following characters a match starting in it can reach."""
+        text = self._chunks[index]
+        extra = len(self._needle) - 1
+        following = index + 1
+        while extra > 0 and following < len(self._chunks):
+            piece = self._chunks[following][:extra]
+            text += piece
+            extra -= len(piece)
+            following += 1
+        return text
+    
+    def _rescan(self, index: int) -> None:
+        """Find the active needle's matches starting in one chunk."""
+        text = self._window(index)
+        needle = self._needle
+        limit = len(self._chunks[index])
+        found = []
+        position = text.find(needle)
+        while position != -1 and position < limit:
+            found.append(position)
+            position = text.find(needle, position + 1)
+        self._total += len(found) - len(self._hits[index])
+        self._hits[index] = found
+    
+    def _rescan_all(self) -> None:
+        """Find the active needle's matches in every chunk."""
+        self._hits = [[] for _ in self._chunks]
+        self._total = 0
+        self._flat_valid = False
+        if self._needle:
+            for index in range(len(self._chunks)):
+                self._rescan(index)
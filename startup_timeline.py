@@ -0,0 +1,101 @@
+"""
+StartupTimeline - Records how long each startup phase takes
+"""
+import time
+from typing import List, Optional, Tuple
+
+
+class StartupTimeline:
+    """
+    Collects named marks from process start to an interactive window.
+    
+    Times are measured from when this module was first imported, so import
+    it before anything heavy. report() also includes the time the process
+    spent before that (interpreter start and, in the PyInstaller build,
+    unpacking) when psutil can tell.
+    """
+    
+    def __init__(self):
+        """Initialize StartupTimeline, starting the clock now."""
+        self.start = time.perf_counter()
+        self._start_wall = time.time()
+        self._marks: List[Tuple[str, float]] = []
+    
+    def mark(self, name: str) -> float:
+        """
+        Record that a phase finished. Repeated names are ignored.
+        
+        Args:
+            name: Phase name
+        
+        Returns:
+            Seconds since the timeline started
+        """
+        elapsed = time.perf_counter() - self.start
+        if self.elapsed(name) is None:
+            self._marks.append((name, elapsed))
+        return elapsed
+    
+    def elapsed(self, name: str) -> Optional[float]:
+        """
+        Get when a phase finished.
+        
+        Args:
+            name: Phase name
+        
+        Returns:
+            Seconds since the timeline started, None if not marked yet
+        """
+        for mark_name, elapsed in self._marks:
+            if mark_name == name:
+                return elapsed
+        return None
+    
+    def marks(self) -> List[Tuple[str, float]]:
+        """
+        Get all marks in the order they were recorded.
+        
+        Returns:
+            List of (name, seconds since start) tuples
+        """
+        return list(self._marks)
+    
+    def process_overhead(self) -> Optional[float]:
+        """
+        Get how long the process ran before the timeline started.
+        
+        Returns:
+            Seconds, or None if psutil is unavailable
+        """
+        try:
+            import psutil
+            created = psutil.Process().create_time()
+        except Exception:
+            return None
+        return max(0.0, self._start_wall - created)
+    
+    def report(self) -> str:
+        """
+        Format the timeline, one phase per line.
+        
+        Returns:
+            Report text with each phase's duration and cumulative time
+        """
+        lines = []
+        overhead = self.process_overhead()
+        offset = overhead or 0.0
+        if overhead is not None:
+            lines.append(f"{'process start':<18} {overhead * 1000:8.1f} ms  {overhead * 1000:8.1f} ms")
+        
+        previous = 0.0
+        for name, elapsed in self._marks:
+            lines.append(
+                f"{name:<18} {(elapsed - previous) * 1000:8.1f} ms  "
+                f"{(elapsed + offset) * 1000:8.1f} ms"
+            )
+            previous = elapsed
+        return "\n".join(lines)
+
+
+# Started when main.py imports this module, before Qt and the managers
+timeline = StartupTimeline()
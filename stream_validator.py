@@ -0,0 +1,280 @@
+"""
+StreamValidator - Validates large FFlag JSON documents entry by entry
+"""
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Iterator, TextIO, Tuple, Union
+
+
+# Characters that can end or nest a value outside of strings
+_STRUCTURE = re.compile(r'["{}\[\],]')
+# Characters that end or escape inside a string
+_STRING_SPECIAL = re.compile(r'["\\]')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class StreamValidationError(ValueError):
+    """Raised when a streamed document is invalid."""
+    
+    def __init__(self, msg: str, pos: int, lineno: int, colno: int):
+        """
+        Initialize StreamValidationError.
+        
+        Args:
+            msg: Error description
+            pos: Character offset of the error in the document
+            lineno: Line number of the error (1-based)
+            colno: Column number of the error (1-based)
+        """
+        super().__init__(f"{msg} at line {lineno}, column {colno}")
+        self.msg = msg
+        self.pos = pos
+        self.lineno = lineno
+        self.colno = colno
+
+
+class StreamValidator:
+    """
+    Walks the top-level object of a JSON document one entry at a time.
+    
+    Only the entry being parsed is held in memory when reading from a file,
+    and limits apply per entry rather than to the whole document.
+    """
+    
+    CHUNK_SIZE = 64 * 1024
+    MAX_KEY_LENGTH = 1024
+    MAX_ENTRY_SIZE = 256 * 1024
+    
+    def __init__(
+        self,
+        source: Union[str, TextIO],
+        chunk_size: int = CHUNK_SIZE,
+        max_key_length: int = MAX_KEY_LENGTH,
+        max_entry_size: int = MAX_ENTRY_SIZE,
+    ):
+        """
+        Initialize StreamValidator.
+        
+        Args:
+            source: JSON text, or a text file object to read in chunks
+            chunk_size: Characters to read per chunk from a file
+            max_key_length: Maximum length of a flag name
+            max_entry_size: Maximum characters for one key/value pair
+        """
+        self.chunk_size = chunk_size
+        self.max_key_length = max_key_length
+        self.max_entry_size = max_entry_size
+        self._decoder = json.JSONDecoder()
+        
+        if isinstance(source, str):
+            self._fp = None
+            self._buf = source
+            self._eof = True
+        else:
+            self._fp = source
+            self._buf = ""
+            self._eof = False
+        
+        # Position of _buf[0] within the whole document
+        self._offset = 0
+        self._line = 0
+        self._line_start = 0
+        self._pos = 0
+    
+    def entries(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the top-level key/value pairs in document order.
+        
+        Yields:
+            Tuples of (key, value)
+        
+        Raises:
+            StreamValidationError: If the document is invalid
+        """
+        self._skip_whitespace()
+        if self._pos >= len(self._buf):
+            self._error("JSON content is empty", self._pos)
+        if self._buf[self._pos] != "{":
+            self._error("Top-level JSON must be an object ({})", self._pos)
+        self._pos += 1
+        
+        self._skip_whitespace()
+        if self._pos < len(self._buf) and self._buf[self._pos] == "}":
+            self._pos += 1
+        else:
+            while True:
+                self._compact()
+                self._skip_whitespace()
+                start = self._pos
+                end = self._find_entry_end(start)
+                yield self._parse_entry(start, end)
+                
+                self._pos = end + 1
+                if self._buf[end] == "}":
+                    break
+        
+        self._skip_whitespace()
+        if self._pos < len(self._buf):
+            self._error("Extra data", self._pos)
+    
+    def validate(self) -> int:
+        """
+        Validate the whole document.
+        
+        Returns:
+            Number of top-level entries
+        
+        Raises:
+            StreamValidationError: If the document is invalid
+        """
+        count = 0
+        for _ in self.entries():
+            count += 1
+        return count
+    
+    def write_formatted(self, out: TextIO) -> int:
+        """
+        Validate the document while writing its canonical indent=2 form.
+        
+        The output matches json.dumps(data, indent=2, ensure_ascii=False).
+        
+        Args:
+            out: Text file object to write to
+        
+        Returns:
+            Number of top-level entries
+        
+        Raises:
+            StreamValidationError: If the document is invalid
+        """
+        count = 0
+        for key, value in self.entries():
+            out.write(",\n  " if count else "{\n  ")
+            out.write(json.dumps(key, ensure_ascii=False))
+            out.write(": ")
+            out.write(json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n  "))
+            count += 1
+        out.write("\n}" if count else "{}")
+        return count
+    
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer. Returns False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+    
+    def _compact(self) -> None:
+        """Drop already-parsed text from the buffer."""
+        if self._fp is None or self._pos == 0:
+            return
+        
+        consumed = self._buf[:self._pos]
+        newlines = consumed.count("\n")
+        if newlines:
+            self._line += newlines
+            self._line_start = self._offset + consumed.rfind("\n") + 1
+        self._offset += self._pos
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+    
+    def _skip_whitespace(self) -> None:
+        """Advance past whitespace, reading more input as needed."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return
+    
+    def _find_entry_end(self, start: int) -> int:
+        """
+        Find the ',' or '}' that ends the entry starting at start.
+        
+        Strings and nested containers are skipped, so the returned
+        delimiter is at nesting depth zero.
+        """
+        i = start
+        depth = 0
+        in_string = False
+        while True:
+            if in_string:
+                match = _STRING_SPECIAL.search(self._buf, i)
+                if match is None:
+                    i = len(self._buf)
+                elif match.group() == '"':
+                    i = match.end()
+                    in_string = False
+                    continue
+                elif match.end() < len(self._buf):
+                    # Skip the escaped character along with the backslash
+                    i = match.end() + 1
+                    continue
+                else:
+                    # Backslash is the last buffered character; resume at it
+                    i = match.start()
+            else:
+                match = _STRUCTURE.search(self._buf, i)
+                if match is None:
+                    i = len(self._buf)
+                else:
+                    char = match.group()
+                    i = match.end()
+                    if char == '"':
+                        in_string = True
+                    elif char in "{[":
+                        depth += 1
+                    elif depth:
+                        if char in "}]":
+                            depth -= 1
+                    elif char in ",}":
+                        return match.start()
+                    continue
+            
+            # Entry continues past the buffered text
+            if len(self._buf) - start > self.max_entry_size:
+                self._error(f"Entry too large (max {self.max_entry_size} characters)", start)
+            if not self._fill():
+                # Let the decoder describe what is missing
+                self._parse_entry(start, len(self._buf))
+                self._error("Expecting ',' delimiter", len(self._buf))
+    
+    def _parse_entry(self, start: int, end: int) -> Tuple[str, Any]:
+        """Decode the key/value pair in _buf[start:end]."""
+        buf = self._buf
+        if end - start > self.max_entry_size:
+            self._error(f"Entry too large (max {self.max_entry_size} characters)", start)
+        if start >= len(buf) or buf[start] != '"':
+            self._error("Expecting property name enclosed in double quotes", start)
+        
+        try:
+            key, pos = scanstring(buf, start + 1)
+            if len(key) > self.max_key_length:
+                self._error(f"Key too long (max {self.max_key_length} characters)", start)
+            
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos >= len(buf) or buf[pos] != ":":
+                self._error("Expecting ':' delimiter", pos)
+            pos = _WHITESPACE.match(buf, pos + 1).end()
+            
+            value, pos = self._decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError as e:
+            self._error(e.msg, e.pos)
+        
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos != end:
+            self._error("Expecting ',' delimiter", pos)
+        return key, value
+    
+    def _error(self, msg: str, buf_pos: int) -> None:
+        """Raise a StreamValidationError for a position in the buffer."""
+        newline = self._buf.rfind("\n", 0, buf_pos)
+        lineno = self._line + self._buf.count("\n", 0, buf_pos) + 1
+        if newline >= 0:
+            colno = buf_pos - newline
+        else:
+            colno = self._offset + buf_pos - self._line_start + 1
+        raise StreamValidationError(msg, self._offset + buf_pos, lineno, colno)
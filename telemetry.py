@@ -0,0 +1,232 @@
+"""
+Telemetry - Samples resource usage of a launched client process tree
+"""
+import csv
+import json
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+import psutil
+
+
+class TelemetrySample(NamedTuple):
+    """Resource usage of the whole process tree at one point in time."""
+    
+    elapsed: float
+    processes: int
+    cpu_percent: float
+    rss_bytes: int
+    threads: int
+    read_bytes: int
+    write_bytes: int
+
+
+class TelemetrySampler:
+    """
+    Samples CPU, memory, threads and IO of a process and its children.
+    
+    Samples go into a fixed-size ring buffer, so a long session keeps the
+    most recent window. Sampling runs on a daemon thread until the root
+    process exits or stop() is called.
+    """
+    
+    INTERVAL = 1.0
+    CAPACITY = 3600
+    
+    def __init__(
+        self,
+        process: Union[int, subprocess.Popen],
+        interval: float = INTERVAL,
+        capacity: int = CAPACITY,
+        on_exit: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Initialize TelemetrySampler.
+        
+        Args:
+            process: PID or Popen handle of the client process
+            interval: Seconds between samples
+            capacity: Maximum samples kept; older ones are dropped
+            on_exit: Called from the sampling thread with summary() once
+                the root process exits
+        
+        Raises:
+            psutil.NoSuchProcess: If the process does not exist
+        """
+        self.popen = process if isinstance(process, subprocess.Popen) else None
+        self.pid = process.pid if self.popen is not None else process
+        self.interval = interval
+        self.on_exit = on_exit
+        self._samples: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.dropped = 0
+        self.exit_code: Optional[int] = None
+        
+        self._root = psutil.Process(self.pid)
+        # Process objects by PID; cpu_percent() measures since the previous call
+        self._procs: Dict[int, psutil.Process] = {}
+        # Last IO counters per PID, so exited children keep their totals
+        self._io: Dict[int, Any] = {}
+        self._io_done = [0, 0]
+        self._started = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Start sampling on a background thread."""
+        self._thread = threading.Thread(target=self._run, name="TelemetrySampler", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop sampling and wait for the thread to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def samples(self) -> List[TelemetrySample]:
+        """
+        Get the buffered samples.
+        
+        Returns:
+            Samples, oldest first
+        """
+        with self._lock:
+            return list(self._samples)
+    
+    def root_alive(self) -> bool:
+        """Whether the root process is still running."""
+        if self.popen is not None:
+            # poll() also reaps the child, which psutil would see as a zombie
+            return self.popen.poll() is None
+        try:
+            return self._root.is_running() and self._root.status() != psutil.STATUS_ZOMBIE
+        except psutil.NoSuchProcess:
+            return False
+    
+    def sample(self) -> Optional[TelemetrySample]:
+        """
+        Take one sample of the process tree.
+        
+        Returns:
+            The sample, or None if the root process is gone
+        """
+        try:
+            tree = [self._root] + self._root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return None
+        
+        procs = {}
+        cpu = 0.0
+        rss = threads = 0
+        for proc in tree:
+            # Reuse the known object so cpu_percent() has a previous reading
+            proc = self._procs.get(proc.pid, proc)
+            try:
+                with proc.oneshot():
+                    cpu += proc.cpu_percent(None)
+                    rss += proc.memory_info().rss
+                    threads += proc.num_threads()
+                    try:
+                        self._io[proc.pid] = proc.io_counters()
+                    except (AttributeError, psutil.AccessDenied):
+                        pass
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            procs[proc.pid] = proc
+        
+        # Fold IO of exited processes into the running total
+        for pid in list(self._io):
+            if pid not in procs:
+                counters = self._io.pop(pid)
+                self._io_done[0] += counters.read_bytes
+                self._io_done[1] += counters.write_bytes
+        self._procs = procs
+        
+        read = self._io_done[0] + sum(c.read_bytes for c in self._io.values())
+        write = self._io_done[1] + sum(c.write_bytes for c in self._io.values())
+        
+        entry = TelemetrySample(
+            elapsed=round(time.monotonic() - self._started, 3),
+            processes=len(procs),
+            cpu_percent=round(cpu, 1),
+            rss_bytes=rss,
+            threads=threads,
+            read_bytes=read,
+            write_bytes=write
+        )
+        with self._lock:
+            if len(self._samples) == self._samples.maxlen:
+                self.dropped += 1
+            self._samples.append(entry)
+        return entry
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the recorded samples.
+        
+        Returns:
+            Dictionary of duration, sample counts, CPU average and peak,
+            memory average and peak, peak threads and processes, IO totals
+            and exit code
+        """
+        samples = self.samples()
+        result: Dict[str, Any] = {
+            "pid": self.pid,
+            "exit_code": self.exit_code,
+            "duration": round(time.monotonic() - self._started, 3),
+            "samples": len(samples),
+            "dropped": self.dropped,
+        }
+        if samples:
+            result.update({
+                "cpu_avg": round(sum(s.cpu_percent for s in samples) / len(samples), 1),
+                "cpu_max": max(s.cpu_percent for s in samples),
+                "rss_avg": sum(s.rss_bytes for s in samples) // len(samples),
+                "rss_max": max(s.rss_bytes for s in samples),
+                "threads_max": max(s.threads for s in samples),
+                "processes_max": max(s.processes for s in samples),
+                "read_bytes": samples[-1].read_bytes,
+                "write_bytes": samples[-1].write_bytes,
+            })
+        return result
+    
+    def export_csv(self, path: Path) -> None:
+        """
+        Write the samples as CSV with a header row.
+        
+        Args:
+            path: Output file
+        """
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(TelemetrySample._fields)
+            writer.writerows(self.samples())
+    
+    def export_json(self, path: Path) -> None:
+        """
+        Write the summary and samples as JSON.
+        
+        Args:
+            path: Output file
+        """
+        data = {
+            "summary": self.summary(),
+            "samples": [s._asdict() for s in self.samples()],
+        }
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    
+    def _run(self) -> None:
+        """Thread body."""
+        while not self._stop.is_set():
+            if not self.root_alive() or self.sample() is None:
+                break
+            self._stop.wait(self.interval)
+        
+        if self.popen is not None:
+            self.exit_code = self.popen.poll()
+        if self.on_exit is not None and not self._stop.is_set():
+            self.on_exit(self.summary())
@@ -0,0 +1,390 @@
+"""
+Theme - The application stylesheet, built once and set on the QApplication
+"""
+import re
+from string import Template
+from typing import Optional
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QWidget
+
+
+# Colors shared by every rule
+PALETTE = {
+    "accent": "#00d9ff",
+    "accent_hover": "#00b8e6",
+    "accent_pressed": "#0099cc",
+    "green": "#00ff88",
+    "green_hover": "#00e67a",
+    "green_pressed": "#00cc6f",
+    "error": "#ff4444",
+    "window": "#121212",
+    "surface": "#1a1a1a",
+    "sunken": "#0d0d0d",
+    "statusbar": "#0a0a0a",
+    "border": "#2a2a2a",
+    "border_hover": "#3a3a3a",
+    "text": "#e0e0e0",
+    "text_dim": "#cccccc",
+    "text_muted": "#888888",
+    "text_disabled": "#666666",
+}
+
+# Dynamic property selecting a QPushButton style
+VARIANT_PROPERTY = "variant"
+PRIMARY = "primary"
+SECONDARY = "secondary"
+LAUNCH = "launch"
+TOOL = "tool"
+CANCEL = "cancel"
+
+# Dynamic property selecting the validation label style
+STATE_PROPERTY = "state"
+VALID = "valid"
+INVALID = "invalid"
+
+_TEMPLATE = """
+QMainWindow {
+    background-color: $window;
+}
+QWidget {
+    background-color: $window;
+    color: $text;
+}
+QLabel {
+    color: $text;
+}
+QMessageBox, QDialog {
+    background-color: $surface;
+}
+QMessageBox QLabel {
+    color: $text;
+}
+QDialog QLabel {
+    background-color: transparent;
+}
+QListView {
+    background-color: $sunken;
+    color: $text;
+    border: 2px solid $border;
+    border-radius: 8px;
+    padding: 5px;
+}
+QListView::item {
+    padding: 8px;
+    border-radius: 4px;
+}
+QListView::item:selected {
+    background-color: $accent;
+    color: #000000;
+}
+QListView::item:hover {
+    background-color: $border;
+}
+QScrollBar:vertical {
+    background-color: $sunken;
+    width: 12px;
+    border-radius: 6px;
+}
+QScrollBar::handle:vertical {
+    background-color: $border;
+    border-radius: 6px;
+    min-height: 20px;
+}
+QScrollBar::handle:vertical:hover {
+    background-color: $border_hover;
+}
+QScrollBar:horizontal {
+    background-color: $sunken;
+    height: 12px;
+    border-radius: 6px;
+}
+QScrollBar::handle:horizontal {
+    background-color: $border;
+    border-radius: 6px;
+    min-width: 20px;
+}
+QScrollBar::handle:horizontal:hover {
+    background-color: $border_hover;
+}
+QScrollBar::add-line, QScrollBar::sub-line {
+    border: none;
+    background: none;
+}
+
+QLabel#brand {
+    font-size: 28px;
+    font-weight: bold;
+    color: $accent;
+    padding: 10px 0;
+    letter-spacing: 2px;
+}
+QLabel#credit {
+    font-size: 11px;
+    color: $text_muted;
+    font-style: italic;
+    padding-bottom: 10px;
+}
+QWidget#pathCard, QWidget#pathCard QWidget,
+QWidget#statusCard, QWidget#statusCard QWidget {
+    background-color: $surface;
+    border-radius: 8px;
+    padding: 12px;
+    border: 1px solid $border;
+}
+QLabel#statusText {
+    color: $text_dim;
+}
+QLabel#editorLabel {
+    font-size: 13px;
+    font-weight: bold;
+    color: $accent;
+    padding-top: 10px;
+}
+QLineEdit#search {
+    background-color: $surface;
+    color: $text;
+    border: 2px solid $border;
+    border-radius: 6px;
+    padding: 8px 12px;
+    font-size: 12px;
+    min-width: 200px;
+}
+QLineEdit#search:focus {
+    border-color: $accent;
+}
+QLabel#searchCount {
+    color: $text_muted;
+    font-size: 11px;
+    padding-left: 8px;
+}
+QTextEdit#editor {
+    background-color: $sunken;
+    color: $text;
+    border: 2px solid $border;
+    border-radius: 8px;
+    padding: 15px;
+    selection-background-color: $accent;
+    selection-color: #000000;
+}
+QTextEdit#editor:focus {
+    border: 2px solid $accent;
+}
+QTableView#flagTable {
+    background-color: $sunken;
+    color: $text;
+    border: 2px solid $border;
+    border-radius: 8px;
+    gridline-color: $surface;
+    selection-background-color: $accent;
+    selection-color: #000000;
+}
+QTableView#flagTable:focus {
+    border: 2px solid $accent;
+}
+QTableView#flagTable QLineEdit {
+    background-color: $surface;
+    color: $text;
+    border: 1px solid $accent;
+}
+QHeaderView::section {
+    background-color: $surface;
+    color: $accent;
+    border: none;
+    border-right: 1px solid $border;
+    padding: 6px;
+    font-weight: bold;
+}
+QPushButton[variant="tool"]:checked {
+    background-color: $accent;
+    color: #000000;
+}
+QLabel#validation {
+    padding: 8px;
+    border-radius: 6px;
+    font-size: 12px;
+}
+QLabel#validation[state="valid"] {
+    background-color: rgba(0, 217, 255, 0.1);
+    border: 1px solid $accent;
+}
+QLabel#validation[state="invalid"] {
+    background-color: rgba(255, 68, 68, 0.1);
+    border: 1px solid $error;
+}
+QStatusBar {
+    background-color: $statusbar;
+    color: $text_muted;
+    border-top: 1px solid $border;
+    padding: 5px;
+}
+
+QPushButton[variant="primary"] {
+    background-color: $accent;
+    color: #000000;
+    border: none;
+    border-radius: 8px;
+    padding: 12px 24px;
+    font-weight: bold;
+    font-size: 13px;
+}
+QPushButton[variant="primary"]:hover {
+    background-color: $accent_hover;
+}
+QPushButton[variant="primary"]:pressed {
+    background-color: $accent_pressed;
+}
+QPushButton[variant="launch"] {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 $green, stop:1 $accent);
+    color: #000000;
+    border: none;
+    border-radius: 8px;
+    padding: 12px 24px;
+    font-weight: bold;
+    font-size: 13px;
+}
+QPushButton[variant="launch"]:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 $green_hover, stop:1 $accent_hover);
+}
+QPushButton[variant="launch"]:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 $green_pressed, stop:1 $accent_pressed);
+}
+QPushButton[variant="primary"]:disabled, QPushButton[variant="launch"]:disabled {
+    background: $border;
+    color: $text_disabled;
+}
+QPushButton[variant="secondary"] {
+    background-color: $surface;
+    color: $text;
+    border: 2px solid $border;
+    border-radius: 8px;
+    padding: 12px 20px;
+    font-weight: 500;
+    font-size: 12px;
+}
+QPushButton[variant="secondary"]:hover {
+    background-color: $border;
+    border-color: $accent;
+    color: $accent;
+}
+QPushButton[variant="secondary"]:pressed {
+    background-color: $sunken;
+}
+QPushButton[variant="secondary"]:disabled {
+    background-color: $sunken;
+    color: $text_disabled;
+    border-color: $surface;
+}
+QPushButton[variant="tool"] {
+    background-color: $border;
+    color: $text;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 12px;
+    font-size: 11px;
+}
+QPushButton[variant="tool"]:hover {
+    background-color: $border_hover;
+    color: $accent;
+}
+
+QDialog#disclaimerDialog QLabel#brand {
+    font-size: 24px;
+    padding: 0px 0px 5px 0px;
+    letter-spacing: 0px;
+}
+QDialog#disclaimerDialog QLabel#credit {
+    font-size: 10px;
+    padding-bottom: 15px;
+}
+QLabel#disclaimerText {
+    color: $text_dim;
+}
+QDialog#backupDialog QLabel {
+    font-size: 13px;
+}
+QDialog#disclaimerDialog QPushButton, QDialog#backupDialog QPushButton {
+    background-color: $accent;
+    color: #000000;
+    border: none;
+    border-radius: 6px;
+    padding: 10px 20px;
+    font-weight: bold;
+}
+QDialog#disclaimerDialog QPushButton:hover, QDialog#backupDialog QPushButton:hover {
+    background-color: $accent_hover;
+}
+QDialog#backupDialog QPushButton[variant="cancel"] {
+    background-color: $border;
+    color: $text;
+    font-weight: normal;
+}
+QDialog#backupDialog QPushButton[variant="cancel"]:hover {
+    background-color: $border_hover;
+}
+"""
+
+_stylesheet: Optional[str] = None
+
+
+def stylesheet() -> str:
+    """
+    Get the application stylesheet.
+    
+    The palette is substituted and the text compacted on the first call only.
+    
+    Returns:
+        QSS text
+    """
+    global _stylesheet
+    if _stylesheet is None:
+        text = Template(_TEMPLATE).substitute(PALETTE)
+        _stylesheet = re.sub(r"\s*([{};,])\s*", r"\1", text).strip()
+    return _stylesheet
+
+
+def apply(app: QApplication) -> None:
+    """
+    Set the stylesheet on the whole application.
+    
+    Call once, before any window is created, so widgets are polished
+    against it a single time.
+    
+    Args:
+        app: Application instance
+    """
+    app.setStyleSheet(stylesheet())
+
+
+def set_variant(widget: QWidget, variant: str) -> None:
+    """
+    Choose a button style.
+    
+    Args:
+        widget: Button to style
+        variant: One of PRIMARY, SECONDARY, LAUNCH, TOOL or CANCEL
+    """
+    _set_property(widget, VARIANT_PROPERTY, variant)
+
+
+def set_state(widget: QWidget, state: str) -> None:
+    """
+    Choose the validation label style.
+    
+    Args:
+        widget: Label to style
+        state: VALID, INVALID or "" for neutral
+    """
+    _set_property(widget, STATE_PROPERTY, state)
+
+
+def _set_property(widget: QWidget, name: str, value: str) -> None:
+    """Set a dynamic property, restyling the widget only if it changed."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    if widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+        # Stylesheets do not watch properties; re-polish this widget alone
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
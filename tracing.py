@@ -0,0 +1,223 @@
+"""
+Tracing - Lightweight span tracing with JSON lines and Chrome trace export
+"""
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span(NamedTuple):
+    """One finished span. Times are nanoseconds on the monotonic clock."""
+    
+    span_id: int
+    parent_id: int
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    thread_name: str
+    attrs: Dict[str, Any]
+
+
+class _NullSpan:
+    """Context manager returned while tracing is disabled."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    """Context manager that records a span on exit."""
+    
+    __slots__ = ("tracer", "name", "attrs", "span_id", "parent_id", "start_ns")
+    
+    def __init__(self, tracer: "Tracer", name: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+    
+    def __enter__(self):
+        stack = self.tracer._stack()
+        self.parent_id = stack[-1] if stack else 0
+        self.span_id = next(self.tracer._ids)
+        stack.append(self.span_id)
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        self.tracer._stack().pop()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        thread = threading.current_thread()
+        self.tracer.spans.append(Span(
+            self.span_id, self.parent_id, self.name, self.start_ns,
+            end_ns - self.start_ns, thread.ident, thread.name, self.attrs
+        ))
+        return False
+
+
+class Tracer:
+    """
+    Records nested spans into a ring buffer.
+    
+    While disabled, span() returns a shared no-op context manager and
+    @traced functions call straight through after one attribute check.
+    """
+    
+    CAPACITY = 10000
+    
+    # Set to 1 to enable tracing at startup
+    ENABLE_ENV = "NOVASTRAP_TRACE"
+    
+    def __init__(self, capacity: int = CAPACITY, enabled: Optional[bool] = None):
+        """
+        Initialize Tracer.
+        
+        Args:
+            capacity: Maximum spans kept; the oldest are dropped first
+            enabled: Start enabled (default: from the NOVASTRAP_TRACE variable)
+        """
+        if enabled is None:
+            enabled = os.getenv(self.ENABLE_ENV, "") not in ("", "0")
+        self.enabled = enabled
+        self.spans: deque = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+    
+    def span(self, name: str, **attrs: Any):
+        """
+        Time a block as a span.
+        
+        Args:
+            name: Span name
+            **attrs: Extra values stored with the span
+        
+        Returns:
+            Context manager
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _ActiveSpan(self, name, attrs)
+    
+    def snapshot(self) -> List[Span]:
+        """
+        Get the recorded spans.
+        
+        Returns:
+            Spans in the order they finished
+        """
+        # Copying a deque while another thread appends can fail; retry
+        while True:
+            try:
+                return list(self.spans)
+            except RuntimeError:
+                continue
+    
+    def clear(self) -> None:
+        """Discard all recorded spans."""
+        self.spans.clear()
+    
+    def export_jsonl(self, path: Path) -> int:
+        """
+        Write spans as JSON lines, one object per span.
+        
+        Args:
+            path: Output file
+        
+        Returns:
+            Number of spans written
+        """
+        spans = self.snapshot()
+        with open(path, "w", encoding="utf-8") as f:
+            for span in spans:
+                record = span._asdict()
+                f.write(json.dumps(record, default=str))
+                f.write("\n")
+        return len(spans)
+    
+    def export_chrome(self, path: Path) -> int:
+        """
+        Write spans in Chrome trace format for chrome://tracing or Perfetto.
+        
+        Args:
+            path: Output file
+        
+        Returns:
+            Number of spans written
+        """
+        spans = self.snapshot()
+        pid = os.getpid()
+        events = []
+        threads = {}
+        for span in spans:
+            threads[span.thread_id] = span.thread_name
+            events.append({
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.attrs,
+            })
+        for thread_id, thread_name in threads.items():
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                "args": {"name": thread_name},
+            })
+        
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+        return len(spans)
+    
+    def _stack(self) -> List[int]:
+        """Open span ids of the current thread."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+# Shared by every traced module
+tracer = Tracer()
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorate a function to record each call as a span.
+    
+    Apply it below @staticmethod or @classmethod.
+    
+    Args:
+        name: Span name (default: the function's qualified name)
+    """
+    def decorate(func: F) -> F:
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _ActiveSpan(tracer, span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate